@@ -2,7 +2,7 @@ from .basic import clean_basic
 from .duplicates import clean_duplicates
 from .missing import clean_missing
 from .outliers import clean_outliers
-from .types import clean_types
+from .types import clean_types, optimize_memory
 
 __all__ = [
     "clean_basic",
@@ -10,4 +10,5 @@ __all__ = [
     "clean_missing",
     "clean_outliers",
     "clean_types",
+    "optimize_memory",
 ]
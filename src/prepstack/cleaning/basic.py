@@ -1,6 +1,7 @@
 from typing import Optional
 import pandas as pd
-from prepstack.helpers import say, GuidanceMode
+from prepstack.helpers import say, GuidanceMode, working_copy
+from prepstack.cleaning.duplicates import duplicate_mask
 
 
 def clean_basic(
@@ -31,7 +32,7 @@ def clean_basic(
     guidance : {'on', 'off'}, default 'on'
         Controls printed explanations.
     """
-    df_clean = df.copy()
+    df_clean = working_copy(df)
 
     # 1) Strip whitespace in column names
     original_cols = list(df_clean.columns)
@@ -60,7 +61,7 @@ def clean_basic(
     removed_dupes = 0
     if drop_duplicates:
         before = len(df_clean)
-        df_clean = df_clean.drop_duplicates()
+        df_clean = df_clean.loc[~duplicate_mask(df_clean)]
         removed_dupes = before - len(df_clean)
         if removed_dupes > 0:
             say(f"📉 Removed {removed_dupes} duplicate row(s).", guidance)
@@ -1,10 +1,125 @@
 from typing import Optional, Sequence
+import numpy as np
 import pandas as pd
-from prepstack.helpers import say, GuidanceMode
+from prepstack.helpers import say, GuidanceMode, working_copy
 
-import pandas as pd
+# 16-byte key for the second half of 128-bit fingerprints
+_SECOND_HASH_KEY = "prepstack-128bit"
+
+
+# hash given to every missing value in canonical fingerprints
+_MISSING_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+_NUMERIC_OBJECT_KINDS = ("boolean", "integer", "floating", "mixed-integer-float", "decimal", "empty")
+
+
+def _hash(data, hash_key=None):
+    kwargs = {"hash_key": hash_key} if hash_key else {}
+    return pd.util.hash_pandas_object(data, index=False, **kwargs).to_numpy()
+
+
+def _canonical_hash(series, hash_key=None):
+    """
+    Hash of each value that does not depend on the dtype pandas happened to
+    infer: numbers (ints, floats, bools, numeric object columns) hash as
+    float64 with -0.0 folded into 0.0, and every missing value hashes alike.
+    """
+    kind = None
+    if series.dtype == object:
+        kind = pd.api.types.infer_dtype(series, skipna=True)
+
+    if (
+        pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype)
+    ) or kind in _NUMERIC_OBJECT_KINDS:
+        values = series.to_numpy(dtype="float64", na_value=np.nan) + 0.0  # -0.0 + 0.0 == 0.0
+        series = pd.Series(values, copy=False)
+
+    return np.where(series.isna().to_numpy(), _MISSING_HASH, _hash(series, hash_key))
+
+
+def _combine(column_hashes, n):
+    out = np.full(n, 0x345678, dtype=np.uint64)
+    for i, h in enumerate(column_hashes):
+        out = (out ^ h) * np.uint64(1000003 + 2 * i)
+    return out
+
+
+def row_fingerprints(
+    df: pd.DataFrame,
+    subset: Optional[Sequence[str]] = None,
+    bits: int = 64,
+    canonical: bool = False,
+) -> np.ndarray:
+    """
+    Vectorized row hashes.
+
+    bits=64  → uint64 array of shape (n,)
+    bits=128 → uint64 array of shape (n, 2), two independently keyed hashes
+
+    canonical=True hashes values independently of their dtype (see
+    _canonical_hash), so a row read as int in one chunk and as float or
+    object in another gets the same fingerprint, and 0.0 / -0.0 match.
+    """
+    data = df if subset is None else df[list(subset)]
+    if bits not in (64, 128):
+        raise ValueError("bits must be 64 or 128")
+
+    keys = [None] if bits == 64 else [None, _SECOND_HASH_KEY]
+    if canonical:
+        hashes = [
+            _combine([_canonical_hash(data.iloc[:, j], key) for j in range(data.shape[1])], len(data))
+            for key in keys
+        ]
+    else:
+        hashes = [_hash(data, key) for key in keys]
+    return hashes[0] if bits == 64 else np.column_stack(hashes)
+
+
+def duplicate_mask(
+    df: pd.DataFrame,
+    subset: Optional[Sequence[str]] = None,
+    keep="first",
+    *,
+    engine: str = "pandas",
+    bits: int = 64,
+    verify: bool = True,
+) -> np.ndarray:
+    """
+    Boolean numpy mask of duplicate rows (same meaning as DataFrame.duplicated).
+
+    engine="pandas": DataFrame.duplicated (default)
+    engine="hash"  : dedupe on 64/128-bit canonical row fingerprints. Only
+                     the fingerprints are put in a hash table, instead of
+                     factorizing every column of a wide object frame.
+                     Values pandas treats as equal (0.0 / -0.0, 1 / 1.0 in
+                     an object column, NaN) share a fingerprint.
 
-def clean_duplicates(df, subset=None, keep="first", guidance="on"):
+    verify=True re-checks the rows whose fingerprint is shared, so hash
+    collisions can never drop a distinct row. verify=False trusts the
+    fingerprints (collision odds ~n²/2^(bits+1)).
+    """
+    if engine == "pandas":
+        return df.duplicated(subset=subset, keep=keep).to_numpy()
+    if engine != "hash":
+        raise ValueError("engine must be 'hash' or 'pandas'")
+
+    if len(df) == 0:
+        return np.zeros(0, dtype=bool)
+
+    fp = pd.DataFrame(row_fingerprints(df, subset, bits, canonical=True))
+    mask = fp.duplicated(keep=keep).to_numpy()
+
+    if verify and mask.any():
+        # only rows sharing a fingerprint can be duplicates of each other
+        candidates = np.flatnonzero(fp.duplicated(keep=False).to_numpy())
+        exact = df.iloc[candidates].duplicated(subset=subset, keep=keep).to_numpy()
+        mask = np.zeros(len(df), dtype=bool)
+        mask[candidates] = exact
+
+    return mask
+
+
+def clean_duplicates(df, subset=None, keep="first", engine="pandas", guidance="on"):
     """
     Remove duplicate rows from a DataFrame.
 
@@ -15,6 +130,8 @@ def clean_duplicates(df, subset=None, keep="first", guidance="on"):
         Columns to consider for duplicate detection.
     keep : {"first", "last", False}
         Which duplicates to keep.
+    engine : {"pandas", "hash"}
+        Duplicate detection engine (see duplicate_mask).
     guidance : {"on", "off"}
         Print what is happening.
 
@@ -23,10 +140,9 @@ def clean_duplicates(df, subset=None, keep="first", guidance="on"):
     pandas.DataFrame
     """
 
-    df = df.copy()
     before = len(df)
 
-    df = df.drop_duplicates(subset=subset, keep=keep)
+    df = df.loc[~duplicate_mask(df, subset, keep, engine=engine)]
 
     after = len(df)
 
@@ -46,6 +162,7 @@ def drop_full_duplicates(
     *,
     subset: Optional[Sequence[str]] = None,
     keep: str = "first",
+    engine: str = "pandas",
     guidance: GuidanceMode = "on",
 ) -> pd.DataFrame:
     """
@@ -53,10 +170,10 @@ def drop_full_duplicates(
 
     subset: columns to consider duplicates on (None = all columns)
     keep: 'first', 'last', or False (like pandas)
+    engine: 'pandas' (default) or 'hash' (row fingerprints)
     """
-    df_clean = df.copy()
-    before = len(df_clean)
-    df_clean = df_clean.drop_duplicates(subset=subset, keep=keep)
+    before = len(df)
+    df_clean = df.loc[~duplicate_mask(df, subset, keep, engine=engine)]
     removed = before - len(df_clean)
 
     if removed > 0:
@@ -74,13 +191,15 @@ def mark_duplicates(
     df: pd.DataFrame,
     *,
     subset: Optional[Sequence[str]] = None,
+    engine: str = "pandas",
     guidance: GuidanceMode = "on",
 ) -> pd.DataFrame:
     """
     Add a boolean '_is_duplicate' column that marks duplicates.
     """
-    df_marked = df.copy()
-    df_marked["_is_duplicate"] = df_marked.duplicated(subset=subset, keep="first")
+    mask = duplicate_mask(df, subset, "first", engine=engine)
+    df_marked = working_copy(df)
+    df_marked["_is_duplicate"] = mask
     n_dupes = df_marked["_is_duplicate"].sum()
 
     if subset is None:
@@ -96,15 +215,209 @@ def deduplicate(
     *,
     subset: Optional[Sequence[str]] = None,
     keep: str = "first",
+    engine: str = "pandas",
     guidance: GuidanceMode = "on",
 ) -> pd.DataFrame:
     """
     Convenience wrapper:
     - marks duplicates
     - drops them
+
+    Duplicates are detected once; the same mask is used for marking and
+    dropping. The returned frame keeps the '_is_duplicate' column.
     """
     say("🧬 Starting deduplication (mark + drop).", guidance)
-    df_marked = mark_duplicates(df, subset=subset, guidance=guidance)
-    df_clean = drop_full_duplicates(df_marked, subset=subset, keep=keep, guidance=guidance)
+    mask = duplicate_mask(df, subset, keep, engine=engine)
+
+    if subset is None:
+        say(f"🔎 Marked {int(mask.sum())} duplicate row(s) (full row comparison).", guidance)
+    else:
+        say(f"🔎 Marked {int(mask.sum())} duplicate row(s) based on columns {list(subset)}.", guidance)
+
+    df_clean = df.loc[~mask]
+    df_clean = df_clean.assign(_is_duplicate=False)
+
+    removed = int(mask.sum())
+    if removed > 0:
+        say(f"📉 Removed {removed} duplicate row(s).", guidance)
+    else:
+        say("ℹ️ No duplicate rows found to drop.", guidance)
+
     say("✨ Deduplication complete.", guidance)
     return df_clean
+
+
+# -------------------------
+# Near-duplicate detection (MinHash + LSH)
+# -------------------------
+# largest prime below 2^32: a*x + b stays inside uint64 for 32-bit a and x
+_PRIME_32 = np.uint64(4294967291)
+
+
+def _normalize_rows(df, columns):
+    """Lowercase, trim and collapse whitespace, then join the columns per row."""
+    parts = []
+    for col in columns:
+        s = df[col].astype("string").fillna("").str.lower().str.strip()
+        parts.append(s.str.replace(r"\s+", " ", regex=True))
+    text = parts[0]
+    for s in parts[1:]:
+        text = text + "\x1f" + s
+    return text.tolist()
+
+
+def _shingles(texts, k):
+    """Flatten character k-gram shingles of every text, with row offsets."""
+    flat, counts = [], []
+    for t in texts:
+        if not t.strip("\x1f"):
+            counts.append(0)
+            continue
+        grams = [t] if len(t) <= k else [t[i:i + k] for i in range(len(t) - k + 1)]
+        flat.extend(grams)
+        counts.append(len(grams))
+    return flat, np.asarray(counts, dtype=np.intp)
+
+
+def _minhash_signatures(texts, k, num_perm, seed, block_size=2_000_000):
+    """
+    MinHash signature matrix (rows x num_perm) using universal hashing
+    (a*x + b) mod p over 32-bit shingle hashes, p the largest 32-bit prime.
+    Rows with no shingles get an all-max signature and are flagged empty.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(_PRIME_32), num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(_PRIME_32), num_perm, dtype=np.uint64)
+
+    n = len(texts)
+    sig = np.full((n, num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+    empty = np.zeros(n, dtype=bool)
+
+    # work on row batches so the shingle x permutation matrix stays bounded
+    rows_per_batch = max(1, block_size // max(1, num_perm * 16))
+    for start in range(0, n, rows_per_batch):
+        flat, counts = _shingles(texts[start:start + rows_per_batch], k)
+        empty[start:start + len(counts)] = counts == 0
+        if not flat:
+            continue
+
+        x = pd.util.hash_array(np.asarray(flat, dtype=object)) % _PRIME_32
+        hashed = (x[:, None] * a[None, :] + b[None, :]) % _PRIME_32
+
+        rows = np.flatnonzero(counts) + start
+        offsets = np.concatenate([[0], np.cumsum(counts[counts > 0])[:-1]])
+        sig[rows] = np.minimum.reduceat(hashed, offsets, axis=0)
+
+    return sig, empty
+
+
+def _lsh_bands(num_perm, threshold):
+    """Pick (bands, rows_per_band) whose S-curve threshold (1/b)^(1/r) is closest."""
+    best = None
+    for r in range(1, num_perm + 1):
+        if num_perm % r:
+            continue
+        bands = num_perm // r
+        t = (1 / bands) ** (1 / r)
+        if best is None or abs(t - threshold) < abs(best[2] - threshold):
+            best = (bands, r, t)
+    return best[0], best[1]
+
+
+def _connected_labels(n, left, right):
+    """Connected components over candidate edges; label = smallest row position."""
+    labels = np.arange(n)
+    while True:
+        m = np.minimum(labels[left], labels[right])
+        before = labels.copy()
+        np.minimum.at(labels, left, m)
+        np.minimum.at(labels, right, m)
+        labels = labels[labels]
+        if np.array_equal(labels, before):
+            return labels
+
+
+def find_near_duplicates(
+    df: pd.DataFrame,
+    columns: Optional[Sequence[str]] = None,
+    threshold: float = 0.8,
+    *,
+    shingle_size: int = 3,
+    num_perm: int = 128,
+    seed: int = 0,
+    guidance: GuidanceMode = "on",
+) -> pd.DataFrame:
+    """
+    Find near-duplicate rows (differences in whitespace, case or small typos).
+
+    1. Each row's `columns` are normalized (lowercase, trimmed, collapsed
+       whitespace) and joined into one text.
+    2. Texts are split into character shingles of length `shingle_size`
+       and summarized as MinHash signatures of length `num_perm`.
+    3. LSH banding buckets signatures so only likely matches are compared
+       (near-linear instead of all pairs). Bands are chosen so the LSH
+       threshold is close to `threshold`.
+    4. Rows sharing a bucket are linked to the bucket's first row and to
+       their neighbour in the bucket; these candidate pairs are scored by
+       estimated Jaccard similarity and pairs with score >= threshold are
+       grouped into clusters.
+
+    Returns a copy of df with:
+    - '_dup_cluster': cluster id (row position of the cluster's first row)
+    - '_is_duplicate': True for every row except the first of its cluster,
+      the same marker mark_duplicates adds
+    """
+    columns = list(columns) if columns is not None else df.columns.tolist()
+    n = len(df)
+    df_marked = working_copy(df)
+
+    say(f"🧬 Near-duplicate search on {columns} (threshold={threshold})", guidance)
+
+    if n == 0:
+        df_marked["_dup_cluster"] = np.zeros(0, dtype=np.int64)
+        df_marked["_is_duplicate"] = np.zeros(0, dtype=bool)
+        return df_marked
+
+    sig, empty = _minhash_signatures(_normalize_rows(df, columns), shingle_size, num_perm, seed)
+    bands, r = _lsh_bands(num_perm, threshold)
+    say(f"  • LSH with {bands} band(s) x {r} row(s)", guidance)
+
+    candidates = np.flatnonzero(~empty)
+    left_parts, right_parts = [], []
+    for band in range(bands):
+        keys = pd.util.hash_pandas_object(
+            pd.DataFrame(sig[candidates, band * r:(band + 1) * r]), index=False
+        ).to_numpy()
+        order = np.argsort(keys, kind="stable")
+        members = candidates[order]
+        sorted_keys = keys[order]
+
+        # every bucket member is linked to the bucket's first row and to its
+        # predecessor, which keeps pair generation linear in bucket size
+        new_bucket = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+        first = np.flatnonzero(new_bucket)[np.cumsum(new_bucket) - 1]
+        pos = np.flatnonzero(~new_bucket)
+
+        left_parts += [members[first[pos]], members[pos - 1]]
+        right_parts += [members[pos], members[pos]]
+
+    if left_parts:
+        pairs = np.unique(np.column_stack([np.concatenate(left_parts), np.concatenate(right_parts)]), axis=0)
+        left, right = np.minimum(pairs[:, 0], pairs[:, 1]), np.maximum(pairs[:, 0], pairs[:, 1])
+        score = (sig[left] == sig[right]).mean(axis=1)
+        keep = score >= threshold
+        left, right = left[keep], right[keep]
+    else:
+        left = right = np.zeros(0, dtype=np.intp)
+
+    say(f"  • {len(left)} similar pair(s) above threshold", guidance)
+
+    labels = _connected_labels(n, left, right)
+    df_marked["_dup_cluster"] = labels
+    df_marked["_is_duplicate"] = labels != np.arange(n)
+
+    n_dupes = int(df_marked["_is_duplicate"].sum())
+    n_clusters = int(len(np.unique(labels[df_marked["_is_duplicate"].to_numpy()])))
+    say(f"🔎 Marked {n_dupes} near-duplicate row(s) in {n_clusters} cluster(s).", guidance)
+
+    return df_marked
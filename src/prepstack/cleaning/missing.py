@@ -1,17 +1,58 @@
 from typing import Literal, Optional, Sequence
 import pandas as pd
 import numpy as np
-from prepstack.helpers import say, GuidanceMode
+from prepstack.helpers import say, GuidanceMode, working_copy, is_categorical, category_mode, fill_categorical
+from prepstack.sketch import series_quantiles
+from prepstack.parallel import map_columns
 
 NumericStrategy = Literal["mean", "median", "zero"]
 CatStrategy = Literal["mode", "constant"]
 
 
+def _numeric_fill(series, strategy, quantile_method):
+    """(missing count, fill value) for one numeric column."""
+    missing = int(series.isna().sum())
+    if missing == 0:
+        return missing, None
+
+    if strategy == "mean":
+        value = series.mean()
+    elif strategy == "median":
+        value = series_quantiles(series, [0.5], quantile_method)[0]
+    elif strategy == "zero":
+        value = 0
+    else:
+        raise ValueError(f"Unknown strategy '{strategy}' for numeric columns.")
+    return missing, value
+
+
+def _categorical_fill(series, strategy, fill_value):
+    """(missing count, fill value) for one categorical column."""
+    missing = int(series.isna().sum())
+    if missing == 0:
+        return missing, None
+
+    if strategy == "mode" and is_categorical(series):
+        value = category_mode(series)
+        value = fill_value if value is None else value
+    elif strategy == "mode":
+        mode_val = series.mode(dropna=True)
+        value = mode_val.iloc[0] if not mode_val.empty else fill_value
+    elif strategy == "constant":
+        value = fill_value
+    else:
+        raise ValueError(f"Unknown strategy '{strategy}' for categorical columns.")
+    return missing, value
+
+
 def fill_missing_numeric(
     df: pd.DataFrame,
     *,
     strategy: NumericStrategy = "median",
     columns: Optional[Sequence[str]] = None,
+    quantile_method: str = "exact",
+    n_jobs: int = 1,
+    backend: str = "threads",
     guidance: GuidanceMode = "on",
 ) -> pd.DataFrame:
     """
@@ -19,8 +60,12 @@ def fill_missing_numeric(
 
     strategy: 'mean', 'median', or 'zero'
     columns: list of columns to process, or None = all numeric columns
+    quantile_method: how the median is computed, 'exact' or 'sketch'
+                     (KLL sketch, see prepstack.sketch.KLLSketch)
+    n_jobs / backend: compute the fill values on several workers,
+                      'threads' or 'processes' (see prepstack.parallel.map_columns)
     """
-    df_filled = df.copy()
+    df_filled = working_copy(df)
     num_cols = columns if columns is not None else df_filled.select_dtypes(include="number").columns.tolist()
 
     if not num_cols:
@@ -29,20 +74,16 @@ def fill_missing_numeric(
 
     say(f"🔧 Numeric missing-value strategy = '{strategy}' on columns: {list(num_cols)}", guidance)
 
+    fills = map_columns(
+        _numeric_fill, df_filled, num_cols, n_jobs=n_jobs, backend=backend,
+        strategy=strategy, quantile_method=quantile_method,
+    )
+
     for col in num_cols:
-        missing_before = df_filled[col].isna().sum()
+        missing_before, value = fills[col]
         if missing_before == 0:
             continue
 
-        if strategy == "mean":
-            value = df_filled[col].mean()
-        elif strategy == "median":
-            value = df_filled[col].median()
-        elif strategy == "zero":
-            value = 0
-        else:
-            raise ValueError(f"Unknown strategy '{strategy}' for numeric columns.")
-
         df_filled[col] = df_filled[col].fillna(value)
         say(f"  • Filled {missing_before} missing value(s) in '{col}' with {strategy}={value:.4f}", guidance)
 
@@ -56,6 +97,8 @@ def fill_missing_categorical(
     strategy: CatStrategy = "mode",
     fill_value: Optional[str] = "Unknown",
     columns: Optional[Sequence[str]] = None,
+    n_jobs: int = 1,
+    backend: str = "threads",
     guidance: GuidanceMode = "on",
 ) -> pd.DataFrame:
     """
@@ -63,8 +106,10 @@ def fill_missing_categorical(
 
     strategy: 'mode' → fill with most frequent value
               'constant' → fill with fill_value (default: 'Unknown')
+    n_jobs / backend: compute the fill values on several workers,
+                      'threads' or 'processes' (see prepstack.parallel.map_columns)
     """
-    df_filled = df.copy()
+    df_filled = working_copy(df)
     cat_cols = columns if columns is not None else df_filled.select_dtypes(include=["object", "category"]).columns.tolist()
 
     if not cat_cols:
@@ -73,20 +118,18 @@ def fill_missing_categorical(
 
     say(f"🔧 Categorical missing-value strategy = '{strategy}' on columns: {list(cat_cols)}", guidance)
 
+    fills = map_columns(
+        _categorical_fill, df_filled, cat_cols, n_jobs=n_jobs, backend=backend,
+        strategy=strategy, fill_value=fill_value,
+    )
+
     for col in cat_cols:
-        missing_before = df_filled[col].isna().sum()
+        missing_before, value = fills[col]
         if missing_before == 0:
             continue
 
-        if strategy == "mode":
-            mode_val = df_filled[col].mode(dropna=True)
-            value = mode_val.iloc[0] if not mode_val.empty else fill_value
-        elif strategy == "constant":
-            value = fill_value
-        else:
-            raise ValueError(f"Unknown strategy '{strategy}' for categorical columns.")
-
-        df_filled[col] = df_filled[col].fillna(value)
+        series = df_filled[col]
+        df_filled[col] = fill_categorical(series, value) if is_categorical(series) else series.fillna(value)
         say(f"  • Filled {missing_before} missing value(s) in '{col}' with '{value}'", guidance)
 
     say("✅ Categorical missing-value imputation complete.", guidance)
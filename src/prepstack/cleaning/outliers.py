@@ -1,7 +1,82 @@
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence
 import pandas as pd
 import numpy as np
-from prepstack.helpers import say, GuidanceMode
+from prepstack.helpers import say, GuidanceMode, working_copy
+from prepstack.sketch import series_quantiles
+from prepstack.parallel import map_columns
+
+
+def _nan_quartiles(block):
+    """
+    Q1 and Q3 of every row of a (columns x rows) block, ignoring NaN.
+    Uses one row-wise sort and the same linear interpolation as pandas.
+    """
+    ordered = np.sort(block, axis=1)  # NaN sorts to the end
+    n_valid = (~np.isnan(block)).sum(axis=1)
+    rows = np.arange(block.shape[0])
+
+    out = []
+    for q in (0.25, 0.75):
+        pos = q * np.maximum(n_valid - 1, 0)
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.ceil(pos).astype(np.intp)
+        v_lo, v_hi = ordered[rows, lo], ordered[rows, hi]
+        value = v_lo + (pos - lo) * (v_hi - v_lo)
+        out.append(np.where(n_valid > 0, value, np.nan))
+    return out
+
+
+def _column_quartiles(series):
+    q1, q3 = _nan_quartiles(series.to_numpy(dtype="float64", na_value=np.nan)[None, :])
+    return q1[0], q3[0]
+
+
+def _iqr_block(df, columns, factor, quantile_method, n_jobs=1, backend="threads"):
+    """
+    Quartiles for all columns at once.
+    Returns the float64 value block (columns x rows, one contiguous row per
+    column) and per-column bounds. With n_jobs > 1 the exact quartile sorts
+    are spread over workers column by column.
+    """
+    block = np.vstack([df[col].to_numpy(dtype="float64", na_value=np.nan) for col in columns])
+
+    if quantile_method == "exact" and n_jobs != 1:
+        quartiles = map_columns(_column_quartiles, df, columns, n_jobs=n_jobs, backend=backend)
+        q1, q3 = np.array([quartiles[col] for col in columns], dtype="float64").reshape(-1, 2).T
+    elif quantile_method == "exact":
+        q1, q3 = _nan_quartiles(block)
+    else:
+        quartiles = [series_quantiles(df[col], [0.25, 0.75], quantile_method) for col in columns]
+        q1, q3 = np.array(quartiles, dtype="float64").reshape(-1, 2).T
+
+    iqr = q3 - q1
+    return block, q1 - factor * iqr, q3 + factor * iqr, iqr
+
+
+def _capped_column(values, original):
+    """
+    Capped float64 values in the column's original dtype when that keeps
+    them exact: float dtypes (incl. nullable Float64) always, integer dtypes
+    when every capped value is whole; otherwise float (Float64 for nullable
+    integers, so missing values stay NA).
+    """
+    dtype = original.dtype
+    if pd.api.types.is_float_dtype(dtype):
+        return pd.Series(values, index=original.index, name=original.name).astype(dtype)
+    if pd.api.types.is_integer_dtype(dtype):
+        present = values[~np.isnan(values)]
+        if np.array_equal(present, np.round(present)):
+            return pd.Series(values, index=original.index, name=original.name).astype(dtype)
+        if not isinstance(dtype, np.dtype):
+            return pd.Series(values, index=original.index, name=original.name).astype("Float64")
+    return values
+
+
+def _outlier_report(columns, lower, upper, counts):
+    return {
+        col: {"lower": float(lo), "upper": float(up), "outliers": int(n)}
+        for col, lo, up, n in zip(columns, lower, upper, counts)
+    }
 
 
 def cap_outliers_iqr(
@@ -9,6 +84,10 @@ def cap_outliers_iqr(
     *,
     columns: Optional[Sequence[str]] = None,
     factor: float = 1.5,
+    quantile_method: str = "exact",
+    return_report: bool = False,
+    n_jobs: int = 1,
+    backend: str = "threads",
     guidance: GuidanceMode = "on",
 ) -> pd.DataFrame:
     """
@@ -19,44 +98,47 @@ def cap_outliers_iqr(
         upper = Q3 + factor * IQR
         values below lower are set to lower
         values above upper are set to upper
+
+    quantile_method: 'exact' (pandas quantile) or 'sketch' (KLL sketch,
+    one pass and bounded memory, see prepstack.sketch.KLLSketch)
+    return_report: if True, return (df, report) where report maps each
+    column to its bounds and number of capped values
+    n_jobs / backend: spread the quartile sorts over workers
+    (see prepstack.parallel.map_columns)
+
+    Quartiles for all columns come from one sort over the numeric block,
+    and capping is a single np.clip on that block.
     """
-    df_cap = df.copy()
+    df_cap = working_copy(df)
     num_cols = columns if columns is not None else df_cap.select_dtypes(include="number").columns.tolist()
 
     if not num_cols:
         say("ℹ️ No numeric columns found for outlier capping.", guidance)
-        return df_cap
+        return (df_cap, {}) if return_report else df_cap
 
     say(f"📉 Capping outliers using IQR factor={factor} for columns: {list(num_cols)}", guidance)
 
-    for col in num_cols:
-        series = df_cap[col]
-        if series.nunique(dropna=True) <= 1:
-            continue
-
-        q1 = series.quantile(0.25)
-        q3 = series.quantile(0.75)
-        iqr = q3 - q1
-
-        if iqr == 0:
-            continue
+    block, lower, upper, iqr = _iqr_block(df_cap, num_cols, factor, quantile_method, n_jobs, backend)
 
-        lower = q1 - factor * iqr
-        upper = q3 + factor * iqr
+    # constant (or empty) columns have no spread and are left untouched
+    active = iqr > 0
+    lower = np.where(active, lower, -np.inf)[:, None]
+    upper = np.where(active, upper, np.inf)[:, None]
 
-        before = series.copy()
-        df_cap[col] = series.clip(lower, upper)
-        changed = (before != df_cap[col]).sum()
+    capped = np.clip(block, lower, upper)
+    changed = ((block < lower) | (block > upper)).sum(axis=1)
+    lower, upper = lower.ravel(), upper.ravel()
 
-        if changed > 0:
-            say(f"  • Column '{col}': capped {changed} value(s) outside [{lower:.3f}, {upper:.3f}].", guidance)
+    for j, col in enumerate(num_cols):
+        if changed[j] > 0:
+            df_cap[col] = _capped_column(capped[j], df_cap[col])
+            say(f"  • Column '{col}': capped {changed[j]} value(s) outside [{lower[j]:.3f}, {upper[j]:.3f}].", guidance)
 
     say("✅ Outlier capping complete.", guidance)
-    return df_cap
-import pandas as pd
-from typing import List, Optional
 
-from prepstack.helpers import say, GuidanceMode
+    if return_report:
+        return df_cap, _outlier_report(num_cols, lower, upper, changed)
+    return df_cap
 
 
 def clean_outliers(
@@ -66,6 +148,10 @@ def clean_outliers(
     method: str = "iqr",
     factor: float = 1.5,
     action: str = "remove",  # "remove" | "cap"
+    quantile_method: str = "exact",  # "exact" | "sketch"
+    return_report: bool = False,
+    n_jobs: int = 1,
+    backend: str = "threads",  # "threads" | "processes"
     guidance: GuidanceMode = "on",
 ) -> pd.DataFrame:
     """
@@ -86,16 +172,28 @@ def clean_outliers(
         How to handle outliers:
         - "remove": drop rows
         - "cap": cap values at bounds
+    quantile_method : str
+        How quartiles are computed:
+        - "exact": pandas quantile
+        - "sketch": KLL quantile sketch (see prepstack.sketch.KLLSketch)
+    return_report : bool
+        If True, also return a per-column report of bounds and outlier counts.
+    n_jobs : int
+        Workers for the quartile computation (1 = serial, -1 = all cores).
+    backend : str
+        "threads" or "processes", see prepstack.parallel.map_columns.
     guidance : "on" | "off"
         Print explanations and warnings.
 
     Returns
     -------
     pd.DataFrame
-        Cleaned dataframe.
-    """
+        Cleaned dataframe, or (dataframe, report) when return_report=True.
 
-    df = df.copy()
+    All selected columns are processed as one 2D block: one sort for the
+    quartiles, one np.clip for capping and one any() reduction for the
+    removal mask.
+    """
 
     if columns is None:
         columns = df.select_dtypes(include="number").columns.tolist()
@@ -109,46 +207,45 @@ def clean_outliers(
     if method != "iqr":
         raise ValueError("Currently only 'iqr' method is supported.")
 
-    mask = pd.Series(False, index=df.index)
-
-    for col in columns:
-        if col not in df.columns:
-            continue
+    if action not in ("remove", "cap"):
+        raise ValueError("action must be 'remove' or 'cap'")
 
-        q1 = df[col].quantile(0.25)
-        q3 = df[col].quantile(0.75)
-        iqr = q3 - q1
+    columns = [col for col in columns if col in df.columns]
+    if not columns:
+        return (df, {}) if return_report else df
 
-        lower = q1 - factor * iqr
-        upper = q3 + factor * iqr
+    block, lower, upper, _ = _iqr_block(df, columns, factor, quantile_method, n_jobs, backend)
 
-        outliers = (df[col] < lower) | (df[col] > upper)
+    outside = (block < lower[:, None]) | (block > upper[:, None])
+    counts = outside.sum(axis=1)
 
-        if guidance == "on":
+    if guidance == "on":
+        for j, col in enumerate(columns):
             say(
-                f" → {col}: {outliers.sum()} outliers "
-                f"(bounds: {lower:.2f}, {upper:.2f})"
+                f" → {col}: {counts[j]} outliers "
+                f"(bounds: {lower[j]:.2f}, {upper[j]:.2f})"
             )
 
-        if action == "remove":
-            mask |= outliers
-
-        elif action == "cap":
-            df.loc[df[col] < lower, col] = lower
-            df.loc[df[col] > upper, col] = upper
-
-        else:
-            raise ValueError("action must be 'remove' or 'cap'")
-
     if action == "remove":
         before = len(df)
-        df = df.loc[~mask]
+        df = df.loc[~outside.any(axis=0)]
         after = len(df)
 
         if guidance == "on":
             say(f" 🗑️ Removed {before - after} rows containing outliers")
 
+    else:
+        # removal already returns a new frame; only capping writes into one
+        df = working_copy(df)
+        capped = np.clip(block, lower[:, None], upper[:, None])
+        for j, col in enumerate(columns):
+            # only columns that actually change are replaced
+            if counts[j] > 0:
+                df[col] = _capped_column(capped[j], df[col])
+
     if guidance == "on":
         say("✨ Outlier cleaning complete.")
 
+    if return_report:
+        return df, _outlier_report(columns, lower, upper, counts)
     return df
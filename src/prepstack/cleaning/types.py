@@ -1,18 +1,139 @@
-def clean_types(df, schema=None, guidance="on"):
+import numpy as np
+import pandas as pd
+
+from prepstack.helpers import working_copy
+
+_INT_TYPES = {
+    "i": (np.int8, np.int16, np.int32, np.int64),
+    "u": (np.uint8, np.uint16, np.uint32, np.uint64),
+}
+
+
+def _smallest_int(values, kind):
+    if values.size == 0:
+        return None
+    lo, hi = values.min(), values.max()
+    for dtype in _INT_TYPES[kind]:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dtype)
+    return None
+
+
+def _optimized_dtype(series, category_threshold, string_dtype):
+    """Smallest safe dtype for a column, or None to leave it as it is."""
+    dtype = series.dtype
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        target = _smallest_int(series.to_numpy(), dtype.kind)
+        return target if target is not None and target.itemsize < dtype.itemsize else None
+
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        if dtype.itemsize <= 4:
+            return None
+        values = series.to_numpy()
+        # only when every value survives the round trip through float32
+        with np.errstate(over="ignore"):
+            narrowed = values.astype(np.float32)
+        if np.array_equal(narrowed.astype(dtype), values, equal_nan=True):
+            return np.dtype(np.float32)
+        return None
+
+    is_text = isinstance(dtype, pd.StringDtype) or (
+        dtype == object and pd.api.types.infer_dtype(series, skipna=True) == "string"
+    )
+    if not is_text:
+        return None
+
+    count = series.count()
+    if count and series.nunique(dropna=True) / count <= category_threshold:
+        return "category"
+    if dtype == object:
+        return string_dtype
+    return None
+
+
+def optimize_memory(df, *, category_threshold=0.5, string_dtype=None, guidance="on"):
+    """
+    Shrink a dataframe to the smallest safe dtypes.
+
+    - integers are downcast to the narrowest width that holds their min/max
+      (signed stays signed, unsigned stays unsigned)
+    - float64 becomes float32 only when every value round-trips exactly
+    - text columns whose distinct/non-null ratio is <= category_threshold
+      become 'category'
+    - remaining object text columns become a nullable string dtype
+      ('string[pyarrow]' when pyarrow is installed, else 'string')
+
+    Returns (df, report) where report holds before_MB, after_MB, the
+    reduction factor and the per-column dtype changes.
+    """
+    if string_dtype is None:
+        try:
+            import pyarrow  # noqa: F401
+            string_dtype = "string[pyarrow]"
+        except ImportError:
+            string_dtype = "string"
+
+    df = working_copy(df)
+    before = df.memory_usage(deep=True)
+
+    if guidance == "on":
+        print("🗜️ MEMORY OPTIMIZATION STARTED")
+
+    changes = {}
+    for col in df.columns:
+        target = _optimized_dtype(df[col], category_threshold, string_dtype)
+        if target is None:
+            continue
+
+        old = df[col].dtype
+        df[col] = df[col].astype(target)
+        changes[col] = {"from": str(old), "to": str(df[col].dtype)}
+
+        if guidance == "on":
+            print(f" ✔ '{col}': {old} → {df[col].dtype}")
+
+    after = df.memory_usage(deep=True)
+    for col, change in changes.items():
+        change["before_bytes"] = int(before[col])
+        change["after_bytes"] = int(after[col])
+
+    total_before, total_after = int(before.sum()), int(after.sum())
+    report = {
+        "before_MB": round(total_before / 1_000_000, 3),
+        "after_MB": round(total_after / 1_000_000, 3),
+        "reduction": round(total_before / total_after, 2) if total_after else 1.0,
+        "columns": changes,
+    }
+
+    if guidance == "on":
+        print(f" • Memory: {report['before_MB']} MB → {report['after_MB']} MB ({report['reduction']}x smaller)")
+        print("✨ Memory optimization complete.")
+
+    return df, report
+
+
+def clean_types(df, schema=None, return_report=False, guidance="on"):
     """
     Standardize column data types.
 
     Parameters
     ----------
     df : pandas.DataFrame
-    schema : dict, optional
+    schema : dict | "auto", optional
         Example: {"age": "int64", "price": "float64", "date": "datetime64[ns]"}
+        "auto" picks the smallest safe dtype per column (see optimize_memory)
+    return_report : bool
+        With schema="auto", return (df, report) with the before/after memory report
     guidance : "on" | "off"
     """
 
-    import pandas as pd
+    if isinstance(schema, str) and schema == "auto":
+        df, report = optimize_memory(df, guidance=guidance)
+        return (df, report) if return_report else df
 
-    df = df.copy()
+    df = working_copy(df)
 
     if schema is None:
         if guidance == "on":
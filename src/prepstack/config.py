@@ -0,0 +1,28 @@
+"""
+Package-wide execution settings.
+
+copy_policy controls how cleaning and transform steps treat the DataFrame
+they receive:
+
+- "copy"    : (default) every step works on a full deep copy of its input
+- "cow"     : every step takes a shallow copy and relies on pandas
+              copy-on-write, so only the columns a step touches are duplicated
+- "inplace" : every step writes straight into the DataFrame it receives
+
+"cow" needs pandas copy-on-write. It is always on from pandas 3.0; on
+pandas 2.x it is a process-wide pandas option that prepstack only turns on
+when pandas_copy_on_write is True. Otherwise (and on pandas < 2) "cow"
+falls back to full copies with a warning.
+
+Example:
+    import prepstack.config
+    prepstack.config.copy_policy = "cow"
+    prepstack.config.pandas_copy_on_write = True  # pandas 2.x only
+"""
+
+COPY_POLICIES = ("copy", "cow", "inplace")
+
+copy_policy = "copy"
+
+# let "cow" switch on pandas' global mode.copy_on_write option (pandas 2.x)
+pandas_copy_on_write = False
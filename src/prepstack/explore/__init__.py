@@ -3,3 +3,4 @@ from .missing import missing_report, missing_insights
 from .distributions import distribution_report, distribution_insights
 from .correlations import correlation_report, correlation_insights
 from .profiling import auto_profile
+from .column_stats import profile_columns
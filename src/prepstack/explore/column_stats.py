@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+
+def _numeric_stats(series):
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    valid = np.sort(values[~np.isnan(values)])
+    n = valid.size
+
+    stats = {"count": n, "unique": 0, "mean": np.nan, "std": np.nan, "skew": np.nan,
+             "min": np.nan, "25%": np.nan, "50%": np.nan, "75%": np.nan, "max": np.nan}
+    if n == 0:
+        return stats
+
+    mean = valid.mean()
+    dev = valid - mean
+    dev2 = dev * dev
+    m2 = dev2.mean()
+    m3 = np.dot(dev2, dev) / n
+
+    # valid is already sorted, so quartiles are direct lookups (linear interpolation)
+    pos = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    q1, q2, q3 = valid[lo] + (pos - lo) * (valid[hi] - valid[lo])
+
+    stats.update({
+        "unique": int(np.count_nonzero(np.diff(valid)) + 1),
+        "mean": mean,
+        "std": np.sqrt(m2 * n / (n - 1)) if n > 1 else np.nan,
+        "min": valid[0],
+        "25%": q1,
+        "50%": q2,
+        "75%": q3,
+        "max": valid[-1],
+    })
+
+    # adjusted Fisher-Pearson skewness, as in pandas Series.skew
+    if n > 2:
+        stats["skew"] = 0.0 if m2 == 0 else np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+    return stats
+
+
+def _value_stats(series, top_k):
+    counts = series.value_counts(dropna=True)
+    return {
+        "count": int(counts.sum()),
+        "unique": len(counts),
+        "top": counts.index[0] if len(counts) else np.nan,
+        "freq": int(counts.iloc[0]) if len(counts) else np.nan,
+        "top_k": list(counts.head(top_k).items()),
+    }
+
+
+def profile_columns(df, top_k=5):
+    """
+    Scan every column once and collect the statistics the explore
+    functions need: null counts, memory, min/max, moments, quartiles,
+    distinct count and top-k values.
+
+    Pass the result as `profile=` to dataset_overview, overview_insights,
+    missing_report, distribution_report, distribution_insights and
+    correlation_report so none of them rescans the data. auto_profile does
+    this automatically.
+    """
+    numeric_cols = df.select_dtypes(include="number").columns.tolist()
+    object_cols = df.select_dtypes(include="object").columns.tolist()
+    numeric_set = set(numeric_cols)
+    memory = df.memory_usage(deep=True)
+
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+
+        if col in numeric_set:
+            stats = _numeric_stats(series)
+        else:
+            stats = _value_stats(series, top_k)
+
+        # nulls fall out of the non-null count, no separate isna() pass
+        stats.update({"dtype": series.dtype, "nulls": len(series) - stats["count"], "memory": int(memory[col])})
+        columns[col] = stats
+
+    return {
+        "rows": len(df),
+        "index_memory": int(memory["Index"]) if "Index" in memory.index else 0,
+        "numeric": numeric_cols,
+        "object": object_cols,
+        "columns": columns,
+    }
+
+
+def profile_frame(profile, columns, fields):
+    """Per-column statistics table (columns x fields) from a profile."""
+    return pd.DataFrame(
+        [[profile["columns"][c].get(f, np.nan) for f in fields] for c in columns],
+        index=pd.Index(columns),
+        columns=fields,
+    )
@@ -1,5 +1,5 @@
-def correlation_report(df, guidance="off"):
-    numeric = df.select_dtypes(include="number")
+def correlation_report(df, guidance="off", profile=None):
+    numeric = df[profile["numeric"]] if profile else df.select_dtypes(include="number")
 
     if numeric.shape[1] < 2:
         if guidance == "on":
@@ -1,6 +1,13 @@
-def distribution_report(df, guidance="off"):
-    numeric = df.select_dtypes(include="number").describe().T
-    categorical = df.select_dtypes(include="object").describe().T
+from .column_stats import profile_columns, profile_frame
+
+_NUMERIC_FIELDS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+_CATEGORICAL_FIELDS = ["count", "unique", "top", "freq"]
+
+
+def distribution_report(df, guidance="off", profile=None):
+    profile = profile or profile_columns(df)
+    numeric = profile_frame(profile, profile["numeric"], _NUMERIC_FIELDS).astype("float64")
+    categorical = profile_frame(profile, profile["object"], _CATEGORICAL_FIELDS).astype("object")
 
     if guidance == "on":
         print("\n📈 DISTRIBUTION REPORT")
@@ -12,14 +19,14 @@ def distribution_report(df, guidance="off"):
     return {"numeric": numeric, "categorical": categorical}
 
 
-def distribution_insights(df):
+def distribution_insights(df, profile=None):
+    profile = profile or profile_columns(df)
     insights = []
-    num_cols = df.select_dtypes(include="number")
 
-    if num_cols.empty:
+    if not profile["numeric"]:
         return ["No numeric columns detected — skipping distribution insights."]
 
-    skewed = num_cols.skew().abs()
+    skewed = profile_frame(profile, profile["numeric"], ["skew"])["skew"].abs()
     strong_skew = skewed[skewed > 1]
 
     if len(strong_skew):
@@ -27,7 +34,7 @@ def distribution_insights(df):
             f"Highly skewed numeric columns detected: {list(strong_skew.index)} — consider transformation."
         )
 
-    unique_counts = df.nunique()
+    unique_counts = profile_frame(profile, list(profile["columns"]), ["unique"])["unique"]
 
     high_card = unique_counts[unique_counts > 50]
     if len(high_card):
@@ -1,13 +1,18 @@
 import pandas as pd
 
-def missing_report(df, guidance="off"):
-    missing = df.isnull().sum()
-    missing_percent = (missing / len(df)) * 100
+from .column_stats import profile_columns, profile_frame
+
+
+def missing_report(df, guidance="off", profile=None):
+    profile = profile or profile_columns(df)
+    table = profile_frame(profile, list(profile["columns"]), ["nulls", "dtype"])
+    missing = table["nulls"].astype("int64")
+    missing_percent = (missing / profile["rows"]) * 100
 
     report = pd.DataFrame({
         "missing_count": missing,
         "missing_percent": missing_percent,
-        "dtype": df.dtypes
+        "dtype": table["dtype"]
     })
 
     report = report[report["missing_count"] > 0]
@@ -1,13 +1,19 @@
 import pandas as pd
 
-def dataset_overview(df, guidance="off"):
+from .column_stats import profile_columns
+
+
+def dataset_overview(df, guidance="off", profile=None):
+    profile = profile or profile_columns(df)
+    cols = profile["columns"]
+
     overview = {
-        "rows": len(df),
-        "columns": df.shape[1],
-        "column_names": list(df.columns),
-        "dtypes": df.dtypes.astype(str).to_dict(),
-        "missing_values": df.isnull().sum().to_dict(),
-        "memory_MB": round(df.memory_usage(deep=True).sum() / 1_000_000, 3)
+        "rows": profile["rows"],
+        "columns": len(cols),
+        "column_names": list(cols),
+        "dtypes": {c: str(s["dtype"]) for c, s in cols.items()},
+        "missing_values": {c: s["nulls"] for c, s in cols.items()},
+        "memory_MB": round((profile["index_memory"] + sum(s["memory"] for s in cols.values())) / 1_000_000, 3)
     }
 
     if guidance == "on":
@@ -20,9 +26,10 @@ def dataset_overview(df, guidance="off"):
     return overview
 
 
-def overview_insights(df):
+def overview_insights(df, profile=None):
+    profile = profile or profile_columns(df)
     insights = []
-    rows, cols = df.shape
+    rows, cols = profile["rows"], len(profile["columns"])
 
     if rows < 500:
         insights.append("Dataset is small and easy to process.")
@@ -31,17 +38,17 @@ def overview_insights(df):
     else:
         insights.append("Large dataset detected — consider chunking or Dask.")
 
-    nulls = df.isna().sum().sum()
+    nulls = sum(s["nulls"] for s in profile["columns"].values())
     if nulls == 0:
         insights.append("No missing values — excellent data quality.")
     else:
         insights.append(f"Dataset contains {nulls} missing values — requires cleaning.")
 
-    object_cols = df.select_dtypes(include="object").columns
+    object_cols = profile["object"]
     if len(object_cols) > cols * 0.3:
         insights.append("High number of categorical columns — consider encoding strategies.")
 
-    num_cols = df.select_dtypes(include="number").columns
+    num_cols = profile["numeric"]
     if len(num_cols) > cols * 0.7:
         insights.append("Dataset is numerically heavy — scaling may be needed.")
 
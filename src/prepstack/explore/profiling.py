@@ -2,21 +2,25 @@ from .overview import dataset_overview, overview_insights
 from .missing import missing_report, missing_insights
 from .distributions import distribution_report, distribution_insights
 from .correlations import correlation_report, correlation_insights
+from .column_stats import profile_columns
 
 def auto_profile(df, guidance="off"):
     print("🔮 AUTO EDA PROFILE STARTED") if guidance == "on" else None
     print("--------------------------------------------------") if guidance == "on" else None
 
-    ov = dataset_overview(df, guidance)
-    ov_ins = overview_insights(df)
+    # one scan of the data feeds every report below
+    profile = profile_columns(df)
 
-    ms = missing_report(df, guidance)
+    ov = dataset_overview(df, guidance, profile=profile)
+    ov_ins = overview_insights(df, profile=profile)
+
+    ms = missing_report(df, guidance, profile=profile)
     ms_ins = missing_insights(ms)
 
-    dist = distribution_report(df, guidance)
-    dist_ins = distribution_insights(df)
+    dist = distribution_report(df, guidance, profile=profile)
+    dist_ins = distribution_insights(df, profile=profile)
 
-    corr = correlation_report(df, guidance)
+    corr = correlation_report(df, guidance, profile=profile)
     corr_ins = correlation_insights(corr)
 
     if guidance == "on":
@@ -36,5 +40,6 @@ def auto_profile(df, guidance="off"):
         "distribution": dist,
         "distribution_insights": dist_ins,
         "correlations": corr,
-        "correlation_insights": corr_ins
+        "correlation_insights": corr_ins,
+        "profile": profile
     }
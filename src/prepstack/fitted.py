@@ -0,0 +1,340 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from prepstack.helpers import say, GuidanceMode, working_copy, is_categorical, category_counts
+
+FITTED_KINDS = ("impute", "iqr", "standard", "minmax", "frequency", "label", "onehot", "target")
+
+
+def plain_value(value):
+    """Convert numpy scalars to plain Python values (datetimes → Timestamp / Timedelta)."""
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value)
+    if isinstance(value, np.timedelta64):
+        return pd.Timedelta(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _encode(value):
+    """JSON-safe form of a state value; Timestamp / Timedelta are tagged."""
+    value = plain_value(value)
+    if isinstance(value, pd.Timestamp):
+        return {"__timestamp__": value.isoformat()}
+    if isinstance(value, pd.Timedelta):
+        return {"__timedelta__": value.isoformat()}
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict) and len(value) == 1:
+        if "__timestamp__" in value:
+            return pd.Timestamp(value["__timestamp__"])
+        if "__timedelta__" in value:
+            return pd.Timedelta(value["__timedelta__"])
+    return value
+
+
+class FittedState:
+    """
+    Statistics learned by a fit_* function.
+
+    kind   : one of FITTED_KINDS
+    params : {column: learned value(s)}
+        impute    → fill value
+        iqr       → (lower, upper)
+        standard  → (mean, std)
+        minmax    → (min, max)
+        frequency → {category: proportion}
+        label     → {category: code}
+        onehot    → [levels that get their own column]
+        target    → {category: smoothed target mean}
+    options: extra settings used when applying the state (e.g. IQR factor)
+
+    States can be pickled directly or saved with to_json() / from_json().
+    """
+
+    def __init__(self, kind, params, options=None):
+        if kind not in FITTED_KINDS:
+            raise ValueError(f"Unknown fitted kind '{kind}'. Use one of {FITTED_KINDS}.")
+        self.kind = kind
+        self.params = params
+        self.options = options or {}
+
+    @property
+    def columns(self):
+        return list(self.params)
+
+    def to_dict(self):
+        params = {}
+        for col, value in self.params.items():
+            if isinstance(value, dict):
+                # mapping keys are not always strings, so store them as pairs
+                params[col] = [[_encode(k), _encode(v)] for k, v in value.items()]
+            elif isinstance(value, (tuple, list)):
+                params[col] = [_encode(v) for v in value]
+            else:
+                params[col] = _encode(value)
+        return {"kind": self.kind, "params": params, "options": self.options}
+
+    @classmethod
+    def from_dict(cls, data):
+        kind = data["kind"]
+        params = {}
+        for col, value in data["params"].items():
+            if kind in ("frequency", "label", "target"):
+                params[col] = {_decode(k): _decode(v) for k, v in value}
+            elif kind in ("iqr", "standard", "minmax"):
+                params[col] = tuple(_decode(v) for v in value)
+            elif kind == "onehot":
+                params[col] = [_decode(v) for v in value]
+            else:
+                params[col] = _decode(value)
+        return cls(kind, params, data.get("options"))
+
+    def to_json(self, path=None):
+        """Return the state as a JSON string, or write it to path."""
+        text = json.dumps(self.to_dict())
+        if path is None:
+            return text
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    @classmethod
+    def from_json(cls, text_or_path):
+        """Load a state from a JSON string or a file path."""
+        text = text_or_path
+        if not text_or_path.lstrip().startswith("{"):
+            with open(text_or_path) as f:
+                text = f.read()
+        return cls.from_dict(json.loads(text))
+
+    def __repr__(self):
+        return f"FittedState(kind='{self.kind}', columns={self.columns})"
+
+
+# -------------------------
+# Fit functions
+# -------------------------
+def fit_numeric_impute(df, columns=None, method="median", fill_value=None, guidance: GuidanceMode = "off"):
+    """
+    Learn fill values for numeric columns.
+    Counterpart of fill_missing_numeric / numeric_impute.
+
+    method: 'mean' | 'median' | 'min' | 'max' | 'zero' | 'constant'
+    """
+    if columns is None:
+        columns = df.select_dtypes(include="number").columns.tolist()
+
+    params = {}
+    for col in columns:
+        if method == "mean":
+            v = df[col].mean()
+        elif method == "median":
+            v = df[col].median()
+        elif method == "min":
+            v = df[col].min()
+        elif method == "max":
+            v = df[col].max()
+        elif method == "zero":
+            v = 0
+        elif method == "constant":
+            if fill_value is None:
+                raise ValueError("fill_value must be provided for constant strategy")
+            v = fill_value
+        else:
+            raise ValueError(f"Unknown method: {method}")
+        params[col] = plain_value(v)
+
+    say(f"🎓 Fitted '{method}' imputation for {len(params)} column(s).", guidance)
+    return FittedState("impute", params, {"method": method})
+
+
+def fit_outlier_bounds(df, columns=None, factor=1.5, guidance: GuidanceMode = "off"):
+    """
+    Learn IQR bounds (Q1 - factor*IQR, Q3 + factor*IQR) per numeric column.
+    Counterpart of cap_outliers_iqr / clean_outliers.
+
+    Columns without spread (IQR of 0 or NaN) get (None, None) and are left
+    untouched by apply_fitted, as cap_outliers_iqr leaves them.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include="number").columns.tolist()
+
+    params = {}
+    for col in columns:
+        q1 = df[col].quantile(0.25)
+        q3 = df[col].quantile(0.75)
+        iqr = q3 - q1
+        if not iqr > 0:
+            params[col] = (None, None)
+            continue
+        params[col] = (plain_value(q1 - factor * iqr), plain_value(q3 + factor * iqr))
+
+    say(f"🎓 Fitted IQR bounds (factor={factor}) for {len(params)} column(s).", guidance)
+    flat = [col for col, bounds in params.items() if bounds[0] is None]
+    if flat:
+        say(f"ℹ️ No spread (IQR = 0) in {flat}; these columns will not be capped.", guidance)
+    return FittedState("iqr", params, {"factor": factor})
+
+
+def fit_scaler(df, cols, method="standard", guidance: GuidanceMode = "off"):
+    """
+    Learn scaling statistics.
+    Counterpart of standard_scale / minmax_scale / scale_numeric.
+
+    method: 'standard' (mean, std) | 'minmax' (min, max)
+    """
+    if isinstance(cols, str):
+        cols = [cols]
+
+    params = {}
+    for col in cols:
+        if method == "standard":
+            params[col] = (plain_value(df[col].mean()), plain_value(df[col].std()))
+        elif method == "minmax":
+            params[col] = (plain_value(df[col].min()), plain_value(df[col].max()))
+        else:
+            raise ValueError("Unknown scaling method")
+
+    say(f"🎓 Fitted '{method}' scaler for {len(params)} column(s).", guidance)
+    return FittedState(method, params)
+
+
+def fit_frequency_encoder(df, columns, guidance: GuidanceMode = "off"):
+    """
+    Learn category proportions. Counterpart of frequency_encode.
+    """
+    params = {}
+    for col in columns:
+        freq = df[col].value_counts(normalize=True)
+        params[col] = {plain_value(k): plain_value(v) for k, v in freq.items()}
+
+    say(f"🎓 Fitted frequency tables for {len(params)} column(s).", guidance)
+    return FittedState("frequency", params)
+
+
+def fit_label_encoder(df, columns, guidance: GuidanceMode = "off"):
+    """
+    Learn label mappings (sorted categories → 0..k-1). Counterpart of label_encode.
+    """
+    params = {}
+    for col in columns:
+        cats = df[col].astype("category").cat.categories
+        params[col] = {plain_value(k): i for i, k in enumerate(cats)}
+
+    say(f"🎓 Fitted label mappings for {len(params)} column(s).", guidance)
+    return FittedState("label", params)
+
+
+def _onehot_levels(series, max_levels=None, min_frequency=None):
+    """
+    Levels kept as their own dummy column, in pd.get_dummies order
+    (sorted values, or the category order for categoricals).
+    """
+    if is_categorical(series):
+        levels = series.cat.categories
+        counts = pd.Series(category_counts(series), index=levels)
+    else:
+        counts = series.value_counts(dropna=True)
+        levels = counts.index
+        try:
+            levels = levels.sort_values()
+        except TypeError:
+            pass  # mixed types keep frequency order
+
+    keep = counts
+    if min_frequency is not None:
+        # float → share of non-null rows, int → row count
+        threshold = min_frequency * counts.sum() if isinstance(min_frequency, float) else min_frequency
+        keep = keep[keep >= threshold]
+    if max_levels is not None and len(keep) > max_levels:
+        keep = keep.sort_values(ascending=False, kind="stable").head(max_levels)
+
+    return levels[levels.isin(keep.index)].tolist()
+
+
+def fit_onehot_encoder(df, columns, max_levels=None, min_frequency=None, other="other", guidance: GuidanceMode = "off"):
+    """
+    Learn the one-hot vocabulary per column. Counterpart of one_hot_encode.
+
+    max_levels    : keep at most this many (most frequent) levels per column
+    min_frequency : drop levels seen fewer times (int) or in a smaller share
+                    of rows (float)
+    other         : name of the bucket column for dropped and unseen levels;
+                    only created when max_levels or min_frequency is set
+    """
+    params = {col: [plain_value(v) for v in _onehot_levels(df[col], max_levels, min_frequency)] for col in columns}
+    capped = max_levels is not None or min_frequency is not None
+
+    say(f"🎓 Fitted one-hot vocabularies for {len(params)} column(s).", guidance)
+    return FittedState("onehot", params, {"other": other if capped else None})
+
+
+# -------------------------
+# Apply
+# -------------------------
+def apply_fitted(df, state, action="cap", guidance: GuidanceMode = "off"):
+    """
+    Apply a FittedState to new data without recomputing any statistics.
+
+    action is only used for 'iqr' states:
+    - "cap": clip values to the stored bounds
+    - "remove": drop rows outside the stored bounds
+
+    Unknown categories map to 0.0 (frequency), -1 (label) or the target
+    prior (target), matching frequency_encode, label_encode and target_encode. 'onehot' states produce the same
+    columns as one_hot_encode(..., vocabulary=state, drop_first=False).
+    """
+    if state.kind == "onehot":
+        from prepstack.transform.columns.encoding import one_hot_encode
+        return one_hot_encode(df, state.columns, drop_first=False, vocabulary=state, guidance=guidance)
+
+    df = working_copy(df)
+    say(f"📦 Applying fitted '{state.kind}' state to {len(state.params)} column(s).", guidance)
+
+    if state.kind == "impute":
+        for col, v in state.params.items():
+            df[col] = df[col].fillna(v)
+
+    elif state.kind == "iqr":
+        if action not in ("cap", "remove"):
+            raise ValueError("action must be 'cap' or 'remove'")
+
+        mask = pd.Series(False, index=df.index)
+        for col, (lower, upper) in state.params.items():
+            if lower is None:
+                continue  # fitted without spread
+            if action == "cap":
+                df[col] = df[col].clip(lower, upper)
+            else:
+                mask |= (df[col] < lower) | (df[col] > upper)
+
+        if action == "remove":
+            df = df.loc[~mask]
+            say(f" 🗑️ Removed {int(mask.sum())} rows outside fitted bounds", guidance)
+
+    elif state.kind in ("standard", "minmax"):
+        for col, (a, b) in state.params.items():
+            span = b if state.kind == "standard" else b - a
+            df[col + "_scaled"] = (df[col] - a) / span
+
+    elif state.kind == "frequency":
+        for col, freq in state.params.items():
+            df[col + "_freq"] = df[col].map(freq).fillna(0.0)
+
+    elif state.kind == "label":
+        for col, mp in state.params.items():
+            df[col] = df[col].map(mp).fillna(-1).astype(int)
+
+    elif state.kind == "target":
+        # unseen and missing categories fall back to the training prior
+        for col, mp in state.params.items():
+            df[col + "_target"] = df[col].map(mp).astype("float64").fillna(state.options["prior"])
+
+    say("✨ Fitted state applied.", guidance)
+    return df
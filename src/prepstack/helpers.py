@@ -1,5 +1,13 @@
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Literal
 
+import numpy as np
+import pandas as pd
+
+from prepstack import config
+
 GuidanceMode = Literal["on", "off"]
 
 def say(message: str, guidance: GuidanceMode = "on"):
@@ -9,3 +17,111 @@ def say(message: str, guidance: GuidanceMode = "on"):
     """
     if guidance == "on":
         print(message)
+
+
+# per-context override of config.copy_policy (set by copy_policy_scope), so
+# a running Pipeline does not change the policy seen by other threads
+_policy_override: ContextVar = ContextVar("prepstack_copy_policy", default=None)
+
+
+def current_copy_policy() -> str:
+    """The copy policy in effect here: a copy_policy_scope, else config.copy_policy."""
+    override = _policy_override.get()
+    return config.copy_policy if override is None else override
+
+
+@contextmanager
+def copy_policy_scope(policy: str):
+    """
+    Use `policy` for prepstack steps called inside the with-block, in the
+    current thread/context only; config.copy_policy stays untouched.
+    """
+    if policy not in config.COPY_POLICIES:
+        raise ValueError(f"Unknown copy_policy '{policy}'. Use one of {config.COPY_POLICIES}.")
+    token = _policy_override.set(policy)
+    try:
+        yield
+    finally:
+        _policy_override.reset(token)
+
+
+def _copy_on_write_active() -> bool:
+    """
+    True when pandas copy-on-write protects shallow copies.
+    On pandas 2.x the global pandas option is only switched on here when
+    prepstack.config.pandas_copy_on_write is True.
+    """
+    major = int(pd.__version__.split(".")[0])
+    if major >= 3:
+        return True
+    if major < 2:
+        return False
+    if pd.get_option("mode.copy_on_write") is True:
+        return True
+    if config.pandas_copy_on_write:
+        pd.set_option("mode.copy_on_write", True)
+        return True
+    return False
+
+
+def working_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the DataFrame a prepstack step should write into.
+    Follows prepstack.config.copy_policy ('copy', 'cow' or 'inplace'),
+    or the policy of an enclosing copy_policy_scope.
+    """
+    policy = current_copy_policy()
+
+    if policy == "copy":
+        return df.copy()
+
+    if policy == "inplace":
+        return df
+
+    if policy == "cow":
+        if _copy_on_write_active():
+            return df.copy(deep=False)
+        warnings.warn(
+            "copy_policy='cow' needs pandas copy-on-write (pandas >= 3.0, or pandas 2.x with "
+            "prepstack.config.pandas_copy_on_write = True); falling back to full copies.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return df.copy()
+
+    raise ValueError(f"Unknown copy_policy '{policy}'. Use one of {config.COPY_POLICIES}.")
+
+
+def is_categorical(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def take_by_code(series: pd.Series, per_category, missing) -> np.ndarray:
+    """
+    Broadcast one value per category to every row through the integer codes.
+    Rows with a missing category get `missing`.
+    """
+    per_category = np.asarray(per_category)
+    lookup = np.append(per_category, np.array([missing], dtype=per_category.dtype))
+    return lookup[series.cat.codes.to_numpy()]  # code -1 picks the appended slot
+
+
+def category_counts(series: pd.Series) -> np.ndarray:
+    """Row count per category, computed from the codes with one bincount."""
+    codes = series.cat.codes.to_numpy()
+    return np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+
+
+def category_mode(series: pd.Series):
+    """Most frequent category (first in category order on ties, like Series.mode)."""
+    counts = category_counts(series)
+    if not counts.any():
+        return None
+    return series.cat.categories[int(counts.argmax())]
+
+
+def fill_categorical(series: pd.Series, value) -> pd.Series:
+    """fillna that registers value as a new category first when needed."""
+    if value is not None and not pd.isna(value) and value not in series.cat.categories:
+        series = series.cat.add_categories([value])
+    return series.fillna(value)
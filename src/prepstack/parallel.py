@@ -0,0 +1,152 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+BACKENDS = ("threads", "processes")
+
+
+def resolve_n_jobs(n_jobs):
+    """n_jobs=None/1 → serial, -1 → all cores, k → k workers."""
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, int(n_jobs))
+
+
+def _partition(items, n_parts):
+    """Split items into n_parts round-robin groups (balanced column counts)."""
+    return [items[i::n_parts] for i in range(n_parts) if items[i::n_parts]]
+
+
+def _shareable(series):
+    dtype = series.dtype
+    return isinstance(dtype, np.dtype) and dtype.kind in "iufb"
+
+
+def _load(payload):
+    if payload[0] == "series":
+        return payload[1], None
+
+    _, name, dtype, shape, row, col = payload
+    # pool workers share the parent's resource tracker, which unlinks the
+    # segment only once, in map_columns
+    shm = shared_memory.SharedMemory(name=name)
+    values = np.ndarray(shape, dtype=dtype, buffer=shm.buf)[row]
+    return pd.Series(values, name=col, copy=False), shm
+
+
+def _run_partition(func, items, kwargs):
+    out = {}
+    for col, payload in items:
+        series, shm = _load(payload)
+        try:
+            result = func(series, **kwargs)
+            if shm is not None:
+                # results must not point into shared memory once it is closed
+                if isinstance(result, (pd.Series, np.ndarray)):
+                    result = result.copy()
+                elif isinstance(result, tuple):
+                    result = tuple(r.copy() if isinstance(r, (pd.Series, np.ndarray)) else r for r in result)
+        finally:
+            del series
+            if shm is not None:
+                shm.close()
+        out[col] = result
+    return out
+
+
+def _share_numeric(df, columns):
+    """
+    Copy plain numeric columns into one shared-memory block per dtype.
+    Returns ({col: payload}, [segments]).
+    """
+    payloads, segments = {}, []
+    by_dtype = {}
+    for col in columns:
+        if _shareable(df[col]):
+            by_dtype.setdefault(df[col].dtype, []).append(col)
+
+    for dtype, cols in by_dtype.items():
+        shape = (len(cols), len(df))
+        shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        block = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        for row, col in enumerate(cols):
+            block[row] = df[col].to_numpy()
+            payloads[col] = ("shm", shm.name, dtype.str, shape, row, col)
+        del block
+        segments.append(shm)
+
+    return payloads, segments
+
+
+def map_columns(func, df, columns, *, n_jobs=1, backend="threads", **kwargs):
+    """
+    Run func(series, **kwargs) for every column and return {column: result}.
+
+    n_jobs  : number of workers (1 = serial, -1 = all cores)
+    backend : "threads"   — shared address space, best for numpy/pandas
+                            kernels that release the GIL
+              "processes" — separate interpreters, best for Python-heavy
+                            work such as string cleaning. Plain numeric
+                            columns are passed through shared memory instead
+                            of being pickled; other columns are pickled.
+
+    Columns are split round-robin into one partition per worker. func must
+    be a module-level function when backend="processes". Shared-memory
+    columns reach the workers with a RangeIndex; Series results that still
+    carry that exact RangeIndex are row-aligned and get df.index back here,
+    other results (value_counts, aggregates) keep their own index.
+    """
+    columns = list(columns)
+    n_jobs = min(resolve_n_jobs(n_jobs), max(1, len(columns)))
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of {BACKENDS}.")
+
+    if n_jobs == 1:
+        return {col: func(df[col], **kwargs) for col in columns}
+
+    if backend == "threads":
+        parts = _partition([(col, ("series", df[col])) for col in columns], n_jobs)
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            results = pool.map(_run_partition, [func] * len(parts), parts, [kwargs] * len(parts))
+            out = {}
+            for part in results:
+                out.update(part)
+        return {col: out[col] for col in columns}
+
+    shared, segments = _share_numeric(df, columns)
+    try:
+        items = [(col, shared.get(col) or ("series", df[col])) for col in columns]
+        parts = _partition(items, n_jobs)
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = pool.map(_run_partition, [func] * len(parts), parts, [kwargs] * len(parts))
+            out = {}
+            for part in results:
+                out.update(part)
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+    def realign(col, value):
+        # only row-aligned results of shared-memory columns still carry the
+        # RangeIndex they were shipped with; anything else keeps its index
+        shipped = isinstance(shared.get(col), tuple) and shared[col][0] == "shm"
+        if (
+            shipped
+            and isinstance(value, pd.Series)
+            and isinstance(value.index, pd.RangeIndex)
+            and value.index.equals(pd.RangeIndex(len(df)))
+        ):
+            value.index = df.index
+        return value
+
+    return {
+        col: tuple(realign(col, v) for v in out[col]) if isinstance(out[col], tuple) else realign(col, out[col])
+        for col in columns
+    }
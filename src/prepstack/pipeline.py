@@ -0,0 +1,281 @@
+from prepstack.helpers import say, working_copy, current_copy_policy, copy_policy_scope
+
+# Column-list argument names used by prepstack step functions
+_COLUMN_ARGS = ("columns", "cols")
+
+
+def _step_name(func):
+    return getattr(func, "__name__", repr(func))
+
+
+def _column_arg(kwargs):
+    for name in _COLUMN_ARGS:
+        if name in kwargs and kwargs[name] is not None:
+            return name
+    return None
+
+
+def _per_column_steps():
+    """
+    Steps whose result for a column depends only on that column, so two
+    calls over different columns equal one call over their union.
+    Steps that combine their columns (add_interaction, hash_encode, ...)
+    are deliberately not listed.
+    """
+    from prepstack.cleaning import missing, outliers
+    from prepstack.transform.columns import encoding, scaling, string_ops
+    from prepstack.transform.missing.categorical_impute import categorical_impute
+    from prepstack.transform.missing.numeric_impute import numeric_impute
+
+    return {
+        missing.fill_missing_numeric,
+        missing.fill_missing_categorical,
+        numeric_impute,
+        categorical_impute,
+        outliers.cap_outliers_iqr,
+        outliers.clean_outliers,
+        scaling.scale_numeric,
+        string_ops.strip_whitespace,
+        string_ops.to_lower,
+        string_ops.clean_strings,
+        encoding.label_encode,
+        encoding.frequency_encode,
+    }
+
+
+def _touches(cols, other):
+    """
+    True when a column in cols is one of `other` or a column generated from
+    it ('<col>_freq', '<col>_scaled', ...), or the other way round.
+    """
+    return any(
+        a == b or a.startswith(f"{b}_") or b.startswith(f"{a}_")
+        for a in map(str, _as_list(cols)) for b in map(str, _as_list(other))
+    )
+
+
+def _mergeable(prev, step):
+    """
+    Two adjacent steps can be merged when they call the same per-column
+    step with identical options and touch disjoint columns: step must not
+    read or write a column prev reads or writes (generated outputs
+    included), or it would see values prev has not produced yet.
+    """
+    if prev["func"] is not step["func"] or step["func"] not in _per_column_steps():
+        return False
+
+    # removing rows changes the statistics of every later column
+    if step["kwargs"].get("action", "remove") == "remove" and _step_name(step["func"]) == "clean_outliers":
+        return False
+
+    prev_arg = _column_arg(prev["kwargs"])
+    step_arg = _column_arg(step["kwargs"])
+    if prev_arg is None or prev_arg != step_arg:
+        return False
+
+    prev_rest = {k: v for k, v in prev["kwargs"].items() if k != prev_arg}
+    step_rest = {k: v for k, v in step["kwargs"].items() if k != step_arg}
+    if prev_rest != step_rest:
+        return False
+
+    return not _touches(step["kwargs"][step_arg], prev["kwargs"][prev_arg])
+
+
+def _as_list(cols):
+    return [cols] if isinstance(cols, str) else list(cols)
+
+
+def _fuse_strings(prev, step):
+    """
+    strip_whitespace / to_lower / clean_strings on the same columns are
+    fused into a single clean_strings pass.
+    """
+    from prepstack.transform.columns import string_ops
+
+    flags = {
+        string_ops.strip_whitespace: {"strip": True, "lower": False, "upper": False},
+        string_ops.to_lower: {"strip": False, "lower": True, "upper": False},
+    }
+
+    def describe(s):
+        if s["func"] in flags:
+            cols = s["kwargs"].get("columns")
+            return cols, dict(flags[s["func"]])
+        if s["func"] is string_ops.clean_strings:
+            kw = s["kwargs"]
+            return kw.get("columns"), {
+                "strip": kw.get("strip", True),
+                "lower": kw.get("lower", True),
+                "upper": kw.get("upper", False),
+            }
+        return None
+
+    a, b = describe(prev), describe(step)
+    if a is None or b is None:
+        return None
+
+    cols_a, ops_a = a
+    cols_b, ops_b = b
+    if cols_a is None or cols_b is None or _as_list(cols_a) != _as_list(cols_b):
+        return None
+
+    # strip must run before any case change for the fused pass to be equivalent
+    if ops_b["strip"] and (ops_a["lower"] or ops_a["upper"]):
+        return None
+    # lower and upper cannot both survive a fusion
+    if (ops_a["lower"] or ops_b["lower"]) and (ops_a["upper"] or ops_b["upper"]):
+        return None
+
+    fused = {k: ops_a[k] or ops_b[k] for k in ops_a}
+    # worker settings carry over to the fused pass (the later step wins)
+    workers = {k: v for s in (prev, step) for k, v in s["kwargs"].items() if k in ("n_jobs", "backend")}
+    return {
+        "func": string_ops.clean_strings,
+        "kwargs": {"columns": _as_list(cols_a), **fused, **workers},
+        "sources": prev["sources"] + step["sources"],
+    }
+
+
+class Pipeline:
+    """
+    Lazy chain of prepstack steps.
+
+    Steps are recorded with add() and only executed by run(). Before running,
+    the pipeline plans the chain:
+    - the input frame is copied once (following prepstack.config.copy_policy)
+      and every step then writes into that single working frame
+    - adjacent calls to the same per-column step (imputation, IQR capping,
+      scaling, string cleaning, label/frequency encoding) on disjoint
+      columns are merged into one call over the union of columns; steps
+      that read a column an earlier step created or changed stay separate
+    - adjacent strip / lower string steps on the same columns are fused into
+      one clean_strings pass
+
+    The plan does not reduce the work done per column. Merged calls still
+    compute every column's statistics in their own pass, and medians,
+    quantiles or nunique are not shared between steps. What the plan saves
+    is the per-call overhead and the intermediate frame copies, so expect
+    lower memory rather than a shorter wall time for statistics-heavy chains.
+
+    Example:
+        pipe = (
+            Pipeline()
+            .add(clean_basic)
+            .add(clean_missing)
+            .add(clean_outliers, action="cap")
+            .add(scale_numeric, cols=["age", "usage"])
+        )
+        pipe.explain()
+        df_clean = pipe.run(df)
+
+    Steps that return (df, info) tuples, such as label_encode, have their
+    extra outputs stored in pipe.artifacts under the step name.
+    """
+
+    def __init__(self, steps=None, guidance="off"):
+        self.steps = []
+        self.guidance = guidance
+        self.artifacts = {}
+
+        for step in steps or []:
+            if callable(step):
+                self.add(step)
+            else:
+                func, kwargs = step
+                self.add(func, **kwargs)
+
+    def add(self, func, **kwargs):
+        """Record a step. Returns the pipeline so calls can be chained."""
+        if not callable(func):
+            raise TypeError(f"Pipeline steps must be callable, got {type(func).__name__}")
+        self.steps.append({"func": func, "kwargs": kwargs})
+        return self
+
+    def plan(self):
+        """Return the optimised list of steps that run() will execute."""
+        planned = []
+
+        for step in self.steps:
+            current = {
+                "func": step["func"],
+                "kwargs": dict(step["kwargs"]),
+                "sources": [_step_name(step["func"])],
+            }
+
+            if planned:
+                prev = planned[-1]
+
+                if _mergeable(prev, current):
+                    arg = _column_arg(prev["kwargs"])
+                    merged = _as_list(prev["kwargs"][arg])
+                    merged += [c for c in _as_list(current["kwargs"][arg]) if c not in merged]
+                    prev["kwargs"][arg] = merged
+                    prev["sources"] += current["sources"]
+                    continue
+
+                fused = _fuse_strings(prev, current)
+                if fused is not None:
+                    planned[-1] = fused
+                    continue
+
+            planned.append(current)
+
+        return planned
+
+    def explain(self, guidance=None):
+        """
+        Return a readable description of the execution plan, printed when
+        guidance is "on" (default: the pipeline's guidance).
+        """
+        planned = self.plan()
+
+        lines = [
+            "🧭 PIPELINE PLAN",
+            f" • Recorded steps: {len(self.steps)}",
+            f" • Planned passes: {len(planned)}",
+            f" • Input copy: once, policy='{current_copy_policy()}'",
+        ]
+        for i, step in enumerate(planned, 1):
+            args = ", ".join(f"{k}={v!r}" for k, v in step["kwargs"].items())
+            line = f" {i}. {_step_name(step['func'])}({args})"
+            if len(step["sources"]) > 1:
+                line += f"  ← fused from {step['sources']}"
+            lines.append(line)
+
+        text = "\n".join(lines)
+        say(text, self.guidance if guidance is None else guidance)
+        return text
+
+    def run(self, df):
+        """Execute the planned steps on df and return the result."""
+        planned = self.plan()
+        self.artifacts = {}
+
+        say(f"🚀 PIPELINE STARTED • {len(planned)} pass(es) for {len(self.steps)} step(s)", self.guidance)
+
+        out = working_copy(df)
+
+        # the steps write into the single working frame; the policy is only
+        # overridden in this context, not in prepstack.config
+        with copy_policy_scope("inplace"):
+            for step in planned:
+                name = _step_name(step["func"])
+                kwargs = dict(step["kwargs"])
+                kwargs.setdefault("guidance", "off")
+
+                result = step["func"](out, **kwargs)
+
+                if isinstance(result, tuple):
+                    out, extra = result[0], result[1:]
+                    self.artifacts[name] = extra[0] if len(extra) == 1 else extra
+                else:
+                    out = result
+
+                say(f" → {name} done {out.shape}", self.guidance)
+
+        say("✨ Pipeline complete.", self.guidance)
+        return out
+
+    def __repr__(self):
+        names = [_step_name(s["func"]) for s in self.steps]
+        return f"Pipeline(steps={names})"
@@ -0,0 +1,141 @@
+import numpy as np
+
+QUANTILE_METHODS = ("exact", "sketch")
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch for numeric streams.
+
+    Memory is O(k) regardless of how many values are added. Sketches built on
+    separate chunks (or in separate processes) can be combined with merge(),
+    and the result has the same guarantees as one sketch built on all data.
+
+    Error bound: a quantile estimate has normalized rank error below
+    rank_error() with ~99% confidence, i.e. about 2.446 / k**0.9433
+    (≈1.65% of the row count for the default k=200, ≈0.4% for k=1000).
+
+    Example:
+        sketch = KLLSketch()
+        for chunk in chunks:
+            sketch.update(chunk["amount"])
+        q1, q3 = sketch.quantile([0.25, 0.75])
+    """
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0, dtype="float64")]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacities(self):
+        depth = len(self.levels)
+        return [max(2, int(np.ceil(self.k * (2 / 3) ** (depth - 1 - h)))) for h in range(depth)]
+
+    def _compact(self, h):
+        items = np.sort(self.levels[h])
+        keep = items[-1:] if items.size % 2 else items[:0]
+        pairs = items[: items.size - keep.size]
+        promoted = pairs[self._rng.integers(2)::2]
+
+        if h + 1 == len(self.levels):
+            self.levels.append(np.empty(0, dtype="float64"))
+        self.levels[h] = keep
+        self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+
+    def _compress(self):
+        # compact the lowest full level until the sketch fits its total budget
+        while True:
+            caps = self._capacities()
+            if sum(lvl.size for lvl in self.levels) <= sum(caps):
+                return
+            h = next(h for h, cap in enumerate(caps) if self.levels[h].size >= cap)
+            self._compact(h)
+
+    def update(self, values):
+        """Add a batch of values (NaNs are ignored)."""
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        self.count += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another sketch into this one."""
+        if other.count == 0:
+            return self
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype="float64"))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Estimated quantile(s) for q in [0, 1]. Returns a float or an array."""
+        scalar = np.isscalar(q)
+        qs = np.atleast_1d(np.asarray(q, dtype="float64"))
+
+        if self.count == 0:
+            out = np.full(qs.shape, np.nan)
+            return float(out[0]) if scalar else out
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(lvl.size, 2 ** h, dtype="float64") for h, lvl in enumerate(self.levels)])
+        order = np.argsort(items, kind="mergesort")
+        items, cum = items[order], np.cumsum(weights[order])
+
+        idx = np.searchsorted(cum, qs * cum[-1], side="left")
+        out = items[np.clip(idx, 0, items.size - 1)]
+        # the extremes are tracked exactly
+        out = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, out))
+        return float(out[0]) if scalar else out
+
+    def rank_error(self):
+        """Approximate normalized rank error (99% confidence)."""
+        return 2.446 / self.k ** 0.9433
+
+    def __repr__(self):
+        retained = sum(lvl.size for lvl in self.levels)
+        return f"KLLSketch(k={self.k}, count={self.count}, retained={retained})"
+
+
+def series_quantiles(series, qs, quantile_method="exact", k=200):
+    """
+    Quantiles of a numeric Series.
+
+    quantile_method:
+    - "exact": pandas Series.quantile
+    - "sketch": KLLSketch estimate (one pass, bounded memory, see KLLSketch)
+    """
+    if quantile_method == "exact":
+        return [float(v) for v in series.quantile(list(qs))]
+    if quantile_method == "sketch":
+        sketch = KLLSketch(k=k).update(series.to_numpy(dtype="float64", na_value=np.nan))
+        return [float(v) for v in sketch.quantile(list(qs))]
+    raise ValueError(f"Unknown quantile_method '{quantile_method}'. Use one of {QUANTILE_METHODS}.")
+
+
+def sketch_columns(df, columns=None, k=200):
+    """
+    Build one KLLSketch per numeric column.
+    Sketches from different chunks can be combined with KLLSketch.merge().
+    """
+    if columns is None:
+        columns = df.select_dtypes(include="number").columns.tolist()
+    return {col: KLLSketch(k=k).update(df[col].to_numpy(dtype="float64", na_value=np.nan)) for col in columns}
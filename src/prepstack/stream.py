@@ -0,0 +1,571 @@
+import os
+import shutil
+import tempfile
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from prepstack.helpers import say, GuidanceMode
+from prepstack.cleaning.duplicates import row_fingerprints
+from prepstack.sketch import KLLSketch
+
+
+def _is_parquet(path):
+    return str(path).lower().endswith((".parquet", ".pq"))
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow not installed. Install with pip install pyarrow")
+    return pq
+
+
+# -------------------------
+# Reading / writing chunks
+# -------------------------
+def read_chunks(path, chunksize=100_000, columns=None, **read_kwargs):
+    """
+    Yield DataFrame chunks of at most `chunksize` rows from a CSV or Parquet file.
+
+    Parquet files need pyarrow. Extra keyword arguments go to pd.read_csv.
+    """
+    if _is_parquet(path):
+        pq = _require_pyarrow()
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    yield from pd.read_csv(path, chunksize=chunksize, usecols=columns, **read_kwargs)
+
+
+class ChunkWriter:
+    """
+    Append DataFrame chunks to a CSV or Parquet file.
+    Use as a context manager so the output file is always closed.
+
+    types: optional {column: pyarrow type} for Parquet output. The file
+    schema is taken from the first chunk with these types overriding the
+    inferred ones, and every chunk is cast to it, so a column that is int
+    in one chunk and float in the next (or all-null at first) still fits.
+    """
+
+    def __init__(self, path, types=None):
+        self.path = path
+        self.rows = 0
+        self.types = types or {}
+        self._parquet_writer = None
+        self._schema = None
+
+    def write(self, chunk):
+        if _is_parquet(self.path):
+            import pyarrow as pa
+            pq = _require_pyarrow()
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._schema = pa.schema(
+                    [pa.field(f.name, self.types.get(f.name, f.type)) for f in table.schema]
+                )
+                self._parquet_writer = pq.ParquetWriter(self.path, self._schema)
+            table = table.select(self._schema.names).cast(self._schema)
+            self._parquet_writer.write_table(table)
+        else:
+            chunk.to_csv(self.path, mode="w" if self.rows == 0 else "a", header=self.rows == 0, index=False)
+
+        self.rows += len(chunk)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -------------------------
+# Mergeable statistics
+# -------------------------
+class ColumnStats:
+    """
+    Running statistics for one column, accumulated chunk by chunk:
+    count, nulls, sum, min/max, constant detection, approximate
+    quantiles (numeric) and value counts (categorical).
+    Stats from separate chunks or workers can be combined with merge().
+
+    Whether the column is numeric is decided by the first chunk that has
+    values in it (all-null chunks are read as float and say nothing). A
+    numeric column that later shows non-numeric values is demoted to
+    categorical; values seen before the switch are not in its counter.
+    """
+
+    def __init__(self, numeric=None):
+        self.numeric = None
+        self.kinds = set()  # dtype kinds of the numeric chunks ('b', 'i', 'u', 'f')
+        self.count = 0
+        self.nulls = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.first_value = None
+        self.constant = True
+        self.sketch = None
+        self.counter = None
+        if numeric is not None:
+            self._set_kind(numeric)
+
+    def _set_kind(self, numeric):
+        self.numeric = numeric
+        self.sketch = KLLSketch() if numeric else None
+        self.counter = None if numeric else Counter()
+
+    def _observe_kind(self, numeric):
+        if self.numeric is None:
+            self._set_kind(numeric)
+        elif self.numeric and not numeric:
+            self._set_kind(False)  # demote: numeric stats no longer apply
+
+    def update(self, series):
+        non_null = series.dropna()
+        self.count += len(non_null)
+        self.nulls += len(series) - len(non_null)
+        if not len(non_null):
+            return
+
+        numeric = pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype)
+        self._observe_kind(numeric)
+
+        if self.constant:
+            uniques = non_null.unique()
+            if self.first_value is None:
+                self.first_value = uniques[0]
+            if len(uniques) > 1 or uniques[0] != self.first_value:
+                self.constant = False
+
+        if self.numeric:
+            self.kinds.add(series.dtype.kind)
+            values = non_null.to_numpy(dtype="float64")
+            self.total += values.sum()
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+            self.sketch.update(values)
+        else:
+            self.counter.update(non_null.value_counts().to_dict())
+
+    def merge(self, other):
+        """Combine statistics gathered on another chunk or worker."""
+        self.count += other.count
+        self.nulls += other.nulls
+        if self.first_value is None:
+            self.first_value = other.first_value
+        elif other.first_value is not None and other.first_value != self.first_value:
+            self.constant = False
+        self.constant = self.constant and other.constant
+
+        if other.numeric is None:
+            return self
+        self._observe_kind(other.numeric)
+
+        if self.numeric:
+            self.kinds |= other.kinds
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self.sketch.merge(other.sketch)
+        elif other.counter:
+            self.counter.update(other.counter)
+        return self
+
+    def mean(self):
+        return self.total / self.count if self.count else np.nan
+
+    def median(self):
+        return self.sketch.quantile(0.5)
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def mode(self):
+        if not self.counter:
+            return None
+        return self.counter.most_common(1)[0][0]
+
+
+def _strip_column_names(chunk):
+    chunk.columns = [c.strip() if isinstance(c, str) else c for c in chunk.columns]
+    return chunk
+
+
+def _cast_chunk(chunk, schema):
+    for col, dtype in (schema or {}).items():
+        if col not in chunk.columns:
+            continue
+        if "datetime" in dtype:
+            chunk[col] = pd.to_datetime(chunk[col], errors="coerce")
+        else:
+            chunk[col] = chunk[col].astype(dtype)
+    return chunk
+
+
+_FINGERPRINT = np.dtype([("h1", "u8"), ("h2", "u8")])
+
+
+def _fingerprints(chunk, subset=None):
+    """128-bit canonical row fingerprints as one structured array (sortable)."""
+    pairs = row_fingerprints(chunk, subset, bits=128, canonical=True)
+    return np.ascontiguousarray(pairs).view(_FINGERPRINT).ravel()
+
+
+class FingerprintSet:
+    """
+    Set of row fingerprints kept as a few sorted numpy runs (16 bytes per
+    distinct row, no Python objects). Runs of similar size are merged as
+    they grow, so adding n fingerprints costs O(n log n) overall.
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def contains(self, values):
+        found = np.zeros(len(values), dtype=bool)
+        for run in self.runs:
+            pos = np.minimum(np.searchsorted(run, values), len(run) - 1)
+            found |= run[pos] == values
+        return found
+
+    def add(self, values):
+        if len(values):
+            self.runs.append(np.unique(values))
+        while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+            last = self.runs.pop()
+            self.runs[-1] = np.union1d(self.runs[-1], last)
+
+
+def _drop_seen_rows(chunk, seen):
+    """
+    Drop rows already seen in this or an earlier chunk. Rows are compared by
+    canonical 128-bit fingerprints, so the same row read with different
+    dtypes in different chunks (int vs float after a NaN) still matches.
+    """
+    fp = _fingerprints(chunk)
+    new = np.zeros(len(fp), dtype=bool)
+    new[np.unique(fp, return_index=True)[1]] = True  # first occurrence within the chunk
+    new &= ~seen.contains(fp)
+    seen.add(fp[new])
+    return chunk.loc[new]
+
+
+def collect_stats(path, *, chunksize=100_000, schema=None, drop_duplicates=True, guidance: GuidanceMode = "off", **read_kwargs):
+    """
+    First streaming pass: accumulate ColumnStats for every column.
+
+    Column names are stripped, `schema` casts are applied and (optionally)
+    duplicate rows are skipped before statistics are collected, so the
+    statistics match what clean_basic + clean_types would see.
+    """
+    stats = {}
+    seen = FingerprintSet()
+    rows = 0
+
+    for chunk in read_chunks(path, chunksize=chunksize, **read_kwargs):
+        chunk = _cast_chunk(_strip_column_names(chunk), schema)
+        if drop_duplicates:
+            chunk = _drop_seen_rows(chunk, seen)
+        rows += len(chunk)
+
+        for col in chunk.columns:
+            stats.setdefault(col, ColumnStats()).update(chunk[col])
+
+    say(f"📊 Pass 1 complete • {rows} row(s), {len(stats)} column(s) profiled", guidance)
+    return stats
+
+
+def _output_types(stats, dropped, fills, bounds):
+    """
+    Parquet types for the cleaned columns, from the pass-1 statistics, so
+    every output chunk gets the same schema whatever dtype pandas inferred
+    for it. Integer and bool columns stay so only when nothing is filled
+    or capped in them; other numeric columns are written as float64.
+    """
+    import pyarrow as pa
+
+    types = {}
+    for col, s in stats.items():
+        if col in dropped:
+            continue
+        if s.numeric:
+            lower, upper = bounds.get(col, (-np.inf, np.inf))
+            untouched = col not in fills and lower <= s.min and s.max <= upper
+            if untouched and s.kinds == {"b"}:
+                types[col] = pa.bool_()
+            elif untouched and s.kinds <= {"i", "u"}:
+                types[col] = pa.int64()
+            else:
+                types[col] = pa.float64()
+        elif all(isinstance(k, str) for k in (s.counter or {})) and isinstance(fills.get(col, ""), str):
+            types[col] = pa.string()
+    return types
+
+
+# -------------------------
+# Two-pass streaming clean
+# -------------------------
+def stream_clean(
+    input_path,
+    output_path,
+    *,
+    chunksize=100_000,
+    schema=None,
+    drop_constant=True,
+    drop_duplicates=True,
+    numeric_strategy="median",
+    cat_strategy="mode",
+    fill_value="Unknown",
+    cap_outliers=True,
+    factor=1.5,
+    guidance: GuidanceMode = "on",
+    **read_kwargs,
+):
+    """
+    Clean a CSV/Parquet file that does not fit in memory.
+
+    Streaming equivalent of:
+        clean_basic → clean_types → fill_missing_numeric
+        → fill_missing_categorical → cap_outliers_iqr
+
+    Pass 1 reads the file chunk by chunk and accumulates mergeable statistics
+    (counts, sums, KLL quantile sketches, value counters).
+    Pass 2 re-reads the file, applies those statistics to each chunk and
+    appends the result to output_path.
+
+    Memory is bounded by chunksize, plus one 128-bit fingerprint (16 bytes,
+    in a numpy FingerprintSet) per distinct row when drop_duplicates=True
+    and one counter entry per category.
+
+    IQR bounds and medians are approximate (KLL sketch, see
+    prepstack.sketch.KLLSketch for the error bound) and are computed
+    on the non-missing input values, before imputation.
+
+    Returns a report dict with the statistics that were applied.
+    """
+    if numeric_strategy not in ("mean", "median", "zero"):
+        raise ValueError(f"Unknown strategy '{numeric_strategy}' for numeric columns.")
+    if cat_strategy not in ("mode", "constant"):
+        raise ValueError(f"Unknown strategy '{cat_strategy}' for categorical columns.")
+
+    say(f"🌊 STREAMING CLEAN STARTED • {input_path} → {output_path} (chunksize={chunksize})", guidance)
+
+    stats = collect_stats(
+        input_path,
+        chunksize=chunksize,
+        schema=schema,
+        drop_duplicates=drop_duplicates,
+        guidance=guidance,
+        **read_kwargs,
+    )
+
+    dropped = [c for c, s in stats.items() if drop_constant and s.constant]
+    if dropped:
+        say(f"🚮 Dropping {len(dropped)} constant column(s): {dropped}", guidance)
+
+    fills, bounds = {}, {}
+    for col, s in stats.items():
+        if col in dropped:
+            continue
+
+        if s.numeric:
+            if s.nulls:
+                if numeric_strategy == "mean":
+                    fills[col] = s.mean()
+                elif numeric_strategy == "median":
+                    fills[col] = s.median()
+                else:
+                    fills[col] = 0
+            if cap_outliers and s.count:
+                q1, q3 = s.quantile(0.25), s.quantile(0.75)
+                iqr = q3 - q1
+                if iqr > 0:
+                    bounds[col] = (q1 - factor * iqr, q3 + factor * iqr)
+        elif s.nulls:
+            value = s.mode() if cat_strategy == "mode" else None
+            fills[col] = value if value is not None else fill_value
+
+    say(f"🔧 Imputing {len(fills)} column(s), capping {len(bounds)} column(s)", guidance)
+
+    seen = FingerprintSet()
+    capped = Counter()
+    types = _output_types(stats, dropped, fills, bounds) if _is_parquet(output_path) else None
+
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    with ChunkWriter(output_path, types=types) as writer:
+        for chunk in read_chunks(input_path, chunksize=chunksize, **read_kwargs):
+            chunk = _cast_chunk(_strip_column_names(chunk), schema)
+            if drop_duplicates:
+                chunk = _drop_seen_rows(chunk, seen)
+            chunk = chunk.drop(columns=[c for c in dropped if c in chunk.columns])
+
+            for col, v in fills.items():
+                if col in chunk.columns:
+                    chunk[col] = chunk[col].fillna(v)
+
+            for col, (lower, upper) in bounds.items():
+                if col in chunk.columns:
+                    outside = (chunk[col] < lower) | (chunk[col] > upper)
+                    capped[col] += int(outside.sum())
+                    chunk[col] = chunk[col].clip(lower, upper)
+
+            writer.write(chunk.reset_index(drop=True))
+
+    say(f"📦 Pass 2 complete • wrote {writer.rows} row(s)", guidance)
+    for col, n in capped.items():
+        if n:
+            say(f"  • Column '{col}': capped {n} value(s)", guidance)
+    say("✨ Streaming clean complete.", guidance)
+
+    return {
+        "rows_written": writer.rows,
+        "dropped_constant": dropped,
+        "fill_values": fills,
+        "iqr_bounds": bounds,
+        "capped": dict(capped),
+    }
+
+
+# -------------------------
+# Out-of-core deduplication
+# -------------------------
+def _widen_types(types, chunk):
+    """
+    Fold the pyarrow types of one chunk into {column: type}: int and float
+    chunks widen to float, all-null chunks take the other side's type and
+    incompatible types fall back to string.
+    """
+    import pyarrow as pa
+
+    for field in pa.Schema.from_pandas(chunk, preserve_index=False):
+        known = types.get(field.name)
+        if known is None or known == field.type:
+            types[field.name] = field.type
+            continue
+        try:
+            types[field.name] = pa.unify_schemas(
+                [pa.schema([pa.field("x", known)]), pa.schema([pa.field("x", field.type)])],
+                promote_options="permissive",
+            ).field("x").type
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            types[field.name] = pa.string()
+
+
+def stream_dedupe(
+    input_path,
+    output_path,
+    *,
+    subset=None,
+    keep="first",
+    chunksize=100_000,
+    n_partitions=16,
+    spill_dir=None,
+    guidance: GuidanceMode = "on",
+    **read_kwargs,
+):
+    """
+    Drop duplicate rows from a file larger than memory.
+
+    Pass 1 hashes every row (or `subset`) into a canonical 128-bit
+    fingerprint (the same row matches whatever dtype pandas inferred for
+    its chunk) and spills (fingerprint, row number) triples to
+    `n_partitions` files on disk, partitioned by fingerprint.
+    Each partition is then deduplicated on its own, marking duplicate row
+    numbers in an on-disk bitmap (1 byte per row). Rows whose first 64 bits
+    collide but whose full fingerprints differ are kept apart and counted.
+    Pass 2 re-reads the input and writes only the rows that are kept.
+
+    Memory is bounded by chunksize and by the size of one partition
+    (24 bytes per row / n_partitions), not by the file size.
+    Row order of the input is preserved. keep works like pandas.
+
+    Returns a dict with rows read, rows written, duplicates removed and
+    64-bit collisions that the full fingerprint told apart.
+    """
+    if keep not in ("first", "last", False):
+        raise ValueError("keep must be 'first', 'last' or False")
+
+    say(f"🧬 STREAMING DEDUPE STARTED • {input_path} → {output_path} ({n_partitions} partitions)", guidance)
+
+    workdir = tempfile.mkdtemp(prefix="prepstack-dedupe-", dir=spill_dir)
+    try:
+        parts = [os.path.join(workdir, f"part-{i}.bin") for i in range(n_partitions)]
+        files = [open(path, "ab") for path in parts]
+        total = 0
+
+        types = {} if _is_parquet(output_path) else None
+        try:
+            for chunk in read_chunks(input_path, chunksize=chunksize, **read_kwargs):
+                chunk = _strip_column_names(chunk)
+                if types is not None:
+                    _widen_types(types, chunk)
+                fp = _fingerprints(chunk, subset)
+                rows = np.arange(total, total + len(chunk), dtype="uint64")
+                part_of = fp["h1"] % np.uint64(n_partitions)
+                for i in np.unique(part_of):
+                    sel = part_of == i
+                    np.column_stack([fp["h1"][sel], fp["h2"][sel], rows[sel]]).tofile(files[int(i)])
+                total += len(chunk)
+        finally:
+            for f in files:
+                f.close()
+
+        say(f"💾 Pass 1 complete • {total} row(s) fingerprinted and spilled", guidance)
+
+        drop = np.memmap(os.path.join(workdir, "drop.bin"), dtype=bool, mode="w+", shape=(max(total, 1),))
+        collisions = 0
+        for path in parts:
+            triples = np.fromfile(path, dtype="uint64").reshape(-1, 3)
+            if len(triples) == 0:
+                continue
+            # rows are spilled in input order, so keep='first'/'last' follow row numbers
+            fingerprints = pd.DataFrame(triples[:, :2])
+            dup = fingerprints.duplicated(keep=keep).to_numpy()
+            drop[triples[dup, 2].astype(np.intp)] = True
+            distinct = fingerprints.loc[~fingerprints.duplicated()]
+            collisions += len(distinct) - distinct[0].nunique()
+            os.remove(path)
+        drop.flush()
+
+        removed = int(drop[:total].sum())
+        say(f"🔎 Found {removed} duplicate row(s)", guidance)
+        if collisions:
+            say(f"ℹ️ {collisions} 64-bit hash collision(s) were told apart by the full 128-bit fingerprint", guidance)
+
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+        start = 0
+        with ChunkWriter(output_path, types=types) as writer:
+            for chunk in read_chunks(input_path, chunksize=chunksize, **read_kwargs):
+                chunk = _strip_column_names(chunk)
+                keep_rows = ~np.asarray(drop[start:start + len(chunk)])
+                start += len(chunk)
+                writer.write(chunk.loc[keep_rows])
+
+        del drop
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    say(f"📦 Pass 2 complete • wrote {writer.rows} row(s)", guidance)
+    say("✨ Streaming dedupe complete.", guidance)
+
+    return {"rows_read": total, "rows_written": writer.rows, "duplicates_removed": removed, "collisions": collisions}
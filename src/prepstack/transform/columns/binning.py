@@ -1,8 +1,10 @@
 import pandas as pd
 
+from prepstack.helpers import working_copy
+
 def bin_equal_width(df, col, bins=4, labels=None, guidance="on"):
     """Equal-width binning."""
-    df = df.copy()
+    df = working_copy(df)
     df[col + "_bin"] = pd.cut(df[col], bins=bins, labels=labels)
 
     if guidance == "on":
@@ -13,7 +15,7 @@ def bin_equal_width(df, col, bins=4, labels=None, guidance="on"):
 
 def bin_equal_freq(df, col, bins=4, labels=None, guidance="on"):
     """Equal-frequency binning."""
-    df = df.copy()
+    df = working_copy(df)
     df[col + "_bin"] = pd.qcut(df[col], q=bins, labels=labels)
 
     if guidance == "on":
@@ -24,7 +26,7 @@ def bin_equal_freq(df, col, bins=4, labels=None, guidance="on"):
 
 def bin_custom(df, col, ranges, labels=None, guidance="on"):
     """Custom binning with ranges."""
-    df = df.copy()
+    df = working_copy(df)
     df[col + "_bin"] = pd.cut(df[col], bins=ranges, labels=labels, include_lowest=True)
 
     if guidance == "on":
@@ -1,13 +1,151 @@
+import warnings
+
+import numpy as np
 import pandas as pd
 
-def extract_date_parts(df, col, guidance="on"):
-    df = df.copy()
-    df[col] = pd.to_datetime(df[col], errors="coerce")
+from prepstack.helpers import working_copy
+
+DATE_PARTS = ("year", "month", "day", "weekday", "quarter", "dayofyear", "hour", "minute", "second")
+
+_NS_PER_DAY = 86_400 * 10**9
+
+# tried when pandas cannot guess a format from the first value
+_COMMON_FORMATS = (
+    "%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M",
+    "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y%m%d",
+    "%d/%m/%Y %H:%M:%S", "%m/%d/%Y %H:%M:%S",
+)
+
+
+def infer_date_format(series, sample_size=1000, min_share=0.95):
+    """
+    Guess a strftime format for a text date column from a sample of its
+    distinct values. The format that parses the largest share of the sample
+    wins; returns None when none parses at least min_share of it.
+    """
+    sample = pd.Series(series.dropna().unique()[:sample_size]).astype(str)
+    if sample.empty:
+        return None
+
+    candidates = []
+    try:
+        from pandas.tseries.api import guess_datetime_format
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for dayfirst in (False, True):
+                guessed = guess_datetime_format(sample.iloc[0], dayfirst=dayfirst)
+                if guessed and guessed not in candidates:
+                    candidates.append(guessed)
+    except ImportError:
+        pass
+    candidates += [fmt for fmt in _COMMON_FORMATS if fmt not in candidates]
+
+    best, best_share = None, 0.0
+    for fmt in candidates:
+        share = pd.to_datetime(sample, format=fmt, errors="coerce").notna().mean()
+        if share > best_share:
+            best, best_share = fmt, share
+        if share == 1.0:
+            break
+    return best if best_share >= min_share else None
+
+
+def parse_dates(series, format=None, cache=True, sample_size=1000):
+    """
+    Parse a column to datetime (invalid values → NaT).
+
+    - datetime columns are returned unchanged, nothing is reparsed
+    - text columns: the format is inferred once from a sample (unless
+      given) and then applied explicitly to every value
+    - cache=True parses each distinct string once and gathers the results
+      through the factorized codes (fast when values repeat)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_datetime(series, errors="coerce")
+
+    if format is None:
+        format = infer_date_format(series, sample_size)
+
+    if not cache:
+        return pd.to_datetime(series, format=format, errors="coerce")
+
+    codes, uniques = pd.factorize(series)
+    parsed = pd.DatetimeIndex(pd.to_datetime(pd.Index(uniques), format=format, errors="coerce"))
+    values = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _civil_from_days(days):
+    """(year, month, day) from days since 1970-01-01 (proleptic Gregorian)."""
+    z = days + 719468
+    era = np.floor_divide(z, 146097)
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _days_from_civil(year, month, day):
+    y = year - (month <= 2)
+    era = np.floor_divide(y, 400)
+    yoe = y - era * 400
+    mp = np.where(month > 2, month - 3, month + 9)
+    doy = (153 * mp + 2) // 5 + day - 1
+    return era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 719468
+
+
+def _date_parts(series, parts):
+    """Requested parts from one int64 nanosecond view of a datetime column."""
+    if getattr(series.dt, "tz", None) is not None:
+        series = series.dt.tz_localize(None)  # wall-clock parts, as .dt gives
+    ns = series.to_numpy(dtype="datetime64[ns]").view("int64")
+    missing = series.isna().to_numpy()
+
+    days = np.floor_divide(ns, _NS_PER_DAY)
+    out = {}
+    if {"year", "month", "day", "quarter", "dayofyear"} & set(parts):
+        year, month, day = _civil_from_days(days)
+        out.update(year=year, month=month, day=day, quarter=(month - 1) // 3 + 1)
+        if "dayofyear" in parts:
+            out["dayofyear"] = days - _days_from_civil(year, np.ones_like(year), np.ones_like(year)) + 1
+    out["weekday"] = (days + 3) % 7  # 1970-01-01 was a Thursday
+    in_day = ns - days * _NS_PER_DAY
+    out["hour"] = in_day // (3600 * 10**9)
+    out["minute"] = in_day // (60 * 10**9) % 60
+    out["second"] = in_day // 10**9 % 60
+
+    result = {}
+    for part in parts:
+        values = out[part].astype("int32")
+        # same dtypes as .dt: int32, float64 with NaN when there are NaT
+        result[part] = np.where(missing, np.nan, values) if missing.any() else values
+    return result
+
+
+def extract_date_parts(df, col, parts=None, format=None, cache=True, guidance="on"):
+    """
+    Parse col to datetime and add '<col>_<part>' columns.
+
+    parts: any of year, month, day, weekday, quarter, dayofyear, hour,
+    minute, second (default: year, month, day, weekday)
+    format / cache: see parse_dates
+    """
+    parts = list(parts) if parts is not None else ["year", "month", "day", "weekday"]
+    unknown = [p for p in parts if p not in DATE_PARTS]
+    if unknown:
+        raise ValueError(f"Unknown date part(s) {unknown}. Use any of {DATE_PARTS}.")
+
+    df = working_copy(df)
+    df[col] = parse_dates(df[col], format=format, cache=cache)
 
-    df[col + "_year"] = df[col].dt.year
-    df[col + "_month"] = df[col].dt.month
-    df[col + "_day"] = df[col].dt.day
-    df[col + "_weekday"] = df[col].dt.weekday
+    for part, values in _date_parts(df[col], parts).items():
+        df[col + "_" + part] = values
 
     if guidance == "on":
         print(f"📅 Extracted date parts from '{col}'")
@@ -15,11 +153,12 @@ def extract_date_parts(df, col, guidance="on"):
     return df
 
 
-def date_diff(df, start_col, end_col, new_col="date_diff", guidance="on"):
-    df = df.copy()
+def date_diff(df, start_col, end_col, new_col="date_diff", format=None, cache=True, guidance="on"):
+    df = working_copy(df)
 
-    df[start_col] = pd.to_datetime(df[start_col], errors="coerce")
-    df[end_col] = pd.to_datetime(df[end_col], errors="coerce")
+    # already-datetime columns pass straight through parse_dates
+    df[start_col] = parse_dates(df[start_col], format=format, cache=cache)
+    df[end_col] = parse_dates(df[end_col], format=format, cache=cache)
 
     df[new_col] = (df[end_col] - df[start_col]).dt.days
 
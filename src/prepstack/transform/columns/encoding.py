@@ -1,51 +1,369 @@
 import pandas as pd
 
+import numpy as np
+
+from prepstack.helpers import working_copy, is_categorical, category_counts, take_by_code
+from prepstack.parallel import map_columns
+from prepstack.fitted import FittedState, fit_onehot_encoder, plain_value
+
 def _print(guidance, *msgs):
     if guidance == "on":
         print(*msgs)
 
+
+def _label_codes(series, mapping=None):
+    mapping = mapping.get(series.name) if mapping else None
+
+    if is_categorical(series):
+        # the codes already are the labels; a given mapping is applied to the categories only
+        categories = series.cat.categories
+        if mapping is None:
+            return series.cat.codes.astype(int), {k: i for i, k in enumerate(categories)}
+        per_category = categories.map(mapping).to_series().fillna(-1).to_numpy(dtype=int)
+        return pd.Series(take_by_code(series, per_category, -1), index=series.index, name=series.name), mapping
+
+    if mapping is None:
+        cats = pd.Series(series.astype("category").cat.categories)
+        mapping = {k: i for i, k in enumerate(cats)}
+    return series.map(mapping).fillna(-1).astype(int), mapping
+
+
+def _frequency_codes(series):
+    if is_categorical(series):
+        counts = category_counts(series)
+        total = counts.sum()
+        per_category = counts / total if total else counts.astype(float)
+        return pd.Series(take_by_code(series, per_category, 0.0), index=series.index, name=series.name), len(counts)
+
+    freq = series.value_counts(normalize=True)
+    return series.map(freq).fillna(0.0), freq.shape[0]
+
 # -------------------------
 # One-hot encoding
 # -------------------------
-def one_hot_encode(df, columns, drop_first=True, prefix_sep="_", guidance="off"):
+def _onehot_positions(series, levels, with_other):
+    """Dummy column index per row (len(levels) = other bucket, -1 = none)."""
+    index = pd.Index(levels)
+    if is_categorical(series):
+        # look up the categories once and gather through the codes
+        per_category = index.get_indexer(series.cat.categories)
+        if with_other:
+            per_category = np.where(per_category < 0, len(levels), per_category)
+        return take_by_code(series, per_category, -1)
+
+    pos = index.get_indexer(series)
+    if with_other:
+        pos = np.where((pos < 0) & series.notna().to_numpy(), len(levels), pos)
+    return pos
+
+
+def _to_csr(positions, n_features):
+    """CSR matrix straight from the (rows x encoded columns) position block."""
+    try:
+        from scipy import sparse
+    except ImportError:
+        raise ImportError("scipy not installed. Install with pip install scipy")
+
+    valid = positions >= 0
+    indptr = np.concatenate([[0], np.cumsum(valid.sum(axis=1))])
+    # row-major order keeps indices sorted within each row, offsets grow per column
+    indices = positions[valid]
+    data = np.ones(indices.size, dtype=bool)
+    return sparse.csr_matrix((data, indices, indptr), shape=(positions.shape[0], n_features))
+
+
+def one_hot_encode(
+    df,
+    columns,
+    drop_first=True,
+    prefix_sep="_",
+    sparse=False,
+    output="pandas",
+    max_levels=None,
+    min_frequency=None,
+    other="other",
+    vocabulary=None,
+    guidance="off",
+):
     """
     One-hot encode specified categorical columns.
-    Returns a new DataFrame.
+    Returns a new DataFrame with the dummy columns appended.
+
+    sparse=True     : dummy columns are pandas sparse (requires scipy)
+    output="scipy"  : return (csr_matrix, feature_names) for the encoded
+                      columns only (requires scipy)
+    max_levels / min_frequency : keep only the most frequent levels and
+                      bucket the rest (and unseen values) into "<col>_<other>"
+    vocabulary      : FittedState from fit_onehot_encoder, so new data gets
+                      exactly the same columns
+
+    All columns are encoded in one shot from their level positions; the
+    frame is concatenated once.
     """
-    df = df.copy()
+    if output not in ("pandas", "scipy"):
+        raise ValueError("output must be 'pandas' or 'scipy'")
+
+    # df is only read; the result is a new frame built by one concat
     _print(guidance, f"🧩 ONE-HOT ENCODING STARTED • columns={columns} drop_first={drop_first}")
+
+    present = []
     for col in columns:
         if col not in df.columns:
             _print(guidance, f"⚠️ Column '{col}' not found — skipping.")
             continue
-        dummies = pd.get_dummies(df[col], prefix=col, drop_first=drop_first)
-        df = pd.concat([df.drop(columns=[col]), dummies], axis=1)
-        _print(guidance, f" → Encoded '{col}' with {dummies.shape[1]} columns")
+        present.append(col)
+
+    if vocabulary is None:
+        vocabulary = fit_onehot_encoder(df, present, max_levels=max_levels, min_frequency=min_frequency, other=other)
+    other = vocabulary.options.get("other")
+
+    names, blocks, offset = [], [], 0
+    for col in present:
+        levels = vocabulary.params[col]
+        labels = list(levels) + ([other] if other is not None else [])
+        pos = _onehot_positions(df[col], levels, other is not None)
+        if drop_first and labels:
+            labels = labels[1:]
+            pos = pos - 1  # the first level (and "none") fall below 0
+        names += [f"{col}{prefix_sep}{label}" for label in labels]
+        blocks.append(np.where(pos >= 0, pos + offset, -1))
+        offset += len(labels)
+        _print(guidance, f" → Encoded '{col}' with {len(labels)} columns")
+
+    positions = np.column_stack(blocks) if blocks else np.empty((len(df), 0), dtype=np.intp)
+
+    if output == "scipy":
+        _print(guidance, "✨ One-hot encoding complete.")
+        return _to_csr(positions, offset), names
+
+    if sparse:
+        dummies = pd.DataFrame.sparse.from_spmatrix(_to_csr(positions, offset), index=df.index, columns=names)
+    else:
+        dense = np.zeros((len(df), offset), dtype=bool)
+        rows, slots = np.nonzero(positions >= 0)
+        dense[rows, positions[rows, slots]] = True
+        dummies = pd.DataFrame(dense, index=df.index, columns=names)
+
+    df = pd.concat([df.drop(columns=present), dummies], axis=1)
     _print(guidance, "✨ One-hot encoding complete.")
     return df
 
+# -------------------------
+# Target encoding
+# -------------------------
+def _target_stats(series, y, folds, fold_prior, prior, n_splits, smoothing):
+    """Out-of-fold encoding per row and the full-data mapping for one column."""
+    if is_categorical(series):
+        codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+    k = len(uniques)
+
+    # target sum / row count per (fold, category), one bincount each
+    seen = codes >= 0
+    key = folds[seen] * k + codes[seen]
+    fold_sum = np.bincount(key, weights=y[seen], minlength=n_splits * k).reshape(n_splits, k)
+    fold_cnt = np.bincount(key, minlength=n_splits * k).reshape(n_splits, k)
+    total_sum, total_cnt = fold_sum.sum(axis=0), fold_cnt.sum(axis=0)
+
+    # statistics of the other folds, gathered per row
+    c, f = codes[seen], folds[seen]
+    oof_sum = total_sum[c] - fold_sum[f, c]
+    oof_cnt = total_cnt[c] - fold_cnt[f, c]
+
+    encoded = fold_prior[folds].copy()  # missing categories keep the fold prior
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = (oof_sum + smoothing * fold_prior[f]) / (oof_cnt + smoothing)
+    encoded[seen] = np.where(oof_cnt + smoothing > 0, values, fold_prior[f])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        full = (total_sum + smoothing * prior) / (total_cnt + smoothing)
+    mapping = {plain_value(u): float(v) for u, v in zip(uniques, np.where(total_cnt + smoothing > 0, full, prior))}
+    return encoded, mapping
+
+
+def target_encode(
+    df,
+    columns,
+    target,
+    n_splits=5,
+    smoothing=10.0,
+    random_state=42,
+    n_jobs=1,
+    backend="threads",
+    guidance="off",
+):
+    """
+    Out-of-fold target encoding with smoothing.
+
+    Adds '<col>_target' = (sum_y + smoothing * prior) / (count + smoothing)
+    for each column. Every row is encoded with statistics from the other
+    folds only, so a row never sees its own target. prior is the target
+    mean of those folds; missing categories get the prior.
+
+    n_splits     : number of random folds (>= 2)
+    smoothing    : weight of the prior; rare categories shrink towards it
+    n_jobs / backend : encode columns on several workers
+                   (see prepstack.parallel.map_columns)
+
+    Per-fold sums and counts come from one bincount per column, and rows
+    gather their values through the category codes.
+
+    Returns (df, state): state is a FittedState('target') with the
+    full-data mapping; apply it to new data with apply_fitted.
+    """
+    if n_splits < 2:
+        raise ValueError("n_splits must be at least 2")
+
+    y = df[target].to_numpy(dtype="float64", na_value=np.nan)
+    if np.isnan(y).any():
+        raise ValueError(f"Target '{target}' contains missing values.")
+
+    df = working_copy(df)
+    _print(guidance, f"🎯 TARGET ENCODING STARTED • columns={columns} n_splits={n_splits} smoothing={smoothing}")
+
+    n = len(y)
+    folds = np.random.default_rng(random_state).permutation(n) % n_splits
+    fold_y = np.bincount(folds, weights=y, minlength=n_splits)
+    fold_n = np.bincount(folds, minlength=n_splits)
+    prior = float(y.mean()) if n else np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fold_prior = (y.sum() - fold_y) / (n - fold_n)
+
+    present = []
+    for col in columns:
+        if col not in df.columns:
+            _print(guidance, f"⚠️ Column '{col}' not found — skipping.")
+            continue
+        present.append(col)
+
+    results = map_columns(
+        _target_stats, df, present, n_jobs=n_jobs, backend=backend,
+        y=y, folds=folds, fold_prior=fold_prior, prior=prior, n_splits=n_splits, smoothing=smoothing,
+    )
+
+    params = {}
+    for col in present:
+        encoded, params[col] = results[col]
+        df[col + "_target"] = encoded
+        _print(guidance, f" → Added '{col}_target' (categories={len(params[col])})")
+
+    _print(guidance, "✨ Target encoding complete.")
+    return df, FittedState("target", params, {"prior": prior, "smoothing": smoothing})
+
+
+# -------------------------
+# Hash encoding
+# -------------------------
+def _value_keys(uniques):
+    """
+    Text form of each distinct value for hashing. Whole floats print as
+    ints (1.0 → "1"), so a column hashes the same whether it was read as
+    int or as float because of missing values.
+    """
+    index = pd.Index(uniques)
+    keys = index.astype(str).to_numpy(dtype=object)
+    if pd.api.types.is_float_dtype(index):
+        values = index.to_numpy(dtype="float64")
+    elif index.dtype == object:
+        # mixed object columns: only the float entries are rewritten
+        is_float = np.fromiter((isinstance(v, (float, np.floating)) for v in index), dtype=bool, count=len(index))
+        if not is_float.any():
+            return keys
+        values = np.full(len(index), np.nan)
+        values[is_float] = index[is_float].to_numpy(dtype="float64")
+    else:
+        return keys
+
+    whole = np.isfinite(values) & (np.abs(values) < 2**63) & (values == np.floor(values))
+    keys[whole] = values[whole].astype(np.int64).astype(str)
+    return keys
+
+
+def _hash_values(series, col):
+    """Stable 64-bit hash of "col=value" per row (0 for missing values)."""
+    if is_categorical(series):
+        codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+
+    # only the distinct values are hashed, rows gather through the codes
+    keys = (f"{col}=" + _value_keys(uniques)).astype(object)
+    hashed = pd.util.hash_array(keys)
+    return np.append(hashed, np.uint64(0))[codes], codes >= 0
+
+
+def hash_encode(df, columns, n_features=2**20, alternate_sign=True, dtype=np.float64, guidance="off"):
+    """
+    Feature hashing for unbounded categorical vocabularies (user agents,
+    URLs, SKUs). Every "column=value" pair is hashed into one of n_features
+    slots, so there is no vocabulary to fit or store and new values need
+    no refit.
+
+    alternate_sign: give each pair a hash-derived ±1 sign so collisions
+                    tend to cancel out instead of piling up
+    Missing values add nothing. Hashes are stable across runs and
+    processes (pandas hash_array with its fixed key) and across dtype
+    changes: whole floats hash like the matching ints.
+
+    Returns a scipy.sparse CSR matrix of shape (rows, n_features).
+    """
+    try:
+        from scipy import sparse
+    except ImportError:
+        raise ImportError("scipy not installed. Install with pip install scipy")
+
+    _print(guidance, f"#️⃣ HASH ENCODING STARTED • columns={columns} n_features={n_features}")
+
+    slots, signs, valid = [], [], []
+    for col in columns:
+        if col not in df.columns:
+            _print(guidance, f"⚠️ Column '{col}' not found — skipping.")
+            continue
+        hashed, present = _hash_values(df[col], col)
+        slots.append((hashed % np.uint64(n_features)).astype(np.int64))
+        signs.append(np.where(hashed >> np.uint64(63), -1.0, 1.0) if alternate_sign else np.ones(len(df)))
+        valid.append(present)
+        _print(guidance, f" → Hashed '{col}'")
+
+    n_rows = len(df)
+    if not slots:
+        return sparse.csr_matrix((n_rows, n_features), dtype=dtype)
+
+    slots, signs, valid = np.column_stack(slots), np.column_stack(signs), np.column_stack(valid)
+    indptr = np.concatenate([[0], np.cumsum(valid.sum(axis=1))])
+    matrix = sparse.csr_matrix(
+        (signs[valid].astype(dtype), slots[valid], indptr), shape=(n_rows, n_features)
+    )
+    # columns that collide within a row are added together
+    matrix.sum_duplicates()
+
+    _print(guidance, "✨ Hash encoding complete.")
+    return matrix
+
+
 # -------------------------
 # Label encoding (simple)
 # -------------------------
-def label_encode(df, columns, mapping=None, guidance="off"):
+def label_encode(df, columns, mapping=None, n_jobs=1, backend="threads", guidance="off"):
     """
     Label encode columns. If mapping provided (dict col -> dict), use that mapping.
     Otherwise create mapping automatically.
+    n_jobs / backend: encode columns on several workers (see prepstack.parallel.map_columns)
     Returns (df, mappings)
     """
-    df = df.copy()
+    df = working_copy(df)
     mappings = {}
     _print(guidance, f"🔢 LABEL ENCODING STARTED • columns={columns}")
+    results = map_columns(
+        _label_codes, df, [col for col in columns if col in df.columns], n_jobs=n_jobs, backend=backend, mapping=mapping
+    )
+
     for col in columns:
         if col not in df.columns:
             _print(guidance, f"⚠️ Column '{col}' not found — skipping.")
             continue
-        if mapping and col in mapping:
-            mp = mapping[col]
-        else:
-            cats = pd.Series(df[col].astype("category").cat.categories)
-            mp = {k: i for i, k in enumerate(cats)}
-        df[col] = df[col].map(mp).fillna(-1).astype(int)
+        df[col], mp = results[col]
         mappings[col] = mp
         _print(guidance, f" → Created mapping for '{col}': {list(mp.items())[:6]}{'...' if len(mp)>6 else ''}")
     _print(guidance, "✨ Label encoding complete.")
@@ -54,41 +372,43 @@ def label_encode(df, columns, mapping=None, guidance="off"):
 # -------------------------
 # Frequency encoding
 # -------------------------
-def frequency_encode(df, columns, guidance="off"):
+def frequency_encode(df, columns, n_jobs=1, backend="threads", guidance="off"):
     """
     Replace categories with their frequency (proportion) in each column.
+    n_jobs / backend: encode columns on several workers (see prepstack.parallel.map_columns)
     """
-    df = df.copy()
+    df = working_copy(df)
     _print(guidance, f"📊 FREQUENCY ENCODING STARTED • columns={columns}")
+    results = map_columns(
+        _frequency_codes, df, [col for col in columns if col in df.columns], n_jobs=n_jobs, backend=backend
+    )
     for col in columns:
         if col not in df.columns:
             _print(guidance, f"⚠️ Column '{col}' not found — skipping.")
             continue
-        freq = df[col].value_counts(normalize=True)
-        df[col + "_freq"] = df[col].map(freq).fillna(0.0)
-        _print(guidance, f" → Added '{col}_freq' (unique={freq.shape[0]})")
+        df[col + "_freq"], n_unique = results[col]
+        _print(guidance, f" → Added '{col}_freq' (unique={n_unique})")
     _print(guidance, "✨ Frequency encoding complete.")
     return df
 
-import pandas as pd
 
 def encode_category(
     df,
     columns,
     method="onehot",
     drop_first=False,
+    sparse=False,
     guidance="on"
 ):
     """
     Encode categorical columns.
 
     Methods:
-    - onehot
+    - onehot (sparse=True gives pandas sparse dummy columns)
     - label
     - frequency
     """
 
-    df = df.copy()
     mappings = {}
 
     if guidance == "on":
@@ -96,15 +416,19 @@ def encode_category(
         print(f" • Columns: {columns}")
         print(f" • Method: {method}")
 
-    for col in columns:
-        if method == "onehot":
-            dummies = pd.get_dummies(df[col], prefix=col, drop_first=drop_first)
-            df = pd.concat([df.drop(columns=[col]), dummies], axis=1)
-
-            if guidance == "on":
+    if method == "onehot":
+        # all columns in one pass instead of a concat per column
+        df = one_hot_encode(df, columns, drop_first=drop_first, sparse=sparse)
+        if guidance == "on":
+            for col in columns:
                 print(f" → One-hot encoded '{col}'")
+        columns = []
+    else:
+        # one_hot_encode builds a new frame; only label / frequency write into df
+        df = working_copy(df)
 
-        elif method == "label":
+    for col in columns:
+        if method == "label":
             codes, uniques = pd.factorize(df[col])
             df[col] = codes
             mappings[col] = dict(enumerate(uniques))
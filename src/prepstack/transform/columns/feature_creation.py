@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from prepstack.helpers import working_copy
+
 def _print(guidance, *msgs):
     if guidance == "on":
         print(*msgs)
@@ -12,7 +14,7 @@ def add_ratio(df, numerator, denominator, new_name=None, fill_na=None, guidance=
     """
     Add ratio feature numerator / denominator; optional fill_na (numeric)
     """
-    df = df.copy()
+    df = working_copy(df)
     new_name = new_name or f"{numerator}_over_{denominator}"
     _print(guidance, f"➗ Creating ratio feature '{new_name}' = {numerator}/{denominator}")
     with np.errstate(divide='ignore', invalid='ignore'):
@@ -30,7 +32,7 @@ def add_interaction(df, cols, new_name=None, func=None, guidance="off"):
     Create interaction feature from cols list.
     default func = product; can pass any function that accepts DataFrame and returns Series.
     """
-    df = df.copy()
+    df = working_copy(df)
     if func is None:
         def prod(df_local):
             out = df_local[cols[0]].astype(float)
@@ -46,54 +48,202 @@ def add_interaction(df, cols, new_name=None, func=None, guidance="off"):
 # -------------------------
 # Rolling aggregate (time-series style)
 # -------------------------
-def rolling_aggregate(df, groupby_cols, target_col, window=3, agg="mean", sort_by=None, new_name=None, guidance="off"):
+ROLLING_AGGS = ("mean", "sum", "count", "median", "max", "min")
+
+
+def _group_order(df, groupby_cols, sort_by):
+    """Group codes and the row order sorted by group, then sort_by (stable)."""
+    codes = df.groupby(groupby_cols, sort=False).ngroup().fillna(-1).to_numpy(dtype=np.intp)
+    if sort_by:
+        return codes, np.lexsort((df[sort_by].to_numpy(), codes))
+    return codes, np.argsort(codes, kind="stable")
+
+
+def _window_starts(codes, times, window):
+    """
+    First sorted position of each row's window. Rows are sorted by group
+    (codes) and time. Count windows cover the last `window` rows of the
+    group; time windows cover (t - window, t] like pandas.
+    """
+    n = len(codes)
+    pos = np.arange(n)
+    seg_start = np.r_[0, np.flatnonzero(np.diff(codes)) + 1]
+    row_seg_start = np.repeat(seg_start, np.diff(np.r_[seg_start, n]))
+
+    if times is None:
+        return np.maximum(row_seg_start, pos - window + 1)
+
+    # merge rows with their queries (t - window): the number of rows sorted
+    # before a query is the index of the first row inside its window
+    is_query = np.r_[np.zeros(n, dtype=bool), np.ones(n, dtype=bool)]
+    order = np.lexsort((is_query, np.r_[times, times - window], np.r_[codes, codes]))
+    rows_before = np.cumsum(~is_query[order])
+    starts = np.empty(n, dtype=np.intp)
+    queries = is_query[order]
+    starts[order[queries] - n] = rows_before[queries]
+    return starts
+
+
+def _rolling_sum_count(x, starts):
+    valid = ~np.isnan(x)
+    csum = np.r_[0.0, np.cumsum(np.where(valid, x, 0.0))]
+    ccount = np.r_[0, np.cumsum(valid)]
+    ends = np.arange(1, len(x) + 1)
+    return csum[ends] - csum[starts], ccount[ends] - ccount[starts]
+
+
+def _rolling_extreme(x, starts, op):
+    """
+    Windowed min/max by doubling: level j holds op over x[i : i + 2**j], and
+    each window is covered by two overlapping blocks of its level.
+    """
+    pos = np.arange(len(x))
+    level_of = np.log2(pos - starts + 1).astype(np.intp)
+    out = np.empty(len(x))
+    level = x
+    for j in range(int(level_of.max()) + 1 if len(x) else 0):
+        if j:
+            step = 1 << (j - 1)
+            level = op(level[:-step], level[step:])
+        rows = np.flatnonzero(level_of == j)
+        out[rows] = op(level[starts[rows]], level[pos[rows] - (1 << j) + 1])
+    return out
+
+
+def _rolling_median(x, starts):
+    """
+    Windowed median through pandas' skiplist rolling median, with the
+    precomputed window bounds (O(n log width), NaN skipped).
+    """
+    from pandas.api.indexers import BaseIndexer
+
+    class _Bounds(BaseIndexer):
+        def get_window_bounds(self, num_values=0, min_periods=None, center=None, closed=None, step=None):
+            return self.starts.astype(np.int64), np.arange(1, num_values + 1, dtype=np.int64)
+
+    # starts never decrease in group-sorted order, as the skiplist needs
+    return pd.Series(x).rolling(_Bounds(starts=starts), min_periods=1).median().to_numpy()
+
+
+def rolling_aggregate(df, groupby_cols, target_col, window=3, agg="mean", sort_by=None, new_name=None,
+                      min_periods=1, guidance="off"):
     """
     Compute rolling aggregate within groups.
     - groupby_cols: list
     - target_col: column to aggregate
-    - window: int (periods)
-    - agg: 'mean'|'sum'|'median'|'max'|'min'
+    - window: int (periods) or a time offset such as "7D" (needs a datetime sort_by)
+    - agg: 'mean'|'sum'|'count'|'median'|'max'|'min', or a list of them
     - sort_by: optional column to sort within groups (e.g. date)
+    - min_periods: minimum non-null values in a window, else NaN
+
+    Rows are sorted once by group + sort_by. Sums, means and counts come
+    from cumulative sums over the sorted values, min/max from a doubling
+    range table and medians from one skiplist pass, so no Python runs per
+    group. Rows without a sort_by time get NaN for time-based windows. Results are returned in the original row order.
     """
-    df = df.copy()
-    if sort_by:
-        df = df.sort_values(sort_by)
-    new_name = new_name or f"{target_col}_rolling_{window}_{agg}"
+    df = working_copy(df)
+    aggs = [agg] if isinstance(agg, str) else list(agg)
+    for a in aggs:
+        if a not in ROLLING_AGGS:
+            raise ValueError("Unknown agg")
+
     _print(guidance, f"🔁 Rolling aggregate on '{target_col}' grouped by {groupby_cols}, window={window}, agg={agg}")
-    grouped = df.groupby(groupby_cols)[target_col]
-    if agg == "mean":
-        df[new_name] = grouped.transform(lambda x: x.rolling(window, min_periods=1).mean())
-    elif agg == "sum":
-        df[new_name] = grouped.transform(lambda x: x.rolling(window, min_periods=1).sum())
-    elif agg == "median":
-        df[new_name] = grouped.transform(lambda x: x.rolling(window, min_periods=1).median())
-    elif agg == "max":
-        df[new_name] = grouped.transform(lambda x: x.rolling(window, min_periods=1).max())
-    elif agg == "min":
-        df[new_name] = grouped.transform(lambda x: x.rolling(window, min_periods=1).min())
+
+    codes, order = _group_order(df, groupby_cols, sort_by)
+    if isinstance(window, (int, np.integer)):
+        starts = _window_starts(codes[order], None, int(window))
     else:
-        raise ValueError("Unknown agg")
+        if not sort_by:
+            raise ValueError("Time-based windows need sort_by (a datetime column)")
+        times = df[sort_by].to_numpy(dtype="datetime64[ns]").view("int64")
+        no_time = df[sort_by].isna().to_numpy()
+        if no_time.any():
+            # NaT fits no time window: park those rows with the missing keys
+            # (NaN result) so they stay out of every other row's window
+            codes = np.where(no_time, -1, codes)
+            times = np.where(no_time, 0, times)
+            order = np.lexsort((times, codes))
+        starts = _window_starts(codes[order], times[order], pd.Timedelta(window).value)
+
+    x = df[target_col].to_numpy(dtype="float64", na_value=np.nan)[order]
+    total, count = _rolling_sum_count(x, starts)
+    enough = count >= min_periods
+
+    for a in aggs:
+        if a == "count":
+            values = count.astype("float64")
+        elif a == "sum":
+            values = np.where(enough, total, np.nan)
+        elif a == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                values = np.where(enough, total / count, np.nan)
+        elif a == "max":
+            values = np.where(enough, _rolling_extreme(x, starts, np.fmax), np.nan)
+        elif a == "min":
+            values = np.where(enough, _rolling_extreme(x, starts, np.fmin), np.nan)
+        else:
+            values = np.where(enough, _rolling_median(x, starts), np.nan)
+
+        result = np.empty(len(df))
+        result[order] = values
+        result[codes < 0] = np.nan  # rows with a missing group key
+
+        name = new_name if new_name and len(aggs) == 1 else f"{target_col}_rolling_{window}_{a}"
+        df[name] = result
+        _print(guidance, f" → Added '{name}'")
+
     return df
 
 # -------------------------
-# Group aggregate features (agg + merge)
+# Group aggregate features (one groupby + gather)
 # -------------------------
-def group_aggregate(df, groupby_cols, target_col, agg="mean", new_name=None, guidance="off"):
+GROUP_AGGS = ("mean", "sum", "median", "count", "min", "max", "std", "nunique")
+
+
+def _gather(values, codes):
+    """values[codes], with NaN where the group code is -1 (missing key)."""
+    if (codes < 0).any():
+        values = np.append(values.astype("float64"), np.nan)
+    return values[codes]
+
+
+def group_aggregate(df, groupby_cols, target_col=None, agg="mean", new_name=None, aggs=None, guidance="off"):
     """
-    Create group-level aggregate and merge back to original df.
+    Add group-level aggregates as columns, aligned to the original rows.
+
+    Single aggregate : group_aggregate(df, "store", "sales", agg="sum")
+    Many at once     : group_aggregate(df, ["store", "day"],
+                                       aggs=[("sales", "sum"), ("price", "mean")])
+                       or aggs={"store_sales": ("sales", "sum"), ...}
+    agg: 'mean'|'sum'|'median'|'count'|'min'|'max'|'std'|'nunique'
+    Default column names are '<target_col>_group_<agg>'.
+
+    All aggregates come from one groupby pass and are broadcast back through
+    the group codes, so there is no merge: row order and index are kept.
+    Rows with a missing group key get NaN.
     """
-    df = df.copy()
-    new_name = new_name or f"{target_col}_group_{agg}"
-    _print(guidance, f"📐 Group aggregate '{new_name}' grouping by {groupby_cols} using {agg}")
-    if agg == "mean":
-        agg_df = df.groupby(groupby_cols)[target_col].mean().reset_index().rename(columns={target_col: new_name})
-    elif agg == "sum":
-        agg_df = df.groupby(groupby_cols)[target_col].sum().reset_index().rename(columns={target_col: new_name})
-    elif agg == "median":
-        agg_df = df.groupby(groupby_cols)[target_col].median().reset_index().rename(columns={target_col: new_name})
-    elif agg == "count":
-        agg_df = df.groupby(groupby_cols)[target_col].count().reset_index().rename(columns={target_col: new_name})
-    else:
-        raise ValueError("Unknown agg")
-    df = df.merge(agg_df, on=groupby_cols, how="left")
+    df = working_copy(df)
+
+    if aggs is None:
+        if target_col is None:
+            raise ValueError("Pass target_col or aggs")
+        aggs = {new_name or f"{target_col}_group_{agg}": (target_col, agg)}
+    elif not isinstance(aggs, dict):
+        aggs = {f"{col}_group_{a}": (col, a) for col, a in aggs}
+
+    for col, a in aggs.values():
+        if a not in GROUP_AGGS:
+            raise ValueError("Unknown agg")
+
+    _print(guidance, f"📐 Group aggregate {list(aggs)} grouping by {groupby_cols}")
+
+    grouped = df.groupby(groupby_cols, sort=False)
+    codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+    # ngroup numbers groups in the same order agg returns them (sort=False)
+    table = grouped.agg(**aggs)
+
+    for name in aggs:
+        df[name] = _gather(table[name].to_numpy(), codes)
+        _print(guidance, f" → Added '{name}'")
+
     return df
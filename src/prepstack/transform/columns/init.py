@@ -7,3 +7,4 @@ from .string_ops import strip_whitespace, to_lower
 from .string_ops import clean_strings
 from .encoding import encode_category
 from .scaling import scale_numeric
+from .temporal import temporal_features
@@ -1,10 +1,13 @@
 import re
 
+from prepstack.helpers import working_copy
+
+
 def rename_columns(df, mapping=None, prefix=None, suffix=None, style=None, guidance="on"):
     """
     Flexible column renamer.
     """
-    df = df.copy()
+    df = working_copy(df)
 
     old_cols = df.columns.tolist()
 
@@ -1,9 +1,20 @@
 import numpy as np
 
-def minmax_scale(df, col, guidance="on"):
-    df = df.copy()
+from prepstack.helpers import working_copy
+
+
+def _minmax_column(df, col):
     df[col + "_scaled"] = (df[col] - df[col].min()) / (df[col].max() - df[col].min())
 
+
+def _standard_column(df, col):
+    df[col + "_scaled"] = (df[col] - df[col].mean()) / df[col].std()
+
+
+def minmax_scale(df, col, guidance="on"):
+    df = working_copy(df)
+    _minmax_column(df, col)
+
     if guidance == "on":
         print(f"📏 MinMax scaled '{col}'")
 
@@ -11,8 +22,8 @@ def minmax_scale(df, col, guidance="on"):
 
 
 def standard_scale(df, col, guidance="on"):
-    df = df.copy()
-    df[col + "_scaled"] = (df[col] - df[col].mean()) / df[col].std()
+    df = working_copy(df)
+    _standard_column(df, col)
 
     if guidance == "on":
         print(f"📐 Standard-scaled '{col}'")
@@ -28,7 +39,7 @@ def scale_numeric(df, cols, method="standard", guidance="on"):
     - minmax
     """
 
-    df = df.copy()
+    df = working_copy(df)
 
     if isinstance(cols, str):
         cols = [cols]
@@ -38,10 +49,10 @@ def scale_numeric(df, cols, method="standard", guidance="on"):
 
     for col in cols:
         if method == "standard":
-            df = standard_scale(df, col, guidance="off")
+            _standard_column(df, col)
 
         elif method == "minmax":
-            df = minmax_scale(df, col, guidance="off")
+            _minmax_column(df, col)
 
         else:
             raise ValueError("Unknown scaling method")
@@ -1,20 +1,114 @@
 import pandas as pd
 
-def strip_whitespace(df, columns=None, guidance="off"):
+from prepstack.helpers import working_copy, take_by_code
+from prepstack.parallel import map_columns
+
+
+def _arrow_compute():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+    return pa, pc
+
+
+def _value_cleaner(strip, lower, upper):
+    """One Python function applying the selected str methods in a single call."""
+    ops = [op for flag, op in ((strip, str.strip), (lower, str.lower), (upper, str.upper)) if flag]
+    if len(ops) == 1:
+        op = ops[0]
+        return lambda value: op(str(value))
+    if len(ops) == 2:
+        first, second = ops
+        return lambda value: second(first(str(value)))
+
+    def clean(value):
+        value = str(value)
+        for op in ops:
+            value = op(value)
+        return value
+    return clean
+
+
+def _clean_arrow(series, strip, lower, upper):
+    """Arrow compute kernels on a string column, or None if they do not apply."""
+    arrow = _arrow_compute()
+    if arrow is None or not (series.dtype == object or isinstance(series.dtype, pd.StringDtype)):
+        return None
+    pa, pc = arrow
+
+    try:
+        arr = pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None  # mixed object column
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return None
+
+    if strip:
+        arr = pc.utf8_trim_whitespace(arr)
+    if lower:
+        arr = pc.utf8_lower(arr)
+    if upper:
+        arr = pc.utf8_upper(arr)
+
+    # string columns keep their dtype, object columns come back Arrow-backed
+    dtype = series.dtype if isinstance(series.dtype, pd.StringDtype) else "string[pyarrow]"
+    return pd.Series(pd.array(arr, dtype=dtype), index=series.index, name=series.name)
+
+
+def _clean_categorical(series, strip, lower, upper):
+    """Clean only the categories and remap the existing codes."""
+    cleaned = _clean(pd.Series(series.cat.categories), strip, lower, upper)
+    # cleaning can merge categories (" A" and "a"), so factorize the result
+    remap, categories = pd.factorize(cleaned)
+    codes = take_by_code(series, remap, -1)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories, ordered=series.cat.ordered),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def _clean(series, strip=False, lower=False, upper=False):
+    """
+    Fused strip / lower / upper for one column, nulls preserved.
+    Categoricals transform their categories only, string columns use Arrow
+    kernels when pyarrow is installed, everything else one Python pass.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return _clean_categorical(series, strip, lower, upper)
+
+    out = _clean_arrow(series, strip, lower, upper)
+    if out is not None:
+        return out
+
+    out = series.map(_value_cleaner(strip, lower, upper), na_action="ignore")
+    return out.astype(series.dtype) if isinstance(series.dtype, pd.StringDtype) else out
+
+
+def strip_whitespace(df, columns=None, n_jobs=1, backend="threads", guidance="off"):
     """
     Remove leading/trailing whitespace from string columns.
+    Missing values stay missing and categorical columns only clean their
+    categories. With pyarrow installed, string and object text columns use
+    Arrow compute kernels (object columns come back as string[pyarrow]).
+    n_jobs / backend: clean columns on several workers; the Arrow kernels
+    release the GIL, the pure-Python fallback scales with "processes".
     """
-    df = df.copy()
+    df = working_copy(df)
 
     if columns is None:
-        columns = df.select_dtypes(include=["object"]).columns.tolist()
+        columns = df.select_dtypes(include=["object", "string", "category"]).columns.tolist()
 
     if guidance == "on":
         print("✨ STRING WHITESPACE CLEANING STARTED")
         print(f" • Columns: {columns}")
 
+    cleaned = map_columns(_clean, df, columns, n_jobs=n_jobs, backend=backend, strip=True)
+
     for col in columns:
-        df[col] = df[col].astype(str).str.strip()
+        df[col] = cleaned[col]
         if guidance == "on":
             print(f" → Stripped whitespace from '{col}'")
 
@@ -24,21 +118,24 @@ def strip_whitespace(df, columns=None, guidance="off"):
     return df
 
 
-def to_lower(df, columns=None, guidance="off"):
+def to_lower(df, columns=None, n_jobs=1, backend="threads", guidance="off"):
     """
     Convert string columns to lowercase.
+    Nulls, categoricals, Arrow and n_jobs / backend: see strip_whitespace.
     """
-    df = df.copy()
+    df = working_copy(df)
 
     if columns is None:
-        columns = df.select_dtypes(include=["object"]).columns.tolist()
+        columns = df.select_dtypes(include=["object", "string", "category"]).columns.tolist()
 
     if guidance == "on":
         print("🔡 LOWERCASE TRANSFORMATION STARTED")
         print(f" • Columns: {columns}")
 
+    lowered = map_columns(_clean, df, columns, n_jobs=n_jobs, backend=backend, lower=True)
+
     for col in columns:
-        df[col] = df[col].astype(str).str.lower()
+        df[col] = lowered[col]
         if guidance == "on":
             print(f" → Converted '{col}' to lowercase")
 
@@ -55,6 +152,8 @@ def clean_strings(
     strip=True,
     lower=True,
     upper=False,
+    n_jobs=1,
+    backend="threads",
     guidance="on"
 ):
     """
@@ -64,29 +163,31 @@ def clean_strings(
     - strip: remove leading/trailing whitespace
     - lower: convert to lowercase
     - upper: convert to uppercase (mutually exclusive with lower)
+    - n_jobs / backend: clean columns on several workers (see strip_whitespace)
+
+    All selected operations run as one fused pass per column; nulls are
+    preserved and categoricals only transform their categories.
     """
 
-    df = df.copy()
+    df = working_copy(df)
 
     if guidance == "on":
         print("🧹 STRING CLEANING STARTED")
         print(f" • Columns: {columns}")
 
+    cleaned = map_columns(_clean, df, columns, n_jobs=n_jobs, backend=backend, strip=strip, lower=lower, upper=upper)
+
     for col in columns:
-        if strip:
-            df[col] = df[col].astype(str).str.strip()
-            if guidance == "on":
-                print(f" → Stripped whitespace: {col}")
-
-        if lower:
-            df[col] = df[col].str.lower()
-            if guidance == "on":
-                print(f" → Lowercased: {col}")
-
-        if upper:
-            df[col] = df[col].str.upper()
-            if guidance == "on":
-                print(f" → Uppercased: {col}")
+        df[col] = cleaned[col]
+
+        if strip and guidance == "on":
+            print(f" → Stripped whitespace: {col}")
+
+        if lower and guidance == "on":
+            print(f" → Lowercased: {col}")
+
+        if upper and guidance == "on":
+            print(f" → Uppercased: {col}")
 
     if guidance == "on":
         print("✨ String cleaning complete.")
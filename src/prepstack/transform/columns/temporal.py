@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+from .feature_creation import _group_order
+
+EXPANDING_AGGS = ("mean", "sum", "count", "min", "max")
+
+
+def _print(guidance, *msgs):
+    if guidance == "on":
+        print(*msgs)
+
+
+def _shift(x, seg_start, seg_end, k):
+    """Grouped shift on sorted values: x[i - k] within the same group, else NaN."""
+    src = np.arange(len(x)) - k
+    ok = (src >= seg_start) & (src < seg_end)
+    out = np.full(len(x), np.nan)
+    out[ok] = x[src[ok]]
+    return out
+
+
+def _expanding(x, codes, seg_start, agg):
+    """Expanding aggregate per group on sorted values (NaN values skipped)."""
+    valid = ~np.isnan(x)
+    if agg in ("sum", "mean", "count"):
+        csum = np.cumsum(np.where(valid, x, 0.0))
+        ccount = np.cumsum(valid)
+        first = seg_start == np.arange(len(x))
+        # subtract everything accumulated before the row's group started
+        base_sum = np.where(first, csum - np.where(valid, x, 0.0), np.nan)
+        base_count = np.where(first, ccount - valid, -1)
+        base_sum = pd.Series(base_sum).ffill().to_numpy()
+        base_count = np.maximum.accumulate(base_count)
+        total, count = csum - base_sum, ccount - base_count
+        if agg == "sum":
+            return np.where(count > 0, total, np.nan)
+        if agg == "count":
+            return count.astype("float64")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return total / count
+
+    fill = -np.inf if agg == "max" else np.inf
+    grouped = pd.Series(np.where(valid, x, fill)).groupby(codes)
+    out = (grouped.cummax() if agg == "max" else grouped.cummin()).to_numpy()
+    return np.where(np.isinf(out) & (out == fill), np.nan, out)
+
+
+def temporal_features(
+    df,
+    group_cols,
+    time_col,
+    cols,
+    lags=(1, 7, 28),
+    leads=(),
+    diffs=(),
+    expanding=("mean",),
+    dtype="float32",
+    guidance="off",
+):
+    """
+    Lag, lead, difference and expanding-window features per entity.
+
+    - group_cols: entity columns (e.g. ["store", "item"])
+    - time_col: column that orders rows within an entity
+    - cols: numeric columns to build features from
+    - lags / leads: periods k → '<col>_lag_<k>' / '<col>_lead_<k>'
+    - diffs: periods k → '<col>_diff_<k>' = value - lag k
+    - expanding: 'mean'|'sum'|'count'|'min'|'max' → '<col>_expanding_<agg>'
+      (includes the current row, like pandas expanding)
+    - dtype: output dtype, float32 by default to halve feature memory
+
+    Rows are sorted once by group codes + time_col; every feature is an
+    array shift or cumulative sum on that order. Features are returned in
+    the original row order, appended in one concat that builds a new
+    frame, so df itself is never copied or modified.
+    """
+    cols = [cols] if isinstance(cols, str) else list(cols)
+    for agg in expanding:
+        if agg not in EXPANDING_AGGS:
+            raise ValueError(f"Unknown expanding agg '{agg}'. Use one of {EXPANDING_AGGS}.")
+
+    _print(guidance, f"⏱️ TEMPORAL FEATURES STARTED • columns={cols} lags={list(lags)} leads={list(leads)} "
+                     f"diffs={list(diffs)} expanding={list(expanding)}")
+
+    codes, order = _group_order(df, group_cols, time_col)
+    sorted_codes = codes[order]
+    n = len(df)
+    boundaries = np.r_[0, np.flatnonzero(np.diff(sorted_codes)) + 1] if n else np.array([], dtype=np.intp)
+    sizes = np.diff(np.r_[boundaries, n])
+    seg_start = np.repeat(boundaries, sizes)
+    seg_end = seg_start + np.repeat(sizes, sizes)
+    missing_key = codes < 0
+
+    features = {}
+
+    def put(name, values):
+        out = np.empty(n, dtype=dtype)
+        out[order] = values
+        out[missing_key] = np.nan
+        features[name] = out
+
+    for col in cols:
+        x = df[col].to_numpy(dtype="float64", na_value=np.nan)[order]
+        for k in lags:
+            put(f"{col}_lag_{k}", _shift(x, seg_start, seg_end, k))
+        for k in leads:
+            put(f"{col}_lead_{k}", _shift(x, seg_start, seg_end, -k))
+        for k in diffs:
+            put(f"{col}_diff_{k}", x - _shift(x, seg_start, seg_end, k))
+        for agg in expanding:
+            put(f"{col}_expanding_{agg}", _expanding(x, sorted_codes, seg_start, agg))
+        _print(guidance, f" → Built features for '{col}'")
+
+    feature_df = pd.DataFrame(features, index=df.index)
+    df = pd.concat([df.drop(columns=[c for c in features if c in df.columns]), feature_df], axis=1)
+    _print(guidance, f"✨ Added {len(features)} temporal feature(s).")
+    return df
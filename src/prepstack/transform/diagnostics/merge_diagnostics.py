@@ -1,6 +1,8 @@
 import pandas as pd
 
-def analyse_merge(df1, df2, on, guidance="on"):
+from prepstack.transform.joins.key_index import KeyIndex
+
+def analyse_merge(df1, df2, on, key_index=None, guidance="on"):
     """
     Analyse what will happen BEFORE performing a merge.
 
@@ -10,45 +12,46 @@ def analyse_merge(df1, df2, on, guidance="on"):
     - missing keys on either side
     - potential merge explosion (row multiplication)
     - best recommended join
+
+    Everything is read from one KeyIndex (factorized keys + per-key counts).
+    Pass key_index to reuse one, and hand the returned "key_index" to the
+    join functions so the keys are not factorized again.
     """
 
+    index = key_index if key_index is not None else KeyIndex(df1, df2, on)
+
     if guidance == "on":
         print("🧪 MERGE DIAGNOSTICS REPORT")
         print("────────────────────────────")
 
     # Duplicate detection
-    dup1 = df1[on].duplicated().sum()
-    dup2 = df2[on].duplicated().sum()
+    dup1 = index.duplicates_left
+    dup2 = index.duplicates_right
 
     if guidance == "on":
         print(f"🔑 Key Column: '{on}'")
         print(f" • Duplicates in df1: {dup1}")
         print(f" • Duplicates in df2: {dup2}")
 
-    # Unique keys
-    unique1 = df1[on].nunique()
-    unique2 = df2[on].nunique()
-
-    # Missing keys
-    missing_in_df2 = unique1 - df1[on].isin(df2[on]).sum()
-    missing_in_df1 = unique2 - df2[on].isin(df1[on]).sum()
+    # Missing keys (distinct keys without a partner on the other side)
+    missing_in_df2 = index.unmatched_left_keys
+    missing_in_df1 = index.unmatched_right_keys
 
     if guidance == "on":
         print(f" • Keys in df1 not found in df2: {missing_in_df2}")
         print(f" • Keys in df2 not found in df1: {missing_in_df1}")
 
     # Relationship type
-    if dup1 == 0 and dup2 == 0:
-        relation = "1:1"
-    elif dup1 > 0 and dup2 == 0:
-        relation = "many-to-1"
-    elif dup1 == 0 and dup2 > 0:
-        relation = "1-to-many"
-    else:
-        relation = "many-to-many"
+    relation = index.relationship
+
+    # Output size per join type, from the per-key counts
+    estimated_rows = {how: index.estimate_rows(how) for how in ("inner", "left", "right", "outer")}
 
     if guidance == "on":
         print(f"🔍 Relationship Type: {relation}")
+        print(f"📏 Estimated rows: {estimated_rows}")
+        if estimated_rows["inner"] > max(len(df1), len(df2)):
+            print(f"⚠️ Merge explosion: matched keys alone produce {estimated_rows['inner']} rows")
 
     # Recommended merge strategy
     if relation == "1:1":
@@ -70,5 +73,7 @@ def analyse_merge(df1, df2, on, guidance="on"):
         "missing_in_df2": missing_in_df2,
         "missing_in_df1": missing_in_df1,
         "relationship": relation,
-        "recommended_join": recommendation
+        "recommended_join": recommendation,
+        "estimated_rows": estimated_rows,
+        "key_index": index
     }
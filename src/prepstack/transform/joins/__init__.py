@@ -3,3 +3,7 @@ from .right_join import right_join
 from .inner_join import inner_join
 from .outer_join import outer_join
 from .smart_merge import smart_merge
+from .key_index import KeyIndex
+from .asof_join import asof_join
+from .partitioned_join import partitioned_join
+from .lookup_join import LookupIndex, lookup_join
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+def _guide(msg, guidance):
+    if guidance == "on":
+        print(msg)
+
+def asof_join(
+    df1,
+    df2,
+    on,
+    by=None,
+    direction="backward",
+    tolerance=None,
+    allow_exact_matches=True,
+    suffixes=("_left", "_right"),
+    guidance="off"
+):
+    """
+    Time-keyed left join: every df1 row gets the nearest df2 row on `on`
+    (e.g. the last price at or before each trade).
+
+    by        : column(s) that must match exactly (e.g. the ticker)
+    direction : 'backward' | 'forward' | 'nearest'
+    tolerance : maximum distance to a match (e.g. pd.Timedelta("5min"))
+
+    Inputs already sorted on `on` are merged as they are. Unsorted inputs
+    are sorted once and the result comes back in df1's row order.
+    """
+
+    _guide("🔗 Starting ASOF JOIN...", guidance)
+
+    left_sorted = df1[on].is_monotonic_increasing
+    order = None
+    if not left_sorted:
+        _guide(f"⚠️ df1 is not sorted by '{on}' → sorting a copy.", guidance)
+        order = np.argsort(df1[on].to_numpy(), kind="stable")
+        df1 = df1.iloc[order]
+
+    if not df2[on].is_monotonic_increasing:
+        _guide(f"⚠️ df2 is not sorted by '{on}' → sorting a copy.", guidance)
+        df2 = df2.sort_values(on, kind="stable")
+
+    # row marker so unmatched rows are counted exactly
+    df2 = df2.assign(__asof_row__=np.arange(len(df2)))
+
+    merged = pd.merge_asof(
+        df1,
+        df2,
+        on=on,
+        by=by,
+        direction=direction,
+        tolerance=tolerance,
+        allow_exact_matches=allow_exact_matches,
+        suffixes=suffixes,
+    )
+
+    if order is not None:
+        # back to df1's original row order
+        merged = merged.iloc[np.argsort(order, kind="stable")].reset_index(drop=True)
+
+    unmatched = int(merged["__asof_row__"].isna().sum())
+    merged = merged.drop(columns="__asof_row__")
+    if unmatched > 0:
+        _guide(f"⚠️ {unmatched} rows from df1 found no {direction} match in df2.", guidance)
+
+    _guide("✨ ASOF JOIN complete.", guidance)
+    return merged
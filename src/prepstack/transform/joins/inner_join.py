@@ -1,29 +1,46 @@
 import pandas as pd
 
+from .key_index import KeyIndex, guard_explosion, join_frames
+
 def _guide(msg, guidance):
     if guidance == "on":
         print(msg)
 
-def inner_join(df1, df2, on, suffixes=("_left", "_right"), guidance="off"):
+def inner_join(
+    df1,
+    df2,
+    on,
+    suffixes=("_left", "_right"),
+    key_index=None,
+    presorted=None,
+    max_output_rows=None,
+    on_explosion="raise",
+    random_state=42,
+    guidance="off"
+):
+    """
+    Inner join df1 with df2 on `on`.
+    key_index / presorted / max_output_rows / on_explosion: see left_join.
+    """
 
     _guide("🔗 Starting INNER JOIN...", guidance)
 
-    before1 = len(df1)
-    before2 = len(df2)
+    index = key_index if key_index is not None else KeyIndex(df1, df2, on, presorted=presorted)
 
-    merged = df1.merge(df2, how="inner", on=on, suffixes=suffixes)
+    cap = guard_explosion(index, "inner", max_output_rows, on_explosion, lambda m: _guide(m, guidance))
 
-    after = len(merged)
+    merged = join_frames(df1, df2, on, index, "inner", cap, random_state, suffixes)
 
-    # dropped rows detection
-    dropped_df1 = before1 - merged[on].nunique()
-    dropped_df2 = before2 - merged[on].nunique()
+    # dropped rows detection (straight from the key counts)
+    if guidance == "on":
+        dropped_df1 = index.unmatched_left_rows
+        dropped_df2 = index.unmatched_right_rows
 
-    if dropped_df1 > 0:
-        _guide(f"⚠️ {dropped_df1} rows from df1 did NOT match df2.", guidance)
+        if dropped_df1 > 0:
+            _guide(f"⚠️ {dropped_df1} rows from df1 did NOT match df2.", guidance)
 
-    if dropped_df2 > 0:
-        _guide(f"⚠️ {dropped_df2} rows from df2 did NOT match df1.", guidance)
+        if dropped_df2 > 0:
+            _guide(f"⚠️ {dropped_df2} rows from df2 did NOT match df1.", guidance)
 
     _guide("✨ INNER JOIN complete.", guidance)
     return merged
@@ -0,0 +1,394 @@
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+JOIN_HOWS = ("left", "right", "inner", "outer")
+EXPLOSION_ACTIONS = ("raise", "sample")
+
+
+def _as_list(on):
+    return [on] if isinstance(on, str) else list(on)
+
+
+def _sortable(series):
+    return (
+        pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+    ) or pd.api.types.is_datetime64_dtype(series)
+
+
+def keys_sorted(left, right, on, assume_sorted=False):
+    """
+    True when a single key column is ascending (and null-free) on both sides.
+    assume_sorted only checks the key type and trusts the order.
+    """
+    on = _as_list(on)
+    if len(on) != 1:
+        return False
+    lkey, rkey = left[on[0]], right[on[0]]
+    if not (_sortable(lkey) and _sortable(rkey)):
+        return False
+    if pd.api.types.is_datetime64_dtype(lkey) != pd.api.types.is_datetime64_dtype(rkey):
+        return False
+    return assume_sorted or (lkey.is_monotonic_increasing and rkey.is_monotonic_increasing)
+
+
+def _runs(values):
+    """Start position and length of each run of equal values."""
+    changes = np.ones(len(values), dtype=bool)
+    changes[1:] = values[1:] != values[:-1]
+    starts = np.flatnonzero(changes)
+    return starts, np.diff(np.append(starts, len(values)))
+
+
+def _sorted_codes(lruns, rruns, left, right):
+    """
+    Shared key code per run of equal values, for two ascending arrays and
+    their runs, without hashing. The distinct values of both sides are
+    merged once (a stable argsort of two sorted runs is a single linear
+    merge) and numbered in key order.
+    """
+    distinct = np.concatenate([left[lruns[0]], right[rruns[0]]])
+    order = np.argsort(distinct, kind="stable")
+    merged = distinct[order]
+    new_key = np.ones(len(merged), dtype=bool)
+    new_key[1:] = merged[1:] != merged[:-1]
+    codes = np.empty(len(merged), dtype=np.int64)
+    codes[order] = np.cumsum(new_key) - 1
+    return codes[: len(lruns[0])], codes[len(lruns[0]):], max(int(new_key.sum()), 1)
+
+
+class KeyIndex:
+    """
+    The join keys of two frames, factorized once into a shared code space.
+
+    left_codes / right_codes : key code per row (missing keys are a key of
+                               their own, as in DataFrame.merge)
+    left_counts / right_counts : rows per key code on each side
+
+    Build it once and pass it as key_index= to analyse_merge and the join
+    functions: duplicate checks, unmatched keys, output size estimates and
+    the join row indexers all come from these arrays, so the keys are not
+    rehashed again. Multi-column keys are combined into one code. Every
+    statistic is computed on first use and cached.
+
+    presorted: None → use the sort-merge path when the key is ascending on
+    both sides (checked in O(n)), True → the caller guarantees it (not
+    checked), False → always hash. On the sort-merge path nothing is hashed
+    or re-sorted: duplicates come from runs of equal values, codes from one
+    linear merge of the distinct values, and the join itself is pandas'
+    monotonic merge-join.
+
+    Example:
+        index = KeyIndex(orders, customers, on=["country", "customer_id"])
+        report = analyse_merge(orders, customers, on=..., key_index=index)
+        merged = left_join(orders, customers, on=..., key_index=index)
+    """
+
+    def __init__(self, left, right, on, presorted=None):
+        self.on = _as_list(on)
+        self.n_left, self.n_right = len(left), len(right)
+
+        self.sorted = presorted is not False and keys_sorted(left, right, self.on, assume_sorted=bool(presorted))
+        if presorted and not self.sorted:
+            raise ValueError("presorted=True needs one numeric or datetime key column on both sides")
+
+        # references only; nothing is computed until a statistic is asked for
+        self._left_keys = [left[col] for col in self.on]
+        self._right_keys = [right[col] for col in self.on]
+
+    # -------------------------
+    # Codes and counts
+    # -------------------------
+    @cached_property
+    def _left_runs(self):
+        return _runs(self._left_keys[0].to_numpy())
+
+    @cached_property
+    def _right_runs(self):
+        return _runs(self._right_keys[0].to_numpy())
+
+    @cached_property
+    def _codes(self):
+        """(left codes, right codes, n_keys); per run on the sort-merge path."""
+        if self.sorted:
+            return _sorted_codes(
+                self._left_runs, self._right_runs,
+                self._left_keys[0].to_numpy(), self._right_keys[0].to_numpy(),
+            )
+
+        codes = np.zeros(self.n_left + self.n_right, dtype=np.int64)
+        n_keys = 1
+        for i, (lkey, rkey) in enumerate(zip(self._left_keys, self._right_keys)):
+            both = pd.concat([lkey, rkey], ignore_index=True)
+            col_codes, uniques = pd.factorize(both, use_na_sentinel=False)
+            if i == 0:
+                codes, n_keys = col_codes.astype(np.int64), len(uniques)
+            else:
+                # fold the next column in and renumber so codes stay dense
+                codes, combined = pd.factorize(codes * len(uniques) + col_codes)
+                n_keys = len(combined)
+        return codes[: self.n_left], codes[self.n_left:], max(n_keys, 1)
+
+    @property
+    def n_keys(self):
+        return self._codes[2]
+
+    @cached_property
+    def left_codes(self):
+        if self.sorted:
+            return np.repeat(self._codes[0], self._left_runs[1])
+        return self._codes[0]
+
+    @cached_property
+    def right_codes(self):
+        if self.sorted:
+            return np.repeat(self._codes[1], self._right_runs[1])
+        return self._codes[1]
+
+    @cached_property
+    def left_counts(self):
+        if self.sorted:
+            counts = np.zeros(self.n_keys, dtype=np.int64)
+            counts[self._codes[0]] = self._left_runs[1]
+            return counts
+        return np.bincount(self.left_codes, minlength=self.n_keys)
+
+    @cached_property
+    def right_counts(self):
+        if self.sorted:
+            counts = np.zeros(self.n_keys, dtype=np.int64)
+            counts[self._codes[1]] = self._right_runs[1]
+            return counts
+        return np.bincount(self.right_codes, minlength=self.n_keys)
+
+    # -------------------------
+    # Diagnostics
+    # -------------------------
+    @cached_property
+    def duplicates_left(self):
+        """Rows whose key already appeared earlier in the left frame."""
+        if self.sorted:
+            return int(self.n_left - len(self._left_runs[0]))
+        return int(self.n_left - np.count_nonzero(self.left_counts))
+
+    @cached_property
+    def duplicates_right(self):
+        if self.sorted:
+            return int(self.n_right - len(self._right_runs[0]))
+        return int(self.n_right - np.count_nonzero(self.right_counts))
+
+    @cached_property
+    def unmatched_left_keys(self):
+        """Distinct left keys with no partner on the right."""
+        return int(np.count_nonzero((self.left_counts > 0) & (self.right_counts == 0)))
+
+    @cached_property
+    def unmatched_right_keys(self):
+        return int(np.count_nonzero((self.right_counts > 0) & (self.left_counts == 0)))
+
+    @cached_property
+    def unmatched_left_rows(self):
+        return int(self.left_counts[self.right_counts == 0].sum())
+
+    @cached_property
+    def unmatched_right_rows(self):
+        return int(self.right_counts[self.left_counts == 0].sum())
+
+    def left_unmatched_mask(self):
+        """Boolean mask over left rows without a match."""
+        return self.right_counts[self.left_codes] == 0
+
+    def right_unmatched_mask(self):
+        return self.left_counts[self.right_codes] == 0
+
+    @cached_property
+    def relationship(self):
+        dup_left, dup_right = self.duplicates_left > 0, self.duplicates_right > 0
+        if not dup_left and not dup_right:
+            return "1:1"
+        if dup_left and not dup_right:
+            return "many-to-1"
+        if not dup_left and dup_right:
+            return "1-to-many"
+        return "many-to-many"
+
+    @cached_property
+    def matched_rows(self):
+        """Rows produced by the matching keys (the inner join size)."""
+        return int(np.dot(self.left_counts, self.right_counts))
+
+    def estimate_rows(self, how="inner"):
+        """Exact output row count of a join, from the per-key counts only."""
+        if how not in JOIN_HOWS:
+            raise ValueError(f"Unknown join '{how}'. Use one of {JOIN_HOWS}.")
+        matched = self.matched_rows
+        if how == "inner":
+            return matched
+        if how == "left":
+            return matched + self.unmatched_left_rows
+        if how == "right":
+            return matched + self.unmatched_right_rows
+        return matched + self.unmatched_left_rows + self.unmatched_right_rows
+
+    # -------------------------
+    # Join indexers
+    # -------------------------
+    @staticmethod
+    def _pairs(a_codes, b_codes, b_counts, keep_unmatched, positions=None, b_sorted=False):
+        """
+        (a_rows, b_rows) of a join driven by side a: a rows in order, each
+        followed by its matches on side b in b order. b_rows is -1 for
+        unmatched a rows when keep_unmatched. positions selects a subset of
+        output rows (sorted) without building the full indexers.
+        """
+        n_a = len(a_codes)
+
+        if positions is None and (len(b_counts) == 0 or b_counts.max() <= 1):
+            # b is a lookup table: one gather, no repeat
+            b_at = np.full(len(b_counts), -1, dtype=np.int64)
+            b_at[b_codes] = np.arange(len(b_codes))
+            b_rows = b_at[a_codes]
+            if keep_unmatched:
+                return np.arange(n_a), b_rows
+            a_rows = np.flatnonzero(b_rows >= 0)
+            return a_rows, b_rows[a_rows]
+
+        b_start = np.cumsum(b_counts) - b_counts
+        matches = b_counts[a_codes]
+        reps = np.maximum(matches, 1) if keep_unmatched else matches
+        ends = np.cumsum(reps)
+        # position in b_order of output row p is offset[a_row] + p
+        offset = b_start[a_codes] - (ends - reps)
+
+        if positions is None:
+            a_rows = np.repeat(np.arange(n_a), reps)
+            b_pos = np.repeat(offset, reps) + np.arange(ends[-1] if n_a else 0)
+        else:
+            a_rows = np.searchsorted(ends, positions, side="right")
+            b_pos = offset[a_rows] + positions
+
+        # sorted keys: b rows are already in code order
+        b_order = None if b_sorted else np.argsort(b_codes, kind="stable")
+        if keep_unmatched and len(matches) and matches.min() == 0:
+            # unmatched a rows have no b position; only gather the matched ones
+            found = matches[a_rows] > 0
+            b_rows = np.full(len(a_rows), -1, dtype=np.int64)
+            b_rows[found] = b_pos[found] if b_order is None else b_order[b_pos[found]]
+            return a_rows, b_rows
+        return a_rows, (b_pos if b_order is None else b_order[b_pos])
+
+    def join_indexers(self, how="inner", max_rows=None, random_state=42):
+        """
+        Row positions (left_rows, right_rows) for a left, right or inner
+        join, in DataFrame.merge order; -1 marks the missing side. With
+        max_rows, a uniform random sample of max_rows output rows is
+        returned (order kept).
+        """
+        if how not in ("left", "right", "inner"):
+            raise ValueError("join_indexers supports 'left', 'right' and 'inner'")
+
+        positions = None
+        if max_rows is not None:
+            total = self.estimate_rows(how)
+            if total > max_rows:
+                rng = np.random.default_rng(random_state)
+                positions = np.sort(rng.choice(total, size=max_rows, replace=False))
+
+        if how == "right":
+            right_rows, left_rows = self._pairs(
+                self.right_codes, self.left_codes, self.left_counts, True, positions, self.sorted
+            )
+        else:
+            left_rows, right_rows = self._pairs(
+                self.left_codes, self.right_codes, self.right_counts, how == "left", positions, self.sorted
+            )
+        return left_rows, right_rows
+
+    def __repr__(self):
+        return f"KeyIndex(on={self.on}, left_rows={self.n_left}, right_rows={self.n_right}, sorted={self.sorted})"
+
+
+def _take(frame, rows):
+    """frame rows by position with a fresh RangeIndex; -1 gives a missing row."""
+    frame = frame.reset_index(drop=True)
+    if len(rows) == len(frame) and (len(rows) == 0 or (rows[0] == 0 and (np.diff(rows) == 1).all())):
+        return frame  # every row in order: nothing to copy
+    if len(rows) and rows.min() < 0:
+        return frame.reindex(rows).reset_index(drop=True)
+    return frame.take(rows).reset_index(drop=True)
+
+
+def assemble_join(left, right, on, left_rows, right_rows, key_side="left", suffixes=("_left", "_right")):
+    """
+    Build the merged frame from join indexers, with DataFrame.merge column
+    layout: left columns, then right non-key columns, overlapping names
+    suffixed. Key values and their dtype come from key_side.
+    """
+    on = _as_list(on)
+    right_cols = [c for c in right.columns if c not in on]
+    overlap = set(left.columns).intersection(right_cols)
+
+    left_part = _take(left, left_rows)
+    right_part = _take(right[right_cols], right_rows)
+
+    if key_side == "right":
+        keys = _take(right[on], right_rows)
+        for col in on:
+            left_part[col] = keys[col]
+
+    if overlap:
+        left_part = left_part.rename(columns={c: f"{c}{suffixes[0]}" for c in overlap})
+        right_part = right_part.rename(columns={c: f"{c}{suffixes[1]}" for c in overlap})
+
+    return pd.concat([left_part, right_part], axis=1)
+
+
+def _same_key_dtypes(left, right, on):
+    return all(left[c].dtype == right[c].dtype for c in _as_list(on))
+
+
+def join_frames(df1, df2, on, index, how, max_rows=None, random_state=42, suffixes=("_left", "_right")):
+    """
+    Run a left, right or inner join through the key index.
+    Sorted keys go to DataFrame.merge, which runs a monotonic merge-join
+    when either side is unique (no hashing, no take for rows already in
+    order); everything else, and any sampled join, is assembled from the
+    index's row indexers.
+
+    Keys whose dtypes differ between the sides (int vs float, categoricals
+    with different categories, ...) also go to DataFrame.merge: it picks
+    the result key dtype from the data, which the indexers cannot
+    reproduce. Sampled joins keep the key dtype of key_side.
+    """
+    if max_rows is None and (index.sorted or not _same_key_dtypes(df1, df2, on)):
+        return df1.merge(df2, how=how, on=on, suffixes=suffixes)
+
+    left_rows, right_rows = index.join_indexers(how, max_rows=max_rows, random_state=random_state)
+    key_side = "right" if how == "right" else "left"
+    return assemble_join(df1, df2, on, left_rows, right_rows, key_side=key_side, suffixes=suffixes)
+
+
+def guard_explosion(index, how, max_output_rows, on_explosion, guide):
+    """
+    Check the estimated output size before joining.
+    Returns the row cap to apply (None when the join fits).
+    """
+    if max_output_rows is None:
+        return None
+    if on_explosion not in EXPLOSION_ACTIONS:
+        raise ValueError(f"on_explosion must be one of {EXPLOSION_ACTIONS}")
+
+    estimated = index.estimate_rows(how)
+    if estimated <= max_output_rows:
+        return None
+
+    message = (
+        f"{how.upper()} JOIN would produce {estimated} rows "
+        f"(max_output_rows={max_output_rows}, relationship={index.relationship})."
+    )
+    if on_explosion == "raise":
+        raise ValueError(f"{message} Check duplicates in the merge key.")
+
+    guide(f"⚠️ {message} Sampling {max_output_rows} output rows instead.")
+    return max_output_rows
@@ -1,35 +1,64 @@
 import pandas as pd
 
+from .key_index import KeyIndex, guard_explosion, join_frames
+
 def _guide(msg, guidance):
     if guidance == "on":
         print(msg)
 
-def left_join(df1, df2, on, suffixes=("_left", "_right"), guidance="off"):
+def left_join(
+    df1,
+    df2,
+    on,
+    suffixes=("_left", "_right"),
+    key_index=None,
+    presorted=None,
+    max_output_rows=None,
+    on_explosion="raise",
+    random_state=42,
+    guidance="off"
+):
+    """
+    Left join df1 with df2 on `on` (a column or list of columns).
+
+    key_index       : a KeyIndex(df1, df2, on) to reuse (built when None)
+    presorted       : None → sort-merge when the key is ascending on both
+                      sides, True → require it, False → always hash
+    max_output_rows : guard against row explosion, checked BEFORE joining
+                      from the per-key counts
+    on_explosion    : 'raise' → ValueError, 'sample' → keep a random
+                      sample of max_output_rows output rows
+    """
 
     _guide("🔗 Starting LEFT JOIN...", guidance)
 
+    index = key_index if key_index is not None else KeyIndex(df1, df2, on, presorted=presorted)
+
     # duplicate key detection
-    if df1[on].duplicated().any():
+    if guidance == "on" and index.duplicates_left:
         _guide(f"⚠️ df1 has duplicate keys in '{on}'. This may create row multiplication.", guidance)
 
-    if df2[on].duplicated().any():
+    if guidance == "on" and index.duplicates_right:
         _guide(f"⚠️ df2 has duplicate keys in '{on}'. LEFT join will create expanded rows.", guidance)
 
-    before = len(df1)
+    cap = guard_explosion(index, "left", max_output_rows, on_explosion, lambda m: _guide(m, guidance))
 
-    merged = df1.merge(df2, how="left", on=on, suffixes=suffixes)
+    merged = join_frames(df1, df2, on, index, "left", cap, random_state, suffixes)
 
-    after = len(merged)
+    # counts come from the key index, the merged frame is not scanned
+    if guidance == "on":
+        before = len(df1)
+        after = index.estimate_rows("left")
 
-    # missing detection (right table didn't match)
-    missing_matches = merged[on].isna().sum()
-    if missing_matches > 0:
-        _guide(f"⚠️ {missing_matches} rows could not find a match in df2.", guidance)
-        _guide("👉 Suggested next step: prepstack.cleaning.fill_missing()", guidance)
+        # missing detection (right table didn't match)
+        missing_matches = index.unmatched_left_rows
+        if missing_matches > 0:
+            _guide(f"⚠️ {missing_matches} rows could not find a match in df2.", guidance)
+            _guide("👉 Suggested next step: prepstack.cleaning.fill_missing()", guidance)
 
-    # merge explosion detection
-    if after > before:
-        _guide(f"⚠️ Row count expanded from {before} → {after}. Check duplicates in merge key.", guidance)
+        # merge explosion detection
+        if after > before:
+            _guide(f"⚠️ Row count expanded from {before} → {after}. Check duplicates in merge key.", guidance)
 
     _guide("✨ LEFT JOIN complete.", guidance)
     return merged
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+from prepstack.helpers import current_copy_policy
+
+from .key_index import _as_list
+
+
+def _guide(msg, guidance):
+    if guidance == "on":
+        print(msg)
+
+
+# integer keys spanning at most this many slots per lookup row use a dense
+# position table instead of a hash lookup
+_DENSE_SPAN = 4
+
+
+class LookupIndex:
+    """
+    A dimension table prepared once for many lookup_join calls.
+
+    - key → row position: a dense position array for compact integer keys
+      (one np.take per batch, no hashing), a pandas hash index otherwise
+    - lookup columns are kept as arrays; text columns are dictionary-encoded
+      (category) when dictionary_encode=True, so every batch only gathers
+      small integer codes
+
+    The lookup keys must be unique. LookupIndex objects can be pickled and
+    cached next to the dimension table.
+
+    Example:
+        users = LookupIndex(users_df, on="user_id", columns=["country", "plan"])
+        for batch in read_chunks("events.parquet"):
+            batch = lookup_join(batch, users)
+    """
+
+    def __init__(self, lookup, on, columns=None, dictionary_encode=True):
+        self.on = _as_list(on)
+        keys = lookup[self.on]
+        if keys.duplicated().any():
+            raise ValueError(f"lookup keys in {self.on} must be unique; use left_join for one-to-many lookups")
+
+        if columns is None:
+            columns = lookup.columns
+        self.columns = [c for c in columns if c not in self.on]
+        self.n_rows = len(lookup)
+
+        self.values = {}
+        for col in self.columns:
+            series = lookup[col]
+            if dictionary_encode and (series.dtype == object or isinstance(series.dtype, pd.StringDtype)):
+                series = series.astype("category")
+            self.values[col] = series.array
+
+        self._dense = None
+        key = keys[self.on[0]]
+        if len(self.on) == 1 and len(key) and pd.api.types.is_integer_dtype(key) and isinstance(key.dtype, np.dtype):
+            low, high = int(key.min()), int(key.max())
+            if high - low < _DENSE_SPAN * len(key) + 1024:
+                table = np.full(high - low + 1, -1, dtype=np.intp)
+                table[key.to_numpy() - low] = np.arange(len(key))
+                self._dense = (low, table)
+
+        if len(self.on) == 1:
+            self._index = pd.Index(key)
+        else:
+            self._index = pd.MultiIndex.from_frame(keys)
+
+    def positions(self, df):
+        """Row position in the lookup table for every row of df (-1 = no match)."""
+        if len(self.on) > 1:
+            return self._index.get_indexer(pd.MultiIndex.from_frame(df[self.on]))
+
+        key = df[self.on[0]]
+        if self._dense is not None and pd.api.types.is_integer_dtype(key) and isinstance(key.dtype, np.dtype):
+            low, table = self._dense
+            slot = key.to_numpy().astype(np.int64, copy=False) - low
+            inside = (slot >= 0) & (slot < len(table))
+            if inside.all():
+                return table[slot]
+            return np.where(inside, table[np.where(inside, slot, 0)], -1)
+
+        return self._index.get_indexer(key)
+
+    def take(self, positions, columns=None):
+        """{column: values} gathered at positions; -1 gives a missing value."""
+        fill = bool(len(positions)) and positions.min() < 0
+        out = {}
+        for col in columns or self.columns:
+            values = self.values[col]
+            if isinstance(values, pd.arrays.NumpyExtensionArray):
+                # plain numpy: ints become float and bools object when filling, as in merge
+                out[col] = pd.api.extensions.take(values.to_numpy(), positions, allow_fill=fill)
+            else:
+                out[col] = values.take(positions, allow_fill=fill)
+        return out
+
+    def __repr__(self):
+        kind = "dense" if self._dense is not None else "hash"
+        return f"LookupIndex(on={self.on}, rows={self.n_rows}, columns={self.columns}, keys='{kind}')"
+
+
+def lookup_join(df, lookup, on=None, columns=None, suffix="_right", dictionary_encode=True, guidance="off"):
+    """
+    Many-to-one left join that only appends lookup columns to df.
+
+    lookup : a DataFrame with unique keys, or a LookupIndex built once and
+             reused for every batch (preferred for repeated calls)
+    on     : key column(s); taken from the LookupIndex when omitted
+    columns: lookup columns to append (default: all non-key columns)
+    suffix : added to appended columns whose name already exists in df
+
+    df's rows, index and existing columns are left as they are (no copy of
+    the left columns): rows are matched through the lookup index and each
+    requested column is gathered with one take. Unmatched rows get missing
+    values. Same rows and values as left_join with a unique right side;
+    text columns come back as category when dictionary_encode=True.
+    """
+    if not isinstance(lookup, LookupIndex):
+        if on is None:
+            raise ValueError("on is required when lookup is a DataFrame")
+        lookup = LookupIndex(lookup, on, columns, dictionary_encode=dictionary_encode)
+    elif on is not None and _as_list(on) != lookup.on:
+        raise ValueError(f"LookupIndex was built on {lookup.on}, not {_as_list(on)}")
+
+    columns = [c for c in (columns or lookup.columns) if c not in lookup.on]
+    missing = [c for c in columns if c not in lookup.values]
+    if missing:
+        raise ValueError(f"Columns {missing} are not part of the LookupIndex")
+
+    _guide("🔎 Starting LOOKUP JOIN...", guidance)
+
+    positions = lookup.positions(df)
+    gathered = lookup.take(positions, columns)
+
+    # only new columns are added, so a shallow copy never exposes df to changes
+    out = df if current_copy_policy() == "inplace" else df.copy(deep=False)
+    for col, values in gathered.items():
+        name = col + suffix if col in df.columns else col
+        out[name] = values
+
+    if guidance == "on":
+        unmatched = int((positions < 0).sum())
+        if unmatched > 0:
+            _guide(f"⚠️ {unmatched} rows could not find a match in the lookup table.", guidance)
+            _guide("👉 Suggested next step: prepstack.cleaning.fill_missing()", guidance)
+        _guide(f"✨ LOOKUP JOIN complete • added {list(gathered)}", guidance)
+
+    return out
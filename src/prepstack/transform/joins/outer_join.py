@@ -1,21 +1,42 @@
 import pandas as pd
 
+from .key_index import KeyIndex, guard_explosion
+
 def _guide(msg, guidance):
     if guidance == "on":
         print(msg)
 
-def outer_join(df1, df2, on, suffixes=("_left", "_right"), guidance="off"):
+def outer_join(
+    df1,
+    df2,
+    on,
+    suffixes=("_left", "_right"),
+    key_index=None,
+    presorted=None,
+    max_output_rows=None,
+    on_explosion="raise",
+    guidance="off"
+):
+    """
+    Full outer join df1 with df2 on `on`.
+    key_index / presorted / max_output_rows: see left_join. Outer joins keep
+    every row of both sides, so a max_output_rows limit can only 'raise';
+    on_explosion is ignored when no limit is set, as in the other joins.
+    """
 
     _guide("🔗 Starting FULL OUTER JOIN...", guidance)
 
-    merged = df1.merge(df2, how="outer", on=on, suffixes=suffixes)
+    if max_output_rows is not None and on_explosion != "raise":
+        raise ValueError("outer_join only supports on_explosion='raise'")
 
-    missing_left = merged[merged[on].isna()].shape[0]
+    index = key_index if key_index is not None else KeyIndex(df1, df2, on, presorted=presorted)
+    guard_explosion(index, "outer", max_output_rows, on_explosion, lambda m: _guide(m, guidance))
 
-    missing_df1 = merged[merged.filter(like="_right").isna().any(axis=1)].shape[0]
-    missing_df2 = merged[merged.filter(like="_left").isna().any(axis=1)].shape[0]
+    merged = df1.merge(df2, how="outer", on=on, suffixes=suffixes)
 
     if guidance == "on":
+        missing_df1 = index.unmatched_left_rows
+        missing_df2 = index.unmatched_right_rows
         print(f"⚠️ {missing_df1} df1 rows had no matching df2 key.")
         print(f"⚠️ {missing_df2} df2 rows had no matching df1 key.")
         print("👉 Consider inspecting keys before modelling.")
@@ -0,0 +1,208 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from prepstack.parallel import resolve_n_jobs
+from prepstack.stream import read_chunks, ChunkWriter, _require_pyarrow
+
+from .key_index import KeyIndex, JOIN_HOWS
+from .left_join import left_join
+from .right_join import right_join
+from .inner_join import inner_join
+from .outer_join import outer_join
+
+_JOINS = {"left": left_join, "right": right_join, "inner": inner_join, "outer": outer_join}
+
+_STATS = ("duplicates_left", "duplicates_right", "unmatched_left_rows", "unmatched_right_rows")
+
+
+def _guide(msg, guidance):
+    if guidance == "on":
+        print(msg)
+
+
+def _partition_of(chunk, on, n_partitions):
+    """
+    Partition number per row from a hash of the key columns.
+    Numeric keys are hashed as float64 so 1 and 1.0 (e.g. an int column on
+    one side, a float column with gaps on the other) land together.
+    """
+    keys = pd.DataFrame({
+        col: chunk[col].astype("float64")
+        if pd.api.types.is_numeric_dtype(chunk[col]) and not pd.api.types.is_bool_dtype(chunk[col])
+        else chunk[col]
+        for col in on
+    })
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return hashes % np.uint64(n_partitions)
+
+
+def _spill(path, side, workdir, on, n_partitions, chunksize, read_kwargs):
+    """
+    Hash-partition one input into Parquet spill files, one per
+    (partition, chunk). Returns (rows read, empty template frame).
+    """
+    rows, template = 0, None
+    for i, chunk in enumerate(read_chunks(path, chunksize=chunksize, **read_kwargs)):
+        if template is None:
+            template = chunk.iloc[:0]
+        part_of = _partition_of(chunk, on, n_partitions)
+        for p in np.unique(part_of):
+            piece = chunk.loc[part_of == p]
+            piece.to_parquet(os.path.join(workdir, f"{side}-{int(p)}-{i}.parquet"), index=False)
+        rows += len(chunk)
+    if template is None:
+        raise ValueError(f"{path} has no rows or columns to join")
+    return rows, template
+
+
+def _read_partition(workdir, side, p, template):
+    prefix = f"{side}-{p}-"
+    files = sorted(
+        (f for f in os.listdir(workdir) if f.startswith(prefix)),
+        key=lambda f: int(f[len(prefix):-len(".parquet")]),  # chunk order
+    )
+    if not files:
+        return template
+    return pd.concat([pd.read_parquet(os.path.join(workdir, f)) for f in files], ignore_index=True)
+
+
+def _join_partition(workdir, p, on, how, suffixes, templates, optional):
+    """Join one partition pair and spill the result. Runs in a worker when n_jobs > 1."""
+    left = _read_partition(workdir, "left", p, templates[0])
+    right = _read_partition(workdir, "right", p, templates[1])
+
+    index = KeyIndex(left, right, on)
+    merged = _JOINS[how](left, right, on, suffixes=suffixes, key_index=index, guidance="off")
+
+    # columns that can be missing get the same dtype in every partition,
+    # so the streamed Parquet output keeps one schema
+    for col in optional:
+        if col in merged.columns:
+            if pd.api.types.is_bool_dtype(merged[col]):
+                merged[col] = merged[col].astype(object)
+            elif pd.api.types.is_integer_dtype(merged[col]):
+                merged[col] = merged[col].astype("float64")
+
+    out_path = os.path.join(workdir, f"out-{p}.parquet")
+    merged.to_parquet(out_path, index=False)
+
+    stats = {name: getattr(index, name) for name in _STATS}
+    stats["rows"] = len(merged)
+    return out_path, stats
+
+
+def _optional_columns(templates, on, how, suffixes):
+    """Output columns that are missing for unmatched rows of the given join."""
+    probe = _JOINS[how](templates[0], templates[1], on, suffixes=suffixes, guidance="off")
+    left_cols = set(templates[0].columns) - set(on)
+    right_cols = set(templates[1].columns) - set(on)
+    overlap = left_cols & right_cols
+
+    def out_names(cols, suffix):
+        return {f"{c}{suffix}" if c in overlap else c for c in cols}
+
+    optional = set()
+    if how in ("left", "outer"):
+        optional |= out_names(right_cols, suffixes[1])
+    if how in ("right", "outer"):
+        optional |= out_names(left_cols, suffixes[0])
+    return [c for c in probe.columns if c in optional]
+
+
+def partitioned_join(
+    left_path,
+    right_path,
+    on,
+    how="inner",
+    n_partitions=16,
+    output_path=None,
+    *,
+    chunksize=100_000,
+    suffixes=("_left", "_right"),
+    n_jobs=1,
+    spill_dir=None,
+    guidance="on",
+    **read_kwargs,
+):
+    """
+    Join two CSV/Parquet files that do not fit in memory.
+
+    1. Both inputs are read chunk by chunk and hash-partitioned on `on`
+       into Parquet spill files (equal keys always share a partition).
+    2. Each partition pair is joined with the in-memory join for `how`
+       (left_join / right_join / inner_join / outer_join), on n_jobs
+       worker processes when n_jobs > 1.
+    3. The partition results are streamed to output_path (CSV or Parquet).
+
+    Memory is bounded by chunksize and by the size of one partition pair,
+    so raise n_partitions for bigger inputs. Output rows come partition by
+    partition, not in input order. Parquet spill files need pyarrow.
+
+    Returns a report with rows read and written and the duplicate /
+    unmatched key counts, summed over partitions; guidance prints the same
+    warnings as the in-memory joins.
+    """
+    if how not in JOIN_HOWS:
+        raise ValueError(f"Unknown join '{how}'. Use one of {JOIN_HOWS}.")
+    if output_path is None:
+        raise ValueError("output_path is required: the joined rows are streamed to disk")
+    _require_pyarrow()
+    key_label = on
+    on = [on] if isinstance(on, str) else list(on)
+
+    _guide(f"🔗 PARTITIONED {how.upper()} JOIN STARTED • {left_path} ⋈ {right_path} ({n_partitions} partitions)", guidance)
+
+    workdir = tempfile.mkdtemp(prefix="prepstack-join-", dir=spill_dir)
+    try:
+        rows_left, left_template = _spill(left_path, "left", workdir, on, n_partitions, chunksize, read_kwargs)
+        rows_right, right_template = _spill(right_path, "right", workdir, on, n_partitions, chunksize, read_kwargs)
+        templates = (left_template, right_template)
+        _guide(f"💾 Spilled {rows_left} df1 row(s) and {rows_right} df2 row(s)", guidance)
+
+        optional = _optional_columns(templates, on, how, suffixes)
+        args = [(workdir, p, on, how, suffixes, templates, optional) for p in range(n_partitions)]
+
+        n_jobs = min(resolve_n_jobs(n_jobs), n_partitions)
+        if n_jobs == 1:
+            results = [_join_partition(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                results = list(pool.map(_join_partition, *zip(*args)))
+
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+        totals = dict.fromkeys(_STATS, 0)
+        with ChunkWriter(output_path) as writer:
+            for out_path, stats in results:
+                for name in _STATS:
+                    totals[name] += stats[name]
+                if stats["rows"]:
+                    writer.write(pd.read_parquet(out_path))
+                os.remove(out_path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    # same warnings as the in-memory joins, from the summed key counts
+    if totals["duplicates_left"]:
+        _guide(f"⚠️ df1 has duplicate keys in '{key_label}'. This may create row multiplication.", guidance)
+    if totals["duplicates_right"]:
+        _guide(f"⚠️ df2 has duplicate keys in '{key_label}'. Matching rows will be expanded.", guidance)
+    if totals["unmatched_left_rows"] and how in ("left", "inner", "outer"):
+        _guide(f"⚠️ {totals['unmatched_left_rows']} rows from df1 had no match in df2.", guidance)
+    if totals["unmatched_right_rows"] and how in ("right", "inner", "outer"):
+        _guide(f"⚠️ {totals['unmatched_right_rows']} rows from df2 had no match in df1.", guidance)
+
+    _guide(f"✨ PARTITIONED {how.upper()} JOIN complete • wrote {writer.rows} row(s)", guidance)
+
+    return {
+        "rows_left": rows_left,
+        "rows_right": rows_right,
+        "rows_written": writer.rows,
+        **totals,
+    }
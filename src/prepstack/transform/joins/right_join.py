@@ -1,31 +1,52 @@
 import pandas as pd
 
+from .key_index import KeyIndex, guard_explosion, join_frames
+
 def _guide(msg, guidance):
     if guidance == "on":
         print(msg)
 
-def right_join(df1, df2, on, suffixes=("_left", "_right"), guidance="off"):
+def right_join(
+    df1,
+    df2,
+    on,
+    suffixes=("_left", "_right"),
+    key_index=None,
+    presorted=None,
+    max_output_rows=None,
+    on_explosion="raise",
+    random_state=42,
+    guidance="off"
+):
+    """
+    Right join df1 with df2 on `on`.
+    key_index / presorted / max_output_rows / on_explosion: see left_join.
+    """
 
     _guide("🔗 Starting RIGHT JOIN...", guidance)
 
-    if df1[on].duplicated().any():
+    index = key_index if key_index is not None else KeyIndex(df1, df2, on, presorted=presorted)
+
+    if guidance == "on" and index.duplicates_left:
         _guide(f"⚠️ df1 has duplicate keys → row expansion possible.", guidance)
 
-    if df2[on].duplicated().any():
+    if guidance == "on" and index.duplicates_right:
         _guide(f"⚠️ df2 has duplicate keys → row expansion likely.", guidance)
 
-    before = len(df2)
+    cap = guard_explosion(index, "right", max_output_rows, on_explosion, lambda m: _guide(m, guidance))
 
-    merged = df1.merge(df2, how="right", on=on, suffixes=suffixes)
+    merged = join_frames(df1, df2, on, index, "right", cap, random_state, suffixes)
 
-    after = len(merged)
+    if guidance == "on":
+        before = len(df2)
+        after = index.estimate_rows("right")
 
-    missing_matches = merged[on].isna().sum()
-    if missing_matches > 0:
-        _guide(f"⚠️ {missing_matches} rows from df2 had no match in df1.", guidance)
+        missing_matches = index.unmatched_right_rows
+        if missing_matches > 0:
+            _guide(f"⚠️ {missing_matches} rows from df2 had no match in df1.", guidance)
 
-    if after > before:
-        _guide(f"⚠️ Row expansion detected: {before} → {after}", guidance)
+        if after > before:
+            _guide(f"⚠️ Row expansion detected: {before} → {after}", guidance)
 
     _guide("✨ RIGHT JOIN complete.", guidance)
     return merged
@@ -1,10 +1,25 @@
 import pandas as pd
 
+from .key_index import KeyIndex
+from .left_join import left_join
+from .right_join import right_join
+from .inner_join import inner_join
+from .outer_join import outer_join
+
 def _guide(msg, guidance):
     if guidance == "on":
         print(msg)
 
-def smart_merge(df1, df2, on, guidance="off"):
+def smart_merge(
+    df1,
+    df2,
+    on,
+    key_index=None,
+    presorted=None,
+    max_output_rows=None,
+    on_explosion="raise",
+    guidance="off"
+):
     """
     Automatically decides the best join type.
 
@@ -12,24 +27,40 @@ def smart_merge(df1, df2, on, guidance="off"):
     - If both sides have duplicates → outer join
     - If df2 is lookup table → left join
     - If both sides unique → inner join
+
+    The key index used for the decision is reused by the join itself.
+    presorted / max_output_rows / on_explosion: see left_join. When the
+    outer join is chosen and max_output_rows is set, on_explosion must be
+    'raise'.
     """
 
-    dup1 = df1[on].duplicated().any()
-    dup2 = df2[on].duplicated().any()
+    index = key_index if key_index is not None else KeyIndex(df1, df2, on, presorted=presorted)
+    dup1 = index.duplicates_left > 0
+    dup2 = index.duplicates_right > 0
 
     _guide("🧠 SMART MERGE STARTED", guidance)
 
+    if index.sorted:
+        _guide("⚡ Keys already sorted → sort-merge, no hashing.", guidance)
+
+    options = dict(
+        suffixes=("_x", "_y"),
+        key_index=index,
+        max_output_rows=max_output_rows,
+        on_explosion=on_explosion,
+    )
+
     if not dup1 and not dup2:
         _guide("✨ Both keys unique → INNER JOIN chosen.", guidance)
-        return df1.merge(df2, how="inner", on=on)
+        return inner_join(df1, df2, on, **options)
 
     if dup1 and not dup2:
         _guide("✨ df1 has duplicates, df2 is lookup → LEFT JOIN chosen.", guidance)
-        return df1.merge(df2, how="left", on=on)
+        return left_join(df1, df2, on, **options)
 
     if not dup1 and dup2:
         _guide("✨ df2 has duplicates, df1 is lookup → RIGHT JOIN chosen.", guidance)
-        return df1.merge(df2, how="right", on=on)
+        return right_join(df1, df2, on, **options)
 
     _guide("⚠️ Both sides have duplicates → FULL OUTER JOIN chosen.", guidance)
-    return df1.merge(df2, how="outer", on=on)
+    return outer_join(df1, df2, on, **options)
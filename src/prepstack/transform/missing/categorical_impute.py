@@ -1,15 +1,37 @@
 import pandas as pd
 
-def categorical_impute(df, columns=None, method="mode", fill_value=None, guidance="off"):
+from prepstack.helpers import working_copy, is_categorical, category_mode, fill_categorical
+from prepstack.parallel import map_columns
+
+
+def _impute_value(series, method, fill_value=None):
+    if method == "mode":
+        if is_categorical(series):
+            # bincount over the codes instead of hashing every row
+            mode = category_mode(series)
+            if mode is not None:
+                return mode
+        return series.mode()[0]
+    elif method == "constant":
+        if fill_value is None:
+            raise ValueError("fill_value must be provided for constant strategy")
+        return fill_value
+    raise ValueError(f"Unknown method: {method}")
+
+
+def categorical_impute(df, columns=None, method="mode", fill_value=None, n_jobs=1, backend="threads", guidance="off"):
     """
     Impute missing values in CATEGORICAL columns.
 
     method options:
     - "mode"
     - "constant"
+
+    n_jobs / backend: compute the fill values on several workers,
+    "threads" or "processes" (see prepstack.parallel.map_columns)
     """
 
-    df = df.copy()
+    df = working_copy(df)
 
     if columns is None:
         columns = df.select_dtypes(exclude=["number"]).columns.tolist()
@@ -19,20 +41,18 @@ def categorical_impute(df, columns=None, method="mode", fill_value=None, guidanc
         print(f" • Columns: {columns}")
         print(f" • Strategy: {method}")
 
+    values = map_columns(
+        _impute_value, df, columns, n_jobs=n_jobs, backend=backend,
+        method=method, fill_value=fill_value,
+    )
+
     for col in columns:
-        if method == "mode":
-            v = df[col].mode()[0]
-        elif method == "constant":
-            if fill_value is None:
-                raise ValueError("fill_value must be provided for constant strategy")
-            v = fill_value
-        else:
-            raise ValueError(f"Unknown method: {method}")
+        v = values[col]
 
         if guidance == "on":
             print(f" → Filling NaN in '{col}' with '{v}'")
 
-        df[col] = df[col].fillna(v)
+        df[col] = fill_categorical(df[col], v) if is_categorical(df[col]) else df[col].fillna(v)
 
     if guidance == "on":
         print("✨ Categorical imputation complete.")
@@ -1,11 +1,19 @@
 import pandas as pd
 
-def mixed_impute(df, numeric_method="median", cat_method="mode", guidance="off"):
+from prepstack.helpers import working_copy, is_categorical, fill_categorical
+from prepstack.parallel import map_columns
+from .numeric_impute import _impute_value as _numeric_value
+from .categorical_impute import _impute_value as _categorical_value
+
+def mixed_impute(df, numeric_method="median", cat_method="mode", n_jobs=1, backend="threads", guidance="off"):
     """
     Automatically imputes numeric and categorical columns using separate rules.
+
+    n_jobs / backend: compute the fill values on several workers,
+    "threads" or "processes" (see prepstack.parallel.map_columns)
     """
 
-    df = df.copy()
+    df = working_copy(df)
 
     numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
     categorical_cols = df.select_dtypes(exclude=["number"]).columns.tolist()
@@ -16,31 +24,25 @@ def mixed_impute(df, numeric_method="median", cat_method="mode", guidance="off")
         print(f" • Categorical columns: {categorical_cols}")
         print(f" • Strategies: numeric={numeric_method}, categorical={cat_method}")
 
+    if numeric_cols and numeric_method not in ("mean", "median", "min", "max"):
+        raise ValueError("Invalid numeric method")
+    if categorical_cols and cat_method != "mode":
+        raise ValueError("Invalid categorical method")
+
+    num_values = map_columns(_numeric_value, df, numeric_cols, n_jobs=n_jobs, backend=backend, method=numeric_method)
+    cat_values = map_columns(_categorical_value, df, categorical_cols, n_jobs=n_jobs, backend=backend, method=cat_method)
+
     # Numeric
     for col in numeric_cols:
-        if numeric_method == "mean":
-            v = df[col].mean()
-        elif numeric_method == "median":
-            v = df[col].median()
-        elif numeric_method == "min":
-            v = df[col].min()
-        elif numeric_method == "max":
-            v = df[col].max()
-        else:
-            raise ValueError("Invalid numeric method")
-
+        v = num_values[col]
         df[col] = df[col].fillna(v)
         if guidance == "on":
             print(f" → {col}: filled with {v}")
 
     # Categorical
     for col in categorical_cols:
-        if cat_method == "mode":
-            v = df[col].mode()[0]
-        else:
-            raise ValueError("Invalid categorical method")
-
-        df[col] = df[col].fillna(v)
+        v = cat_values[col]
+        df[col] = fill_categorical(df[col], v) if is_categorical(df[col]) else df[col].fillna(v)
         if guidance == "on":
             print(f" → {col}: filled with '{v}'")
 
@@ -1,6 +1,26 @@
 import pandas as pd
 
-def numeric_impute(df, columns=None, method="mean", fill_value=None, guidance="off"):
+from prepstack.helpers import working_copy
+from prepstack.parallel import map_columns
+
+
+def _impute_value(series, method, fill_value=None):
+    if method == "mean":
+        return series.mean()
+    elif method == "median":
+        return series.median()
+    elif method == "min":
+        return series.min()
+    elif method == "max":
+        return series.max()
+    elif method == "constant":
+        if fill_value is None:
+            raise ValueError("fill_value must be provided for constant strategy")
+        return fill_value
+    raise ValueError(f"Unknown method: {method}")
+
+
+def numeric_impute(df, columns=None, method="mean", fill_value=None, n_jobs=1, backend="threads", guidance="off"):
     """
     Impute missing values in NUMERIC columns.
 
@@ -10,9 +30,12 @@ def numeric_impute(df, columns=None, method="mean", fill_value=None, guidance="o
     - "min"
     - "max"
     - "constant"
+
+    n_jobs / backend: compute the fill values on several workers,
+    "threads" or "processes" (see prepstack.parallel.map_columns)
     """
 
-    df = df.copy()
+    df = working_copy(df)
 
     if columns is None:
         columns = df.select_dtypes(include=["number"]).columns.tolist()
@@ -22,21 +45,13 @@ def numeric_impute(df, columns=None, method="mean", fill_value=None, guidance="o
         print(f" • Columns: {columns}")
         print(f" • Strategy: {method}")
 
+    values = map_columns(
+        _impute_value, df, columns, n_jobs=n_jobs, backend=backend,
+        method=method, fill_value=fill_value,
+    )
+
     for col in columns:
-        if method == "mean":
-            v = df[col].mean()
-        elif method == "median":
-            v = df[col].median()
-        elif method == "min":
-            v = df[col].min()
-        elif method == "max":
-            v = df[col].max()
-        elif method == "constant":
-            if fill_value is None:
-                raise ValueError("fill_value must be provided for constant strategy")
-            v = fill_value
-        else:
-            raise ValueError(f"Unknown method: {method}")
+        v = values[col]
 
         if guidance == "on":
             print(f" → Filling NaN in '{col}' with {v}")
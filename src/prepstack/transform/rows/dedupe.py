@@ -1,8 +1,10 @@
-def drop_duplicates(df, subset=None, keep="first", guidance="on"):
-    df = df.copy()
+from prepstack.cleaning.duplicates import duplicate_mask
+
+
+def drop_duplicates(df, subset=None, keep="first", engine="pandas", guidance="on"):
     before = len(df)
 
-    df = df.drop_duplicates(subset=subset, keep=keep)
+    df = df.loc[~duplicate_mask(df, subset, keep, engine=engine)]
     after = len(df)
 
     if guidance == "on":
@@ -1,7 +1,9 @@
 import pandas as pd
 
+from prepstack.helpers import working_copy
+
 def reset_index_smart(df, guidance="on"):
-    df = df.copy()
+    df = working_copy(df)
 
     # Check if index is already clean
     if df.index.is_monotonic_increasing and df.index.equals(pd.RangeIndex(len(df))):
@@ -1,10 +1,16 @@
 import pandas as pd
 
-def iqr_outliers(df, column, guidance="on"):
-    df = df.copy()
+from prepstack.helpers import working_copy
+from prepstack.sketch import series_quantiles
 
-    Q1 = df[column].quantile(0.25)
-    Q3 = df[column].quantile(0.75)
+def iqr_outliers(df, column, quantile_method="exact", guidance="on"):
+    """
+    Flag IQR outliers in `column` with a boolean 'is_outlier' column.
+    quantile_method: 'exact' or 'sketch' (KLL quantile sketch)
+    """
+    df = working_copy(df)
+
+    Q1, Q3 = series_quantiles(df[column], [0.25, 0.75], quantile_method)
     IQR = Q3 - Q1
 
     lower = Q1 - 1.5 * IQR
@@ -13,7 +13,6 @@ def validate_schema(df, schema, guidance="off"):
     schema: dict {col_name: dtype_str e.g. 'int64' or 'object'}
     returns True/False and prints issues if guidance on
     """
-    df = df.copy()
     errors = []
     for c, expected in schema.items():
         if c not in df.columns:
@@ -30,6 +29,51 @@ def validate_schema(df, schema, guidance="off"):
     _print(guidance, "✅ Schema validation passed.")
     return True
 
+# -------------------------
+# Vectorized rule masks (shared by the single checks and CompiledChecks)
+# -------------------------
+def _as_bool(mask):
+    """Plain numpy bool array; missing comparison results count as False."""
+    if isinstance(mask, pd.Series):
+        return mask.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(mask, dtype=bool)
+
+
+def _range_mask(series, min_value=None, max_value=None):
+    # plain numeric columns compare on the numpy array, the rest through pandas
+    values = series.to_numpy() if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iuf" else series
+    mask = np.zeros(len(series), dtype=bool)
+    if min_value is not None:
+        mask |= _as_bool(values < min_value)
+    if max_value is not None:
+        mask |= _as_bool(values > max_value)
+    return mask
+
+
+def _allowed_mask(series, allowed_values):
+    return ~_as_bool(series.isin(allowed_values))
+
+
+def _type_ok(series, expected):
+    """
+    True when every non-missing value matches expected (a dtype string or a
+    Python type). Typed columns box to one Python type, so only object
+    columns are scanned value by value, and only for their distinct types.
+    """
+    present = series.notna().to_numpy()
+    if not present.any():
+        return True
+    if isinstance(expected, str):
+        return str(series.dtype) == expected
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.categories[np.unique(series.cat.codes[present])].tolist()
+    elif series.dtype == object:
+        values = series.to_numpy()[present]
+    else:
+        values = series.iloc[[int(np.argmax(present))]].tolist()
+    return all(issubclass(t, expected) for t in set(map(type, values)))
+
+
 # -------------------------
 # Range check
 # -------------------------
@@ -37,13 +81,7 @@ def range_check(df, col, min_value=None, max_value=None, guidance="off"):
     """
     Return rows violating range and print summary.
     """
-    df = df.copy()
-    cond = pd.Series([False]*len(df))
-    if min_value is not None:
-        cond = cond | (df[col] < min_value)
-    if max_value is not None:
-        cond = cond | (df[col] > max_value)
-    violations = df[cond]
+    violations = df[_range_mask(df[col], min_value, max_value)]
     _print(guidance, f"⚠️ Range check on '{col}': found {len(violations)} violating rows.")
     return violations
 
@@ -51,9 +89,7 @@ def range_check(df, col, min_value=None, max_value=None, guidance="off"):
 # Allowed values check (categorical)
 # -------------------------
 def allowed_values_check(df, col, allowed_values, guidance="off"):
-    df = df.copy()
-    mask = ~df[col].isin(allowed_values)
-    violations = df[mask]
+    violations = df[_allowed_mask(df[col], allowed_values)]
     _print(guidance, f"⚠️ Allowed-values check on '{col}': {len(violations)} rows outside allowed set")
     return violations
 
@@ -73,42 +109,100 @@ def type_check(df, expected_types, guidance="off"):
                 print(f"⚠️ Missing column for type check: {c}")
             continue
         try:
-            series = df[c].dropna()
-            if series.empty:
-                ok[c] = True
-            else:
-                if isinstance(t, str):
-                    ok[c] = str(series.dtype) == t
-                else:
-                    ok[c] = series.map(lambda x: isinstance(x, t)).all()
+            ok[c] = bool(_type_ok(df[c], t))
         except Exception:
             ok[c] = False
     if guidance == "on":
         print("🔎 Type check results:", ok)
     return ok
 
+# -------------------------
+# Compiled checks (all rules, one pass, no row materialization)
+# -------------------------
+class CompiledChecks:
+    """
+    A validate_dataframe checks spec parsed once and reusable across frames
+    or batches.
+
+    run() fetches each column once, evaluates all of its range / allowed
+    rules as vectorized boolean masks and keeps per rule only the count and
+    the index labels of the first max_rows violations; the frame is never
+    copied or filtered. keep_masks=True also returns each rule mask as a
+    packed bitmap (np.packbits, 1 bit per row; np.unpackbits(...)[:len(df)]
+    gives the mask back).
+    """
+
+    def __init__(self, checks):
+        self.schema = checks.get("schema")
+        self.types = checks.get("types")
+        self.rules = []
+        for r in checks.get("ranges", []):
+            self.rules.append(("range", r["col"], (r.get("min"), r.get("max"))))
+        for a in checks.get("allowed", []):
+            self.rules.append(("allowed", a["col"], list(a["allowed_values"])))
+
+        # rules grouped by column, so each column is fetched once
+        self.by_column = {}
+        for i, (_, col, _) in enumerate(self.rules):
+            self.by_column.setdefault(col, []).append(i)
+
+    def run(self, df, max_rows=10, keep_masks=False, guidance="off"):
+        report = {"schema": None, "range": [], "allowed": [], "types": None}
+        if self.schema is not None:
+            report["schema"] = validate_schema(df, self.schema, guidance=guidance)
+
+        results = [None] * len(self.rules)
+        invalid = np.zeros(len(df), dtype=bool)
+        for col, rule_ids in self.by_column.items():
+            if col not in df.columns:
+                raise KeyError(f"Column '{col}' used in checks is missing from the frame")
+            series = df[col]
+            for i in rule_ids:
+                kind, _, params = self.rules[i]
+                mask = _range_mask(series, *params) if kind == "range" else _allowed_mask(series, params)
+                invalid |= mask
+                first = np.flatnonzero(mask)[:max_rows]
+                entry = {"col": col, "violations": int(mask.sum()), "rows": df.index[first].tolist()}
+                if keep_masks:
+                    entry["bitmap"] = np.packbits(mask)
+                results[i] = entry
+
+        for (kind, col, _), entry in zip(self.rules, results):
+            if kind == "range":
+                _print(guidance, f"⚠️ Range check on '{col}': found {entry['violations']} violating rows.")
+            else:
+                _print(guidance, f"⚠️ Allowed-values check on '{col}': {entry['violations']} rows outside allowed set")
+            report[kind].append(entry)
+
+        if self.types is not None:
+            report["types"] = type_check(df, self.types, guidance=guidance)
+
+        report["invalid_rows"] = int(invalid.sum())
+        _print(guidance, "✨ Validation report ready.")
+        return report
+
+    def __repr__(self):
+        return f"CompiledChecks(rules={len(self.rules)}, columns={list(self.by_column)})"
+
+
+def compile_checks(checks):
+    """Parse a checks spec once; pass the result to validate_dataframe for every batch."""
+    return CompiledChecks(checks)
+
 # -------------------------
 # Validate dataframe wrapper (runs set of checks and returns report)
 # -------------------------
-def validate_dataframe(df, checks, guidance="off"):
+def validate_dataframe(df, checks, max_rows=10, keep_masks=False, guidance="off"):
     """
-    checks: dict with keys:
+    checks: dict with keys (or a CompiledChecks from compile_checks):
       - schema: {...}
       - ranges: list of dicts {'col','min','max'}
       - allowed: list of dicts {'col','allowed_values'}
       - types: dict {...}
-    Returns a report dict.
+    Returns a report dict. Each range/allowed entry holds the violation
+    count and the index labels of the first max_rows violating rows;
+    invalid_rows counts rows failing at least one rule.
     """
-    report = {"schema": None, "range": [], "allowed": [], "types": None}
-    if "schema" in checks:
-        report["schema"] = validate_schema(df, checks["schema"], guidance=guidance)
-    for r in checks.get("ranges", []):
-        v = range_check(df, r["col"], r.get("min"), r.get("max"), guidance=guidance)
-        report["range"].append({"col": r["col"], "violations": len(v)})
-    for a in checks.get("allowed", []):
-        v = allowed_values_check(df, a["col"], a["allowed_values"], guidance=guidance)
-        report["allowed"].append({"col": a["col"], "violations": len(v)})
-    if "types" in checks:
-        report["types"] = type_check(df, checks["types"], guidance=guidance)
-    _print(guidance, "✨ Validation report ready.")
-    return report
+    if not isinstance(checks, CompiledChecks):
+        checks = CompiledChecks(checks)
+    return checks.run(df, max_rows=max_rows, keep_masks=keep_masks, guidance=guidance)
@@ -0,0 +1,52 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import prepstack.config
+from prepstack.cleaning.missing import fill_missing_numeric
+from prepstack.cleaning.outliers import cap_outliers_iqr
+from prepstack.helpers import copy_policy_scope
+from prepstack.transform.columns.scaling import scale_numeric
+
+
+def _wide_frame(rows=200_000, n_cols=20, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({f"c{i}": rng.normal(size=rows) for i in range(n_cols)})
+    df.loc[df.sample(frac=0.01, random_state=seed).index, "c0"] = np.nan
+    return df
+
+
+def _chain(df):
+    df = fill_missing_numeric(df, columns=["c0"], guidance="off")
+    df = cap_outliers_iqr(df, columns=["c1"], guidance="off")
+    df = scale_numeric(df, cols=["c2"], guidance="off")
+    return fill_missing_numeric(df, columns=["c2_scaled"], guidance="off")
+
+
+def _peak_over_input(policy):
+    """Peak memory while the chain runs, input included, as a multiple of the input size."""
+    df = _wide_frame()
+    input_bytes = df.memory_usage(index=False).sum()
+    tracemalloc.start()
+    try:
+        with copy_policy_scope(policy):
+            _chain(df)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (input_bytes + peak) / input_bytes
+
+
+# tracemalloc stands in for RSS: it counts the numpy buffers of every step
+# but not allocator overhead, so the bound is on allocated bytes
+@pytest.mark.parametrize("policy", ["cow", "inplace"])
+def test_chain_peak_stays_near_input_size(policy, monkeypatch):
+    monkeypatch.setattr(prepstack.config, "pandas_copy_on_write", True)  # pandas 2.x
+    assert _peak_over_input(policy) <= 1.5
+
+
+def test_copy_policy_duplicates_the_frame():
+    # reference point: full copies at every step need several times the input
+    assert _peak_over_input("copy") > 2.0
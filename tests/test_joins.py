@@ -0,0 +1,55 @@
+import pandas as pd
+
+from prepstack.transform.joins.inner_join import inner_join
+from prepstack.transform.joins.left_join import left_join
+from prepstack.transform.joins.right_join import right_join
+
+
+def _empty_lookup():
+    return pd.DataFrame({"k": pd.Series([], dtype="int64"), "w": pd.Series([], dtype="int64")})
+
+
+def test_sampled_left_join_with_empty_right_side():
+    left = pd.DataFrame({"k": [3, 1, 2, 1, 3, 2, 1], "v": range(7)})
+    out = left_join(left, _empty_lookup(), "k", max_output_rows=5, on_explosion="sample")
+    assert len(out) == 5
+    assert out["w"].isna().all()
+    assert out["v"].isin(left["v"]).all()
+
+
+def test_sampled_right_join_with_empty_left_side():
+    right = pd.DataFrame({"k": [3, 1, 2, 1, 3, 2, 1], "v": range(7)})
+    out = right_join(_empty_lookup(), right, "k", max_output_rows=5, on_explosion="sample")
+    assert len(out) == 5
+    assert out["w"].isna().all()
+    assert out["v"].is_monotonic_increasing
+
+
+# -------------------------
+# Same frame as DataFrame.merge when key dtypes differ
+# -------------------------
+def _assert_same_as_merge(join, how, left, right, on):
+    for presorted in (None, False):
+        out = join(left, right, on, presorted=presorted, suffixes=("_x", "_y"))
+        pd.testing.assert_frame_equal(out, left.merge(right, how=how, on=on, suffixes=("_x", "_y")))
+
+
+def test_mixed_int_float_keys_match_merge():
+    left = pd.DataFrame({"k": [1.0, 2.0, 2.0, 4.0], "v": range(4)})
+    right = pd.DataFrame({"k": [2, 1, 3], "w": range(3)})
+    for join, how in ((left_join, "left"), (right_join, "right"), (inner_join, "inner")):
+        _assert_same_as_merge(join, how, left, right, "k")
+        _assert_same_as_merge(join, how, right, left, "k")
+
+
+def test_categorical_keys_with_different_categories_match_merge():
+    left = pd.DataFrame({"k": pd.Categorical(["a", "b", "b", "d"]), "v": range(4)})
+    right = pd.DataFrame({"k": pd.Categorical(["b", "a", "c"], categories=["a", "b", "c", "z"]), "w": range(3)})
+    for join, how in ((left_join, "left"), (right_join, "right"), (inner_join, "inner")):
+        _assert_same_as_merge(join, how, left, right, "k")
+
+
+def test_multi_key_right_join_with_mixed_dtypes_matches_merge():
+    left = pd.DataFrame({"k": [1, 1, 2, 3], "j": pd.Series([0, 1, 0, 1], dtype="int32"), "v": range(4)})
+    right = pd.DataFrame({"k": [1.0, 2.0, 5.0], "j": [1, 0, 0], "w": range(3)})
+    _assert_same_as_merge(right_join, "right", left, right, ["k", "j"])
@@ -0,0 +1,19 @@
+import pandas as pd
+
+from prepstack.cleaning.missing import fill_missing_numeric
+from prepstack.pipeline import Pipeline
+from prepstack.transform.columns.encoding import frequency_encode
+
+
+def test_step_reading_a_generated_column_is_not_merged():
+    df = pd.DataFrame({"a": list("xxy")})
+    pipe = Pipeline().add(frequency_encode, columns=["a"]).add(frequency_encode, columns=["a_freq"])
+    assert len(pipe.plan()) == 2
+
+    expected = frequency_encode(frequency_encode(df, columns=["a"]), columns=["a_freq"])
+    pd.testing.assert_frame_equal(pipe.run(df), expected)
+
+
+def test_disjoint_per_column_steps_are_merged():
+    pipe = Pipeline().add(fill_missing_numeric, columns=["b"]).add(fill_missing_numeric, columns=["c"])
+    assert [step["kwargs"]["columns"] for step in pipe.plan()] == [["b", "c"]]